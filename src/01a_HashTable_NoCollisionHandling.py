@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable, Iterator
 
 # IMPORTANT: Does not handle hash collisions
 
@@ -8,15 +8,23 @@ from typing import Any
 # to demonstrate a basic hashing algorithm. In a real-world hash table (like Python's dict),
 # keys can be any hashable type (using Python's built-in hash() function),
 # and robust collision resolution is critical.
+# A different hash function can be plugged in via hash_func (see 01d_HashFunctions.py);
+# passing Python's built-in hash is the fast path and also lifts the string-key restriction.
 
 
 class HashTable:
-    def __init__(self) -> None:
+    def __init__(self, hash_func: Callable[[str], int] | None = None) -> None:
         self.MAX = 100
+        # None selects the additive hash below
+        self.hash_func = hash_func
         self.arr = [None for _ in range(self.MAX)]
+        # Number of occupied slots (a colliding key overwrites, so it is not counted twice)
+        self.length = 0
 
     def get_hash(self, key: str) -> int:
         """Compute hash index for a given key. O(k) time, O(1) space."""
+        if self.hash_func is not None:
+            return self.hash_func(key) % self.MAX
         h = 0
         for char in key:
             h += ord(char)
@@ -37,6 +45,8 @@ class HashTable:
     def __setitem__(self, key: str, val: Any) -> None:
         """Insert or update a key-value pair. O(k) time, O(1) space."""
         h = self.get_hash(key)
+        if self.arr[h] is None:
+            self.length += 1
         self.arr[h] = val
 
     # To be able to use my_array[key] instead of my_array.get(key),
@@ -63,6 +73,19 @@ class HashTable:
         if self.arr[h] is None:
             raise KeyError(key)
         self.arr[h] = None
+        self.length -= 1
+
+    # Only values are stored, so keys(), items() and "key in table" cannot be supported
+    # (a lookup cannot tell whether the value in a slot belongs to the key or a colliding one)
+    def __len__(self) -> int:
+        """Return the number of occupied slots. O(1) time, O(1) space."""
+        return self.length
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all stored values. O(n) time, O(1) space."""
+        for val in self.arr:
+            if val is not None:
+                yield val
 
 
 if __name__ == "__main__":
@@ -114,4 +137,32 @@ if __name__ == "__main__":
     ht["ba"] = "second"  # This overwrites "ab" due to collision!
     assert ht["ab"] == "second", "Collision: 'ab' was overwritten by 'ba'"
 
+    # Test pluggable hash function: a position-dependent hash tells anagrams apart
+    def polynomial_hash(key: str) -> int:
+        h = 0
+        for char in key:
+            h = h * 31 + ord(char)
+        return h
+
+    poly_ht = HashTable(hash_func=polynomial_hash)
+    poly_ht["ab"] = "first"
+    poly_ht["ba"] = "second"
+    assert poly_ht["ab"] == "first", "'ab' should no longer be overwritten by 'ba'"
+    assert poly_ht["ba"] == "second", "Should retrieve 'ba'"
+
+    # Test built-in hash() fast path
+    builtin_ht = HashTable(hash_func=hash)
+    builtin_ht["apple"] = 100
+    assert builtin_ht["apple"] == 100, "Should retrieve apple with built-in hash"
+
+    # Test length and lazy values view
+    view_ht = HashTable()
+    view_ht["x"] = 1
+    view_ht["y"] = 2
+    view_ht["x"] = 3
+    assert len(view_ht) == 2, "Update should not add an entry"
+    assert sorted(view_ht.values()) == [2, 3], "values() should yield stored values"
+    del view_ht["y"]
+    assert len(view_ht) == 1, "Delete should decrement length"
+
     print("All tests passed!")
@@ -1,42 +1,219 @@
 from __future__ import annotations
 
-from typing import Any
+import io
+import math
+import pickle
+import struct
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
 # NOTE: For simplicity in this manual implementation, we assume keys are strings
 # to demonstrate a basic hashing algorithm. In a real-world hash table (like Python's dict),
 # keys can be any hashable type (using Python's built-in hash() function).
+# A different hash function can be plugged in via hash_func (see 01d_HashFunctions.py);
+# passing Python's built-in hash is the fast path and also lifts the string-key restriction.
+
+# Resizing: the bucket array doubles once the load factor (entries / buckets) exceeds
+# max_load_factor, and optionally halves once it drops below min_load_factor. This keeps
+# chains at O(1) expected length, so inserts and lookups are O(k) amortized.
+# With incremental=True, doubling and halving happen in place, a few buckets per subsequent
+# write (like Redis' progressive rehashing), so no single __setitem__ pays for the whole table.
+# This works because h % 2m is either h % m or h % m + m: growing from m to 2m buckets splits
+# old bucket i into buckets i and i + m, appending bucket i + m to the array as it goes, and
+# halving merges bucket i + m back into bucket i, popping it off the end. The bucket array is
+# therefore never allocated or copied in one go.
+
+# Snapshots: export_snapshot() streams the entries straight from the bucket array into a binary
+# file, one record at a time, so checkpointing never builds a second copy of the table in memory.
+# Format: SNAPSHOT_MAGIC, the entry count (uint64), then per entry the key length and value
+# length (uint32 each), the pickled key and the pickled value (all little-endian). Keys are
+# pickled like values, since with hash_func=hash they need not be strings.
+SNAPSHOT_MAGIC = b"HTSNAP02"
+SNAPSHOT_HEADER = struct.Struct("<8sQ")
+SNAPSHOT_RECORD = struct.Struct("<II")
+
+
+# Instrumentation: with track_stats=True the table records, per lookup, how many entries were
+# compared (the probe length), whether it was a hit or a miss, and how often it was rebuilt.
+# stats_snapshot() combines these counters with the current chain-length distribution, which
+# helps tell apart a skewed hash function (long chains despite a low load factor), a high load
+# factor and delete churn. Hits and misses are counted for every lookup; with
+# stats_sample_every=N only every N-th lookup records its probe length.
+class HashTableStats:
+    def __init__(self, sample_every: int = 1) -> None:
+        if sample_every < 1:
+            raise ValueError("sample_every must be positive")
+        self.sample_every = sample_every
+        self.lookups = 0
+        self.hits = 0
+        self.misses = 0
+        self.sampled = 0
+        # Histogram: probe length -> number of sampled lookups
+        self.probe_lengths = {}
+        self.rehashes = 0
+
+    def record_lookup(self, probes: int, hit: bool) -> None:
+        """Count a lookup and its outcome and, if sampled, record its probe length. O(1) time, O(1) space."""
+        self.lookups += 1
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.lookups % self.sample_every:
+            return
+        self.sampled += 1
+        self.probe_lengths[probes] = self.probe_lengths.get(probes, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of all counters. O(p) time, O(p) space for p distinct probe lengths."""
+        total_probes = sum(length * count for length, count in self.probe_lengths.items())
+        return {
+            "lookups": self.lookups,
+            "sampled_lookups": self.sampled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / self.lookups if self.lookups else 0.0,
+            "mean_probe_length": total_probes / self.sampled if self.sampled else 0.0,
+            "max_probe_length": max(self.probe_lengths, default=0),
+            "probe_lengths": dict(sorted(self.probe_lengths.items())),
+            "rehashes": self.rehashes,
+        }
 
 
 class HashTable:
-    def __init__(self) -> None:
-        self.MAX = 100
+    # Number of buckets split or merged per write while an incremental rehash is in progress.
+    # Must be > 1 / max_load_factor so the migration finishes before the next resize is due.
+    REHASH_STEP = 4
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        max_load_factor: float = 0.75,
+        min_load_factor: float = 0.0,
+        incremental: bool = False,
+        hash_func: Callable[[str], int] | None = None,
+        track_stats: bool = False,
+        stats_sample_every: int = 1,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        if not 0 <= min_load_factor < max_load_factor / 2:
+            # Shrinking must not immediately push the load factor back above the maximum
+            raise ValueError("min_load_factor must be in [0, max_load_factor / 2)")
+        self.MAX = capacity
+        self.min_capacity = capacity
+        self.max_load_factor = max_load_factor
+        # 0.0 disables shrinking
+        self.min_load_factor = min_load_factor
+        self.incremental = incremental
+        # None selects the additive hash below
+        self.hash_func = hash_func
+        # None disables instrumentation, so the only overhead is one attribute check per lookup
+        self.stats = HashTableStats(stats_sample_every) if track_stats else None
+        self.length = 0
         # Using lists for chains is the classic textbook approach. An alternative is to use
         # dicts for O(1) chain lookups, but that defeats the educational purpose since
         # Python's dict is itself a hash table. Lists also use less memory per bucket.
         self.arr = [[] for _ in range(self.MAX)]
+        # Incremental rehash state: while old_MAX is not 0, the table is moving from old_MAX to
+        # MAX buckets, and rehash_index is the next bucket to split (growing) or the end of the
+        # buckets not merged yet (shrinking). Buckets not migrated yet still use old_MAX.
+        self.old_MAX = 0
+        self.rehash_index = 0
 
-    def get_hash(self, key: str) -> int:
-        """Compute hash index for a given key. O(k) time, O(1) space."""
+    def get_hash(self, key: str, size: int | None = None) -> int:
+        """Compute hash index for a given key (into a table of given size). O(k) time, O(1) space."""
+        if self.hash_func is not None:
+            return self.hash_func(key) % (self.MAX if size is None else size)
         h = 0
         for char in key:
             h += ord(char)
-        return h % self.MAX
+        return h % (self.MAX if size is None else size)
+
+    def _get_bucket(self, key: str) -> list[tuple[str, Any]]:
+        """Return the chain that holds (or would hold) a key. O(k) time, O(1) space."""
+        if self.old_MAX:
+            h = self.get_hash(key, self.old_MAX)
+            # Keys of buckets not split or merged yet stay where the old size put them
+            growing = self.MAX > self.old_MAX
+            if (h >= self.rehash_index) if growing else (h < self.rehash_index):
+                return self.arr[h]
+        return self.arr[self.get_hash(key)]
+
+    def _rehash_step(self) -> None:
+        """Split or merge up to REHASH_STEP buckets. O(k) amortized time, O(1) space."""
+        for _ in range(self.REHASH_STEP):
+            growing = self.MAX > self.old_MAX
+            if self.rehash_index == (self.old_MAX if growing else self.MAX):
+                self.old_MAX = 0
+                self.rehash_index = 0
+                return
+            if growing:
+                # Keys either stay in bucket i or move to the new bucket i + old_MAX
+                stay = []
+                move = []
+                for key, val in self.arr[self.rehash_index]:
+                    (stay if self.get_hash(key) == self.rehash_index else move).append((key, val))
+                self.arr[self.rehash_index] = stay
+                self.arr.append(move)
+                self.rehash_index += 1
+            else:
+                self.rehash_index -= 1
+                self.arr[self.rehash_index - self.MAX].extend(self.arr.pop())
+
+    def _resize(self, new_size: int) -> None:
+        """Rebuild with new_size buckets. O(nk) time, O(n) space; O(1) if incremental and doubling or halving."""
+        # A pending migration is finished first, so only one resize is in progress at a time
+        while self.old_MAX:
+            self._rehash_step()
+
+        if self.stats is not None:
+            self.stats.rehashes += 1
+
+        # Only doubling and halving can be split into independent per-bucket steps; other
+        # sizes (bulk loading) are rebuilt at once
+        if self.incremental and (new_size == self.MAX * 2 or new_size * 2 == self.MAX):
+            self.old_MAX = self.MAX
+            self.MAX = new_size
+            self.rehash_index = 0 if new_size > self.old_MAX else self.old_MAX
+            return
+
+        old_arr = self.arr
+        self.MAX = new_size
+        self.arr = [[] for _ in range(self.MAX)]
+        for bucket in old_arr:
+            for key, val in bucket:
+                self.arr[self.get_hash(key)].append((key, val))
+
+    def load_factor(self) -> float:
+        """Return the number of entries per bucket. O(1) time, O(1) space."""
+        return self.length / self.MAX
 
     def __setitem__(self, key: str, val: Any) -> None:
-        """Insert or update a key-value pair. O(k) avg, O(k + n) worst time, O(1) space."""
-        h = self.get_hash(key)
-        for idx, element in enumerate(self.arr[h]):
+        """Insert or update a key-value pair, then grow if needed. O(k) amortized, O(k + n) worst time, O(1) space."""
+        if self.old_MAX:
+            self._rehash_step()
+
+        bucket = self._get_bucket(key)
+        for idx, element in enumerate(bucket):
             if element[0] == key:
-                self.arr[h][idx] = (key, val)
+                bucket[idx] = (key, val)
                 return
-        self.arr[h].append((key, val))
+        bucket.append((key, val))
+        self.length += 1
+
+        if self.length > self.max_load_factor * self.MAX:
+            self._resize(self.MAX * 2)
 
     def __getitem__(self, key: str) -> Any:
         """Retrieve value by key. O(k) avg, O(k + n) worst time, O(1) space."""
-        h = self.get_hash(key)
-        for element in self.arr[h]:
+        bucket = self._get_bucket(key)
+        for probes, element in enumerate(bucket, 1):
             if element[0] == key:
+                if self.stats is not None:
+                    self.stats.record_lookup(probes, True)
                 return element[1]
+        if self.stats is not None:
+            self.stats.record_lookup(len(bucket), False)
         raise KeyError(key)
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -47,14 +224,151 @@ class HashTable:
             return default
 
     def __delitem__(self, key: str) -> None:
-        """Delete a key-value pair. O(k) avg, O(k + n) worst time, O(1) space."""
-        h = self.get_hash(key)
-        for idx, element in enumerate(self.arr[h]):
+        """Delete a key-value pair, then shrink if enabled. O(k) amortized, O(k + n) worst time, O(1) space."""
+        if self.old_MAX:
+            self._rehash_step()
+
+        bucket = self._get_bucket(key)
+        for idx, element in enumerate(bucket):
             if element[0] == key:
-                del self.arr[h][idx]
+                del bucket[idx]
+                self.length -= 1
+                if (
+                    self.length < self.min_load_factor * self.MAX
+                    and self.MAX // 2 >= self.min_capacity
+                ):
+                    self._resize(self.MAX // 2)
                 return
         raise KeyError(key)
 
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[tuple[str, Any]],
+        size_hint: int | None = None,
+        max_load_factor: float = 0.75,
+        hash_func: Callable[[str], int] | None = None,
+    ) -> HashTable:
+        """Build a table pre-sized for size_hint (default: len(items)) entries. O(nk) avg time, O(n) space."""
+        if size_hint is None:
+            items = list(items)
+            size_hint = len(items)
+        capacity = max(1, math.ceil(size_hint / max_load_factor))
+        table = cls(capacity=capacity, max_load_factor=max_load_factor, hash_func=hash_func)
+        table.update_many(items)
+        return table
+
+    def update_many(self, pairs: Iterable[tuple[str, Any]]) -> None:
+        """Insert or update many key-value pairs with at most one resize. O(nk) avg time, O(n) space."""
+        if not isinstance(pairs, (list, tuple)):
+            pairs = list(pairs)
+
+        # Grow once for the whole batch (assuming all keys are new) instead of doubling repeatedly.
+        # Bulk loading works on a single bucket array, so a pending migration is finished first.
+        needed = self.length + len(pairs)
+        new_size = self.MAX
+        while needed > self.max_load_factor * new_size:
+            new_size *= 2
+        if new_size != self.MAX:
+            self._resize(new_size)
+        while self.old_MAX:
+            self._rehash_step()
+
+        # Hash all keys in one pass, then insert without the per-call checks of __setitem__
+        if self.hash_func is not None:
+            hash_func = self.hash_func
+            size = self.MAX
+            indices = [hash_func(key) % size for key, _ in pairs]
+        else:
+            indices = [self.get_hash(key) for key, _ in pairs]
+
+        arr = self.arr
+        added = 0
+        for (key, val), h in zip(pairs, indices):
+            bucket = arr[h]
+            for idx, element in enumerate(bucket):
+                if element[0] == key:
+                    bucket[idx] = (key, val)
+                    break
+            else:
+                bucket.append((key, val))
+                added += 1
+        self.length += added
+
+    def get_many(self, keys: Iterable[str], default: Any = None) -> list[Any]:
+        """Retrieve values for many keys, using default for missing ones. O(nk) avg time, O(n) space."""
+        return [self.get(key, default) for key in keys]
+
+    def __len__(self) -> int:
+        """Return the number of entries. O(1) time, O(1) space."""
+        return self.length
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is present. O(k) avg, O(k + n) worst time, O(1) space."""
+        for element in self._get_bucket(key):
+            if element[0] == key:
+                return True
+        return False
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Lazily yield all (key, value) pairs without copying the table. O(n) time, O(1) space."""
+        for bucket in self.arr:
+            yield from bucket
+
+    def keys(self) -> Iterator[str]:
+        """Lazily yield all keys. O(n) time, O(1) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(1) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys, like a dict. O(n) time, O(1) space."""
+        return self.keys()
+
+    def stats_snapshot(self) -> dict[str, Any]:
+        """Return the lookup counters plus the current chain-length distribution. O(n) time, O(n) space."""
+        if self.stats is None:
+            raise RuntimeError("Statistics are disabled, create the table with track_stats=True")
+        chain_lengths = {}
+        for bucket in self.arr:
+            chain_lengths[len(bucket)] = chain_lengths.get(len(bucket), 0) + 1
+        snapshot = self.stats.snapshot()
+        snapshot["load_factor"] = self.load_factor()
+        # Histogram: chain length -> number of buckets (split and unsplit ones during a migration)
+        snapshot["chain_lengths"] = dict(sorted(chain_lengths.items()))
+        return snapshot
+
+    def export_snapshot(self, file: BinaryIO) -> int:
+        """Stream all entries into a binary file, returning the entry count. O(n) time, O(k) space."""
+        file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self.length))
+        for key, val in self.items():
+            key_bytes = pickle.dumps(key)
+            val_bytes = pickle.dumps(val)
+            file.write(SNAPSHOT_RECORD.pack(len(key_bytes), len(val_bytes)))
+            file.write(key_bytes)
+            file.write(val_bytes)
+        return self.length
+
+    @classmethod
+    def load_snapshot(cls, file: BinaryIO, **kwargs: Any) -> HashTable:
+        """Rebuild a table from export_snapshot() output, pre-sized from its header. O(nk) avg time, O(n) space."""
+        magic, count = SNAPSHOT_HEADER.unpack(file.read(SNAPSHOT_HEADER.size))
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a hash table snapshot")
+
+        def records() -> Iterator[tuple[str, Any]]:
+            for _ in range(count):
+                key_len, val_len = SNAPSHOT_RECORD.unpack(file.read(SNAPSHOT_RECORD.size))
+                key = pickle.loads(file.read(key_len))
+                yield key, pickle.loads(file.read(val_len))
+
+        # kwargs (e.g. hash_func) are passed on to from_items()
+        return cls.from_items(records(), size_hint=count, **kwargs)
+
 
 if __name__ == "__main__":
     ht = HashTable()
@@ -115,4 +429,163 @@ if __name__ == "__main__":
         pass  # Expected
     assert ht["ba"] == "second", "'ba' should still exist after deleting 'ab'"
 
+    # Test automatic growth keeps the load factor bounded
+    grow_ht = HashTable(capacity=4)
+    for i in range(100):
+        grow_ht[f"key{i}"] = i
+    assert grow_ht.length == 100, "Should count 100 entries"
+    assert grow_ht.MAX == 256, "Should have doubled from 4 to 256 buckets"
+    assert grow_ht.load_factor() <= grow_ht.max_load_factor, "Load factor should stay bounded"
+    assert all(grow_ht[f"key{i}"] == i for i in range(100)), "All keys should survive resizing"
+
+    # Test shrinking once the load factor drops below min_load_factor
+    shrink_ht = HashTable(capacity=4, min_load_factor=0.25)
+    for i in range(100):
+        shrink_ht[f"key{i}"] = i
+    for i in range(95):
+        del shrink_ht[f"key{i}"]
+    assert shrink_ht.MAX < 256, "Should have shrunk after mass deletion"
+    assert shrink_ht.MAX >= shrink_ht.min_capacity, "Should not shrink below initial capacity"
+    assert all(shrink_ht[f"key{i}"] == i for i in range(95, 100)), "Remaining keys should survive shrinking"
+
+    # Test incremental rehashing spreads the migration over later writes
+    inc_ht = HashTable(capacity=8, incremental=True)
+    for i in range(7):
+        inc_ht[f"item{i}"] = i
+    assert inc_ht.old_MAX == 8 and inc_ht.MAX == 16, "Resize should leave a pending migration"
+    assert len(inc_ht.arr) < 16, "New buckets should be appended as old ones split, not allocated at once"
+    assert all(inc_ht[f"item{i}"] == i for i in range(7)), "Lookups should work mid-migration"
+    inc_ht["item0"] = "updated"
+    del inc_ht["item1"]
+    assert inc_ht["item0"] == "updated", "Updates should work mid-migration"
+    assert inc_ht.get("item1") is None, "Deletes should work mid-migration"
+    for i in range(7, 200):
+        inc_ht[f"item{i}"] = i
+    while inc_ht.old_MAX:
+        inc_ht["item0"] = "updated"
+    assert inc_ht.length == 199, "Should count 199 entries"
+    assert all(inc_ht[f"item{i}"] == i for i in range(2, 200)), "All keys should survive incremental rehashing"
+    assert len(inc_ht.arr) == inc_ht.MAX, "Every bucket should exist once the migration is done"
+
+    # Test incremental shrinking merges buckets back while they stay reachable
+    inc_shrink = HashTable(capacity=8, min_load_factor=0.2, incremental=True)
+    for i in range(200):
+        inc_shrink[f"item{i}"] = i
+    for i in range(190):
+        del inc_shrink[f"item{i}"]
+        assert all(inc_shrink[f"item{j}"] == j for j in range(i + 1, 200, 7)), "Lookups should work mid-merge"
+    while inc_shrink.old_MAX:
+        inc_shrink["item199"] = 199
+    assert inc_shrink.MAX < 256 and len(inc_shrink.arr) == inc_shrink.MAX, "Should have shrunk in place"
+    assert sorted(inc_shrink.values()) == list(range(190, 200)), "Remaining keys should survive merging"
+
+    # Test invalid configuration
+    try:
+        HashTable(capacity=0)
+        assert False, "Should raise ValueError for non-positive capacity"
+    except ValueError:
+        pass
+
+    # Test pluggable hash functions (built-in hash() fast path and a custom one)
+    for hash_func in (hash, lambda key: len(key)):
+        custom_ht = HashTable(capacity=4, hash_func=hash_func)
+        for i in range(100):
+            custom_ht[f"key{i}"] = i
+        del custom_ht["key50"]
+        assert custom_ht.get("key50") is None, "Should delete with custom hash"
+        assert all(custom_ht[f"key{i}"] == i for i in range(50)), "Should retrieve with custom hash"
+
+    # Test bulk loading with a pre-sized bucket array
+    pairs = [(f"row{i}", i) for i in range(1000)]
+    bulk_ht = HashTable.from_items(pairs, hash_func=hash)
+    assert bulk_ht.length == 1000, "Should count 1000 entries"
+    assert bulk_ht.MAX == math.ceil(1000 / 0.75), "Should be sized from the number of items"
+    assert bulk_ht.get_many(["row0", "row999", "missing"]) == [0, 999, None], "get_many should use default"
+    gen_ht = HashTable.from_items(((f"row{i}", i) for i in range(100)), size_hint=100)
+    assert gen_ht.MAX == 134 and gen_ht.length == 100, "Should accept a generator with a size hint"
+
+    # Test update_many updates existing keys and grows at most once
+    bulk_ht.update_many([("row0", "updated"), ("row1000", 1000)])
+    assert bulk_ht["row0"] == "updated", "update_many should update existing keys"
+    assert bulk_ht.length == 1001, "update_many should count only new keys"
+    small_ht = HashTable(capacity=4, incremental=True)
+    small_ht.update_many(pairs)
+    assert not small_ht.old_MAX, "Bulk load should leave no pending migration"
+    assert small_ht.MAX == 2048, "Should grow straight to the final size"
+    assert small_ht.get_many(f"row{i}" for i in range(1000)) == list(range(1000)), (
+        "All bulk-loaded keys should be retrievable"
+    )
+
+    # Test views, length and membership
+    view_ht = HashTable(capacity=8, incremental=True)
+    for i in range(13):
+        view_ht[f"key{i}"] = i
+    assert view_ht.old_MAX, "Views should also work mid-migration"
+    assert len(view_ht) == 13, "len() should count all entries"
+    assert "key5" in view_ht and "missing" not in view_ht, "Membership should check keys"
+    assert sorted(view_ht.values()) == list(range(13)), "values() should yield every value once"
+    assert sorted(view_ht) == sorted(view_ht.keys()) == sorted(f"key{i}" for i in range(13)), (
+        "Iteration should yield every key once"
+    )
+    assert dict(view_ht.items()) == {f"key{i}": i for i in range(13)}, "items() should yield all pairs"
+
+    # Test snapshot round trip
+    buffer = io.BytesIO()
+    view_ht["nested"] = {"a": [1, 2]}
+    assert view_ht.export_snapshot(buffer) == 14, "Should export 14 entries"
+    buffer.seek(0)
+    restored = HashTable.load_snapshot(buffer, hash_func=hash)
+    assert dict(restored.items()) == dict(view_ht.items()), "Snapshot should round-trip all entries"
+    assert restored.MAX == math.ceil(14 / 0.75), "Restored table should be pre-sized from the header"
+    tuple_ht = HashTable(hash_func=hash)
+    tuple_ht[(1, "a")] = "tuple key"
+    tuple_ht[42] = "int key"
+    buffer = io.BytesIO()
+    tuple_ht.export_snapshot(buffer)
+    buffer.seek(0)
+    assert dict(HashTable.load_snapshot(buffer, hash_func=hash).items()) == dict(tuple_ht.items()), (
+        "Snapshots should round-trip non-string keys"
+    )
+
+    try:
+        HashTable.load_snapshot(io.BytesIO(b"NOTASNAP" + bytes(8)))
+        assert False, "Should raise ValueError for a foreign file"
+    except ValueError:
+        pass
+
+    # Test instrumentation: chains built by a skewed hash function show up in the statistics
+    skewed = HashTable(capacity=8, hash_func=lambda key: 0, track_stats=True)
+    for i in range(5):
+        skewed[f"key{i}"] = i
+    assert skewed["key0"] == 0 and skewed["key4"] == 4, "Should retrieve from a single long chain"
+    assert skewed.get("missing") is None, "Miss should be recorded"
+    stats = skewed.stats_snapshot()
+    assert stats["lookups"] == 3, "Should count every lookup"
+    assert stats["hits"] == 2 and stats["misses"] == 1, "Should count hits and misses"
+    assert stats["probe_lengths"] == {1: 1, 5: 2}, "Hit at chain positions 1 and 5, miss scans all 5"
+    assert stats["max_probe_length"] == 5, "Longest probe should be the full chain"
+    assert stats["chain_lengths"] == {0: 7, 5: 1}, "All keys should sit in one chain"
+    assert stats["rehashes"] == 0, "No resize yet"
+    skewed["key5"] = 5
+    skewed["key6"] = 6
+    assert skewed.stats_snapshot()["rehashes"] == 1, "Resize should be counted"
+
+    # Test sampling mode records the probe length of only every N-th lookup, but counts every outcome
+    sampled = HashTable(track_stats=True, stats_sample_every=10)
+    sampled["apple"] = 1
+    for _ in range(100):
+        sampled.get("apple")
+    for _ in range(5):
+        sampled.get("missing")
+    stats = sampled.stats_snapshot()
+    assert stats["lookups"] == 105 and stats["sampled_lookups"] == 10, "Should sample 1 in 10 lookups"
+    assert sum(stats["probe_lengths"].values()) == 10, "Only sampled lookups should enter the histogram"
+    assert stats["hits"] == 100 and stats["misses"] == 5, "Hits and misses should count every lookup"
+
+    try:
+        HashTable().stats_snapshot()
+        assert False, "Should raise RuntimeError when statistics are disabled"
+    except RuntimeError:
+        pass
+
     print("All tests passed!")
@@ -1,25 +1,156 @@
 from __future__ import annotations
 
-from typing import Any
+import importlib.util
+import io
+import math
+import os
+import pickle
+import sys
+from array import array
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
 # NOTE: For simplicity in this manual implementation, we assume keys are strings
 # to demonstrate a basic hashing algorithm. In a real-world hash table (like Python's dict),
 # keys can be any hashable type (using Python's built-in hash() function).
+# A different hash function can be plugged in via hash_func (see 01d_HashFunctions.py);
+# passing Python's built-in hash is the fast path and also lifts the string-key restriction.
 
 # IMPORTANT: Linear probing with deletion has a subtle issue. When an element is deleted,
 # it leaves a None "hole" that can break retrieval of elements that were inserted after it
-# due to collision. This implementation attempts to fix this by rehashing subsequent elements
-# after deletion, but this adds complexity. An alternative approach is to use "tombstone"
-# markers instead of None for deleted slots.
-
+# due to collision. By default, this implementation fixes this by rehashing subsequent elements
+# after deletion, which costs O(cluster) reinsertions per delete. With tombstones=True, deleted
+# slots are instead marked with a TOMBSTONE: lookups probe past it and inserts may reuse it,
+# so a delete is O(1) after the search. Tombstones lengthen probe sequences, so the table is
+# compacted (rehashed without them) once they take up more than max_tombstone_ratio of the slots.
+
+# Marker for deleted slots (compared by identity)
+TOMBSTONE = object()
+
+
+def load_separate_chaining() -> Any:
+    """Load the 01b module (file names starting with digits cannot be imported). O(1) time."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "01b_HashTable_SeparateChaining.py")
+    spec = importlib.util.spec_from_file_location("hash_table_separate_chaining", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+separate_chaining = load_separate_chaining()
+
+# Snapshots use the streaming binary format of 01b (see there), so a snapshot taken from any
+# of these hash tables loads into any other one
+SNAPSHOT_MAGIC = separate_chaining.SNAPSHOT_MAGIC
+SNAPSHOT_HEADER = separate_chaining.SNAPSHOT_HEADER
+SNAPSHOT_RECORD = separate_chaining.SNAPSHOT_RECORD
+
+
+# Instrumentation: the lookup counters of 01b, where the probe length is the number of slots
+# probed, plus how many entries deletes had to reinsert. stats_snapshot() combines them with
+# the current cluster-length distribution (runs of occupied slots, tombstones included), which
+# helps tell apart a skewed hash function (long clusters despite a low load factor), a high
+# load factor and delete churn.
+class HashTableStats(separate_chaining.HashTableStats):
+    def __init__(self, sample_every: int = 1) -> None:
+        super().__init__(sample_every)
+        self.delete_reinserts = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of all counters. O(p) time, O(p) space for p distinct probe lengths."""
+        snapshot = super().snapshot()
+        snapshot["delete_reinserts"] = self.delete_reinserts
+        return snapshot
+
+
+# Lookups, views and snapshots shared by both options below. They only rely on __getitem__(),
+# items(), from_items() and length, which each option implements for its own storage.
+class HashTableBase:
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k) avg, O(k + n) worst time, O(1) space."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
-class HashTable:
-    def __init__(self) -> None:
-        self.MAX = 100
+    def get_many(self, keys: Iterable[str], default: Any = None) -> list[Any]:
+        """Retrieve values for many keys, using default for missing ones. O(nk) avg time, O(n) space."""
+        return [self.get(key, default) for key in keys]
+
+    def __len__(self) -> int:
+        """Return the number of entries. O(1) time, O(1) space."""
+        return self.length
+
+    def keys(self) -> Iterator[str]:
+        """Lazily yield all keys. O(n) time, O(1) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(1) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys, like a dict. O(n) time, O(1) space."""
+        return self.keys()
+
+    def export_snapshot(self, file: BinaryIO) -> int:
+        """Stream all entries into a binary file, returning the entry count. O(n) time, O(k) space."""
+        file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self.length))
+        for key, val in self.items():
+            key_bytes = pickle.dumps(key)
+            val_bytes = pickle.dumps(val)
+            file.write(SNAPSHOT_RECORD.pack(len(key_bytes), len(val_bytes)))
+            file.write(key_bytes)
+            file.write(val_bytes)
+        return self.length
+
+    @classmethod
+    def load_snapshot(cls, file: BinaryIO, **kwargs: Any) -> HashTableBase:
+        """Rebuild a table from export_snapshot() output, pre-sized from its header. O(nk) avg time, O(n) space."""
+        magic, count = SNAPSHOT_HEADER.unpack(file.read(SNAPSHOT_HEADER.size))
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Not a hash table snapshot")
+
+        def records() -> Iterator[tuple[str, Any]]:
+            for _ in range(count):
+                key_len, val_len = SNAPSHOT_RECORD.unpack(file.read(SNAPSHOT_RECORD.size))
+                key = pickle.loads(file.read(key_len))
+                yield key, pickle.loads(file.read(val_len))
+
+        # kwargs (e.g. hash_func, tombstones) are passed on to the subclass's from_items()
+        return cls.from_items(records(), size_hint=count, **kwargs)
+
+
+# Option 1: One (key, val) tuple per slot
+class HashTable(HashTableBase):
+    def __init__(
+        self,
+        capacity: int = 100,
+        hash_func: Callable[[str], int] | None = None,
+        tombstones: bool = False,
+        max_tombstone_ratio: float = 0.25,
+        track_stats: bool = False,
+        stats_sample_every: int = 1,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.MAX = capacity
+        # None selects the additive hash below
+        self.hash_func = hash_func
+        self.tombstones = tombstones
+        self.max_tombstone_ratio = max_tombstone_ratio
+        # None disables instrumentation, so the only overhead is one attribute check per lookup
+        self.stats = HashTableStats(stats_sample_every) if track_stats else None
         self.arr = [None for _ in range(self.MAX)]
+        self.length = 0
+        self.tombstone_count = 0
+        self.compaction_count = 0
 
     def get_hash(self, key: str) -> int:
         """Compute hash index for a given key. O(k) time, O(1) space."""
+        if self.hash_func is not None:
+            return self.hash_func(key) % self.MAX
         h = 0
         for char in key:
             h += ord(char)
@@ -28,35 +159,40 @@ class HashTable:
     def __setitem__(self, key: str, val: Any) -> None:
         """Insert or update a key-value pair. O(k) avg, O(k + n) worst time, O(1) space."""
         h = self.get_hash(key)
-        if self.arr[h] is None:
-            self.arr[h] = (key, val)
-        else:
-            new_h = self.find_slot(key, h)
-            self.arr[new_h] = (key, val)
+        new_h = self.find_slot(key, h)
+        element = self.arr[new_h]
+        if element is None:
+            self.length += 1
+        elif element is TOMBSTONE:
+            self.length += 1
+            self.tombstone_count -= 1
+        self.arr[new_h] = (key, val)
 
     def __getitem__(self, key: str) -> Any:
         """Retrieve value by key. O(k) avg, O(k + n) worst time, O(1) space."""
         h = self.get_hash(key)
         if self.arr[h] is None:
+            if self.stats is not None:
+                self.stats.record_lookup(1, False)
             raise KeyError(key)
         prob_range = self.get_prob_range(h)
 
-        for prob_index in prob_range:
+        for probes, prob_index in enumerate(prob_range, 1):
             element = self.arr[prob_index]
             if element is None:
+                if self.stats is not None:
+                    self.stats.record_lookup(probes, False)
                 raise KeyError(key)
-            if element[0] == key:
+            # Deleted slots may sit in the middle of a cluster, so keep probing past them
+            if element is not TOMBSTONE and element[0] == key:
+                if self.stats is not None:
+                    self.stats.record_lookup(probes, True)
                 return element[1]
 
+        if self.stats is not None:
+            self.stats.record_lookup(self.MAX, False)
         raise KeyError(key)
 
-    def get(self, key: str, default: Any = None) -> Any:
-        """Retrieve value by key, returning default if missing. O(k) avg, O(k + n) worst time, O(1) space."""
-        try:
-            return self[key]
-        except KeyError:
-            return default
-
     # # O(n) space and time - creates full list of MAX elements on every call
     # def get_prob_range(self, index: int) -> list[int]:
     #     """Return probe indices wrapping around the array. O(n) time and space."""
@@ -73,39 +209,358 @@ class HashTable:
             yield i
 
     def find_slot(self, key: str, index: int) -> int:
-        """Find next available slot via linear probing. O(1) avg, O(n) worst time, O(1) space."""
+        """Find the slot holding key, else the first reusable slot. O(1) avg, O(n) worst time, O(1) space."""
         prob_range = self.get_prob_range(index)
+        first_tombstone = None
 
         for prob_index in prob_range:
-            if self.arr[prob_index] is None:
-                return prob_index
-            if self.arr[prob_index][0] == key:
+            element = self.arr[prob_index]
+            if element is None:
+                return prob_index if first_tombstone is None else first_tombstone
+            if element is TOMBSTONE:
+                # Remember the first reusable slot, but the key may still follow further on
+                if first_tombstone is None:
+                    first_tombstone = prob_index
+                continue
+            if element[0] == key:
                 return prob_index
 
+        if first_tombstone is not None:
+            return first_tombstone
         raise OverflowError("Hashmap full")
 
+    def tombstone_ratio(self) -> float:
+        """Return the fraction of slots occupied by tombstones. O(1) time, O(1) space."""
+        return self.tombstone_count / self.MAX
+
+    def _rehash(self, new_size: int) -> None:
+        """Rebuild the array with new_size slots, dropping all tombstones. O(nk) avg time, O(n) space."""
+        if self.stats is not None:
+            self.stats.rehashes += 1
+
+        old_arr = self.arr
+        self.MAX = new_size
+        self.arr = [None for _ in range(self.MAX)]
+        self.length = 0
+        self.tombstone_count = 0
+        for element in old_arr:
+            if element is not None and element is not TOMBSTONE:
+                self[element[0]] = element[1]
+
     def __delitem__(self, key: str) -> None:
-        """Delete a key and rehash subsequent probed entries. O(k) avg, O(nk) worst time, O(1) space."""
+        """Delete a key, then reinsert its cluster or leave a tombstone. O(k) avg, O(nk) worst time, O(1) space."""
         h = self.get_hash(key)
         prob_range = self.get_prob_range(h)
 
         for prob_index in prob_range:
-            if self.arr[prob_index] is None:
+            element = self.arr[prob_index]
+            if element is None:
                 raise KeyError(key)
+            if element is TOMBSTONE or element[0] != key:
+                continue
+
+            self.length -= 1
+
+            if self.tombstones:
+                self.arr[prob_index] = TOMBSTONE
+                self.tombstone_count += 1
+                if self.tombstone_count > self.max_tombstone_ratio * self.MAX:
+                    # Compact in place: amortized over the deletes that created the tombstones
+                    self._rehash(self.MAX)
+                    self.compaction_count += 1
+                return
+
+            self.arr[prob_index] = None
+
+            # Rehash elements that were inserted due to probing
+            next_index = (prob_index + 1) % self.MAX
+
+            while self.arr[next_index] is not None:
+                rehash_key, rehash_val = self.arr[next_index]
+                self.arr[next_index] = None
+                self.length -= 1
+                self.__setitem__(rehash_key, rehash_val)
+                if self.stats is not None:
+                    self.stats.delete_reinserts += 1
+                next_index = (next_index + 1) % self.MAX
+
+            return
 
-            if self.arr[prob_index][0] == key:
-                self.arr[prob_index] = None
+        raise KeyError(key)
 
-                # Rehash elements that were inserted due to probing
-                next_index = (prob_index + 1) % self.MAX
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[tuple[str, Any]],
+        size_hint: int | None = None,
+        hash_func: Callable[[str], int] | None = None,
+        tombstones: bool = False,
+    ) -> HashTable:
+        """Build a table with twice size_hint (default: len(items)) slots. O(nk) avg time, O(n) space."""
+        if size_hint is None:
+            items = list(items)
+            size_hint = len(items)
+        # Linear probing degrades quickly above half load, so leave half of the slots empty
+        table = cls(capacity=max(1, 2 * size_hint), hash_func=hash_func, tombstones=tombstones)
+        table.update_many(items)
+        return table
+
+    def update_many(self, pairs: Iterable[tuple[str, Any]]) -> None:
+        """Insert or update many key-value pairs with at most one rehash. O(nk) avg time, O(n) space."""
+        if not isinstance(pairs, (list, tuple)):
+            pairs = list(pairs)
+
+        # Size the table for the final entry count before inserting, keeping it at most half full
+        # like from_items(), so the insert pass below never probes through a nearly full array.
+        # Only keys not in the table yet count, and the table at least doubles, so a series of
+        # small batches rehashes O(log n) times in total. The rehash also drops the tombstones.
+        arr = self.arr
+        find_slot = self.find_slot
+        get_hash = self.get_hash
+        # find_slot() instead of `in`, so the counting pass does not show up in the lookup stats
+        new_keys = {key for key, _ in pairs if not isinstance(arr[find_slot(key, get_hash(key))], tuple)}
+        needed = self.length + len(new_keys)
+        if 2 * (needed + self.tombstone_count) > self.MAX:
+            self._rehash(max(2 * self.MAX, 2 * needed))
+            arr = self.arr
+        for key, val in pairs:
+            index = find_slot(key, get_hash(key))
+            element = arr[index]
+            if element is None:
+                self.length += 1
+            elif element is TOMBSTONE:
+                self.length += 1
+                self.tombstone_count -= 1
+            arr[index] = (key, val)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is present. O(k) avg, O(k + n) worst time, O(1) space."""
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Lazily yield all (key, value) pairs without copying the table. O(n) time, O(1) space."""
+        for element in self.arr:
+            if element is not None and element is not TOMBSTONE:
+                yield element
+
+    def stats_snapshot(self) -> dict[str, Any]:
+        """Return the lookup counters plus the current cluster-length distribution. O(n) time, O(n) space."""
+        if self.stats is None:
+            raise RuntimeError("Statistics are disabled, create the table with track_stats=True")
+        clusters = []
+        run = 0
+        for element in self.arr:
+            if element is None:
+                if run:
+                    clusters.append(run)
+                run = 0
+            else:
+                run += 1
+        if run:
+            # A cluster running off the end of the array continues at index 0
+            if clusters and self.arr[0] is not None:
+                clusters[0] += run
+            else:
+                clusters.append(run)
+        cluster_lengths = {}
+        for length in clusters:
+            cluster_lengths[length] = cluster_lengths.get(length, 0) + 1
+
+        snapshot = self.stats.snapshot()
+        snapshot["load_factor"] = self.length / self.MAX
+        snapshot["tombstone_ratio"] = self.tombstone_ratio()
+        # Histogram: cluster length -> number of clusters
+        snapshot["cluster_lengths"] = dict(sorted(cluster_lengths.items()))
+        return snapshot
+
+
+# Option 2: Compact storage in parallel arrays
+# Instead of one (key, val) tuple object per slot, the hash of each key is cached in an
+# array('q') of machine integers (8 bytes per slot, no Python object), and keys and values
+# live in two parallel lists. Inserts only write into the three arrays, so no tuple is
+# allocated per entry, and probing first compares the cached hash: the (possibly expensive)
+# key comparison only runs when the full 63-bit hashes match. CPython's dict uses the same
+# idea. Deleted slots are marked in the hash array, like the tombstones of Option 1.
+class CompactHashTable(HashTableBase):
+    # Hash array markers; real hashes are masked to be non-negative, so they never clash
+    EMPTY = -1
+    DELETED = -2
+    HASH_MASK = (1 << 63) - 1
+
+    def __init__(
+        self,
+        capacity: int = 8,
+        hash_func: Callable[[str], int] = hash,
+        max_load_factor: float = 2 / 3,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be in (0, 1)")
+        self.MAX = capacity
+        self.hash_func = hash_func
+        self.max_load_factor = max_load_factor
+        self.hash_arr = array("q", [self.EMPTY]) * self.MAX
+        self.key_arr = [None] * self.MAX
+        self.val_arr = [None] * self.MAX
+        # length counts live entries, used also counts deleted slots (both end probe sequences late)
+        self.length = 0
+        self.used = 0
 
-                while self.arr[next_index] is not None:
-                    rehash_key, rehash_val = self.arr[next_index]
-                    self.arr[next_index] = None
-                    self.__setitem__(rehash_key, rehash_val)
-                    next_index = (next_index + 1) % self.MAX
+    def get_hash(self, key: str) -> int:
+        """Compute the non-negative full hash of a key. O(k) time, O(1) space."""
+        return self.hash_func(key) & self.HASH_MASK
+
+    def _find_index(self, key: str, h: int) -> int:
+        """Return the slot holding key, or -1 if missing. O(k) avg, O(k + n) worst time, O(1) space."""
+        hash_arr = self.hash_arr
+        key_arr = self.key_arr
+        index = h % self.MAX
+        while True:
+            slot_hash = hash_arr[index]
+            if slot_hash == self.EMPTY:
+                return -1
+            # Cheap integer comparison first, key comparison only on a full hash match
+            if slot_hash == h and (key_arr[index] is key or key_arr[index] == key):
+                return index
+            index = (index + 1) % self.MAX
 
+    def __setitem__(self, key: str, val: Any) -> None:
+        """Insert or update a key-value pair. O(k) amortized, O(k + n) worst time, O(1) space."""
+        h = self.get_hash(key)
+        hash_arr = self.hash_arr
+        index = h % self.MAX
+        first_deleted = -1
+
+        while True:
+            slot_hash = hash_arr[index]
+            if slot_hash == self.EMPTY:
+                break
+            if slot_hash == self.DELETED:
+                if first_deleted == -1:
+                    first_deleted = index
+            elif slot_hash == h and (self.key_arr[index] is key or self.key_arr[index] == key):
+                self.val_arr[index] = val
                 return
+            index = (index + 1) % self.MAX
+
+        if first_deleted != -1:
+            index = first_deleted
+        else:
+            self.used += 1
+        hash_arr[index] = h
+        self.key_arr[index] = key
+        self.val_arr[index] = val
+        self.length += 1
+
+        if self.used > self.max_load_factor * self.MAX:
+            # Grow if live entries need the room, otherwise only clear out the deleted slots
+            if self.length > self.max_load_factor * self.MAX / 2:
+                self._resize(self.MAX * 2)
+            else:
+                self._resize(self.MAX)
+
+    def __getitem__(self, key: str) -> Any:
+        """Retrieve value by key. O(k) avg, O(k + n) worst time, O(1) space."""
+        index = self._find_index(key, self.get_hash(key))
+        if index == -1:
+            raise KeyError(key)
+        return self.val_arr[index]
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a key by marking its slot as deleted. O(k) avg, O(k + n) worst time, O(1) space."""
+        index = self._find_index(key, self.get_hash(key))
+        if index == -1:
+            raise KeyError(key)
+        self.hash_arr[index] = self.DELETED
+        # Drop the references so the key and value can be garbage collected
+        self.key_arr[index] = None
+        self.val_arr[index] = None
+        self.length -= 1
+
+    def _resize(self, new_size: int) -> None:
+        """Reinsert all live entries into new_size slots, reusing cached hashes. O(n) avg time, O(n) space."""
+        old_hash_arr, old_key_arr, old_val_arr = self.hash_arr, self.key_arr, self.val_arr
+        self.MAX = new_size
+        self.hash_arr = array("q", [self.EMPTY]) * self.MAX
+        self.key_arr = [None] * self.MAX
+        self.val_arr = [None] * self.MAX
+        self.used = self.length
+
+        # Keys are known to be unique, so each one goes into the first empty slot of its probe
+        # sequence without hashing it again or comparing it against other keys
+        for old_index, h in enumerate(old_hash_arr):
+            if h < 0:
+                continue
+            index = h % self.MAX
+            while self.hash_arr[index] != self.EMPTY:
+                index = (index + 1) % self.MAX
+            self.hash_arr[index] = h
+            self.key_arr[index] = old_key_arr[old_index]
+            self.val_arr[index] = old_val_arr[old_index]
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[tuple[str, Any]],
+        size_hint: int | None = None,
+        hash_func: Callable[[str], int] = hash,
+        max_load_factor: float = 2 / 3,
+    ) -> CompactHashTable:
+        """Build a table pre-sized for size_hint (default: len(items)) entries. O(nk) avg time, O(n) space."""
+        if size_hint is None:
+            items = list(items)
+            size_hint = len(items)
+        capacity = max(1, math.floor(size_hint / max_load_factor) + 1)
+        table = cls(capacity=capacity, hash_func=hash_func, max_load_factor=max_load_factor)
+        table.update_many(items)
+        return table
+
+    def update_many(self, pairs: Iterable[tuple[str, Any]]) -> None:
+        """Insert or update many key-value pairs with at most one resize. O(nk) avg time, O(n) space."""
+        if not isinstance(pairs, (list, tuple)):
+            pairs = list(pairs)
+
+        # Grow once for the whole batch (assuming all keys are new) instead of doubling repeatedly
+        needed = self.used + len(pairs)
+        new_size = self.MAX
+        while needed > self.max_load_factor * new_size:
+            new_size *= 2
+        if new_size != self.MAX:
+            self._resize(new_size)
+
+        # Hash all keys in one pass; __setitem__ then finds room without triggering a resize
+        hash_mask = self.HASH_MASK
+        hash_func = self.hash_func
+        hashes = [hash_func(key) & hash_mask for key, _ in pairs]
+        for (key, val), h in zip(pairs, hashes):
+            index = self._find_index(key, h)
+            if index != -1:
+                self.val_arr[index] = val
+                continue
+            index = h % self.MAX
+            while self.hash_arr[index] >= 0:
+                index = (index + 1) % self.MAX
+            if self.hash_arr[index] == self.EMPTY:
+                self.used += 1
+            self.hash_arr[index] = h
+            self.key_arr[index] = key
+            self.val_arr[index] = val
+            self.length += 1
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is present. O(k) avg, O(k + n) worst time, O(1) space."""
+        return self._find_index(key, self.get_hash(key)) != -1
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Lazily yield all (key, value) pairs without copying the table. O(n) time, O(1) space."""
+        for index, h in enumerate(self.hash_arr):
+            if h >= 0:
+                yield self.key_arr[index], self.val_arr[index]
 
 
 if __name__ == "__main__":
@@ -168,4 +623,235 @@ if __name__ == "__main__":
     except KeyError:
         pass  # Expected
 
+    # Test pluggable hash functions (built-in hash() fast path and a custom one)
+    for hash_func in (hash, lambda key: len(key)):
+        custom_ht = HashTable(hash_func=hash_func)
+        for i in range(50):
+            custom_ht[f"key{i}"] = i
+        del custom_ht["key25"]
+        assert custom_ht.get("key25") is None, "Should delete with custom hash"
+        assert all(custom_ht[f"key{i}"] == i for i in range(25)), "Should retrieve with custom hash"
+
+    # Test tombstone deletion mode
+    tomb_ht = HashTable(tombstones=True)
+    tomb_ht["ab"] = "first"
+    tomb_ht["ba"] = "second"
+    tomb_ht["ca"] = "third"  # Hashes one slot after "ab", extending the same cluster
+    del tomb_ht["ab"]
+    assert tomb_ht.arr[tomb_ht.get_hash("ab")] is TOMBSTONE, "Deleted slot should hold a tombstone"
+    assert tomb_ht["ba"] == "second", "Lookup should probe past the tombstone"
+    assert tomb_ht.get("ab") is None, "Deleted key should be missing"
+    assert tomb_ht.length == 2, "Should count 2 live entries"
+    assert tomb_ht.tombstone_count == 1, "Should count 1 tombstone"
+    assert tomb_ht.tombstone_ratio() == 0.01, "Tombstone ratio should be 1 / 100"
+
+    # Re-inserting reuses the tombstone and must not duplicate keys further on
+    tomb_ht["ba"] = "updated"
+    assert tomb_ht.tombstone_count == 1, "Updating an existing key should not consume the tombstone"
+    tomb_ht["ab"] = "again"
+    assert tomb_ht.tombstone_count == 0, "New key should reuse the tombstone"
+    assert tomb_ht["ab"] == "again" and tomb_ht["ba"] == "updated", "Both keys should be retrievable"
+
+    try:
+        del tomb_ht["nonexistent"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test compaction once tombstones exceed the threshold
+    churn_ht = HashTable(hash_func=hash, capacity=64, tombstones=True, max_tombstone_ratio=0.25)
+    for round_num in range(10):
+        for i in range(20):
+            churn_ht[f"session{round_num}_{i}"] = i
+        for i in range(20):
+            del churn_ht[f"session{round_num}_{i}"]
+        assert churn_ht.tombstone_ratio() <= 0.25, "Tombstone ratio should stay below threshold"
+    assert churn_ht.compaction_count > 0, "Churn should have triggered a compaction"
+    assert churn_ht.length == 0, "All sessions should be expired"
+    churn_ht["kept"] = "value"
+    assert churn_ht["kept"] == "value", "Table should remain usable after compaction"
+
+    # Test the default mode still counts entries
+    assert ht.length == 3, "Default mode should count 3 live entries"
+
+    # Test compact parallel-array storage (Option 2)
+    compact = CompactHashTable()
+    compact["apple"] = 100
+    compact["banana"] = 200
+    compact["apple"] = 150
+    assert compact["apple"] == 150, "Should update apple"
+    assert compact.length == 2, "Update should not add an entry"
+    assert compact.hash_arr.typecode == "q", "Hashes should be cached in a machine-integer array"
+    assert not any(isinstance(slot, tuple) for slot in compact.key_arr), "No per-entry tuples"
+
+    del compact["banana"]
+    assert compact.get("banana") is None, "Deleted key should be missing"
+    try:
+        del compact["banana"]
+        assert False, "Should raise KeyError for deleted key"
+    except KeyError:
+        pass  # Expected
+
+    # Colliding full hashes fall back to comparing keys
+    same_hash = CompactHashTable(hash_func=lambda key: 42)
+    same_hash["ab"] = "first"
+    same_hash["ba"] = "second"
+    del same_hash["ab"]
+    assert same_hash["ba"] == "second", "Lookup should probe past deleted slots"
+    same_hash["ab"] = "again"
+    assert same_hash.used == 2, "Re-insert should reuse the deleted slot"
+
+    # Growth and compaction of deleted slots
+    for i in range(1000):
+        compact[f"key{i}"] = i
+    for i in range(0, 1000, 2):
+        del compact[f"key{i}"]
+    for i in range(1000, 3000):
+        compact[f"key{i}"] = i
+        del compact[f"key{i}"]
+    assert compact.length == 501, "Should count apple and the 500 odd keys"
+    assert compact.used <= compact.max_load_factor * compact.MAX, "Deleted slots should be cleared out"
+    assert all(compact.get(f"key{i}") == (None if i % 2 == 0 else i) for i in range(1000)), (
+        "Only odd keys should remain"
+    )
+
+    # Compare container memory with one tuple per slot (keys and values themselves are shared)
+    tuple_ht = HashTable(capacity=2048, hash_func=hash)
+    compact_ht = CompactHashTable()
+    for i in range(1000):
+        tuple_ht[f"key{i}"] = i
+        compact_ht[f"key{i}"] = i
+    assert compact_ht.MAX == 2048, "Both tables should have 2048 slots"
+    tuple_bytes = sys.getsizeof(tuple_ht.arr) + sum(
+        sys.getsizeof(slot) for slot in tuple_ht.arr if slot is not None
+    )
+    compact_bytes = (
+        sys.getsizeof(compact_ht.hash_arr)
+        + sys.getsizeof(compact_ht.key_arr)
+        + sys.getsizeof(compact_ht.val_arr)
+    )
+    assert compact_bytes < tuple_bytes, "Parallel arrays should need less memory than tuples"
+
+    # Test bulk loading for both storage layouts
+    pairs = [(f"row{i}", i) for i in range(1000)]
+    bulk_ht = HashTable.from_items(pairs, hash_func=hash)
+    assert bulk_ht.MAX == 2000 and bulk_ht.length == 1000, "Should be sized to half load"
+    assert bulk_ht.get_many(["row0", "row999", "missing"]) == [0, 999, None], "get_many should use default"
+    bulk_ht.update_many([("row0", "updated"), ("row1000", 1000)])
+    assert bulk_ht["row0"] == "updated" and bulk_ht.length == 1001, "update_many should update and insert"
+    assert bulk_ht.MAX >= 2 * bulk_ht.length, "update_many should keep the table at most half full"
+    small_ht = HashTable(capacity=10, hash_func=hash, track_stats=True)
+    small_ht.update_many(pairs)
+    assert small_ht.MAX == 2000, "A batch that does not fit should grow straight to half load"
+    assert small_ht.stats.rehashes == 1, "A batch should rehash at most once"
+    small_ht.update_many(pairs[:10])
+    assert small_ht.stats.rehashes == 1, "A batch of existing keys should not rehash"
+    for i in range(1000, 3000):
+        small_ht.update_many([(f"row{i}", i)])
+    assert small_ht.stats.rehashes <= 3, "Small batches should grow the table geometrically"
+    assert small_ht.length == 3000 and small_ht.MAX >= 6000, "Small batches should keep the table half full"
+    assert small_ht.get_many(f"row{i}" for i in range(1000)) == list(range(1000)), (
+        "All bulk-loaded keys should be retrievable"
+    )
+
+    bulk_compact = CompactHashTable.from_items(iter(pairs), size_hint=1000)
+    assert bulk_compact.MAX == 1501 and bulk_compact.length == 1000, "Should be pre-sized for 1000 keys"
+    bulk_compact.update_many(pairs[:10] + [("extra", -1)])
+    assert bulk_compact.length == 1001, "update_many should update and insert"
+    del bulk_compact["row5"]
+    bulk_compact.update_many([("row5", 5)])
+    assert bulk_compact.used == 1001, "Bulk insert should reuse the deleted slot"
+    assert bulk_compact.get_many(f"row{i}" for i in range(1000)) == list(range(1000)), (
+        "All bulk-loaded keys should be retrievable"
+    )
+
+    # Test views, length and membership for both storage layouts
+    for table in (HashTable(hash_func=hash, tombstones=True), CompactHashTable()):
+        for i in range(20):
+            table[f"key{i}"] = i
+        del table["key0"]
+        assert len(table) == 19, "len() should count live entries"
+        assert "key5" in table and "key0" not in table, "Membership should skip deleted keys"
+        assert sorted(table.values()) == list(range(1, 20)), "values() should skip deleted slots"
+        assert sorted(table) == sorted(table.keys()) == sorted(f"key{i}" for i in range(1, 20)), (
+            "Iteration should yield every live key once"
+        )
+        assert dict(table.items()) == {f"key{i}": i for i in range(1, 20)}, "items() should yield all pairs"
+
+        # Test snapshot round trip
+        buffer = io.BytesIO()
+        assert table.export_snapshot(buffer) == 19, "Should export 19 entries"
+        buffer.seek(0)
+        restored = type(table).load_snapshot(buffer, hash_func=hash)
+        assert dict(restored.items()) == dict(table.items()), "Snapshot should round-trip all entries"
+
+    # Test non-string keys (allowed with hash_func=hash) survive a snapshot
+    for table in (HashTable(hash_func=hash), CompactHashTable()):
+        table[(1, "a")] = "tuple key"
+        table[42] = "int key"
+        buffer = io.BytesIO()
+        table.export_snapshot(buffer)
+        buffer.seek(0)
+        assert dict(type(table).load_snapshot(buffer, hash_func=hash).items()) == dict(table.items()), (
+            "Snapshots should round-trip non-string keys"
+        )
+
+    # Test snapshots are interchangeable with the separate-chaining table of 01b
+    chained = separate_chaining.HashTable()
+    chained.update_many((f"snap{i}", i) for i in range(50))
+    buffer = io.BytesIO()
+    chained.export_snapshot(buffer)
+    buffer.seek(0)
+    assert dict(CompactHashTable.load_snapshot(buffer).items()) == dict(chained.items()), (
+        "A 01b snapshot should load into the compact table"
+    )
+
+    try:
+        CompactHashTable.load_snapshot(io.BytesIO(b"NOTASNAP" + bytes(8)))
+        assert False, "Should raise ValueError for a foreign file"
+    except ValueError:
+        pass
+
+    # Test instrumentation: probe lengths, hits/misses, delete reinserts and cluster lengths
+    stats_ht = HashTable(capacity=10, hash_func=lambda key: 8, track_stats=True)
+    for key in ("a", "b", "c"):
+        stats_ht[key] = key  # Slots 8, 9 and (wrapping around) 0
+    assert stats_ht["a"] == "a" and stats_ht["c"] == "c", "Should retrieve across the wrap-around"
+    assert stats_ht.get("missing") is None, "Miss should be recorded"
+    stats = stats_ht.stats_snapshot()
+    assert stats["hits"] == 2 and stats["misses"] == 1, "Should count hits and misses"
+    assert stats["probe_lengths"] == {1: 1, 3: 1, 4: 1}, "Hits probe 1 and 3 slots, the miss 4"
+    assert stats["cluster_lengths"] == {3: 1}, "Wrapping cluster should be counted once"
+    assert stats["load_factor"] == 0.3, "Load factor should be 3 / 10"
+    del stats_ht["a"]
+    assert stats_ht.stats_snapshot()["delete_reinserts"] == 2, "Delete should reinsert 'b' and 'c'"
+
+    tomb_stats = HashTable(capacity=8, hash_func=hash, tombstones=True, track_stats=True)
+    for i in range(3):
+        tomb_stats[f"key{i}"] = i
+    for i in range(3):
+        del tomb_stats[f"key{i}"]
+    stats = tomb_stats.stats_snapshot()
+    assert stats["rehashes"] == 1, "Third tombstone should trigger a compaction"
+    assert stats["delete_reinserts"] == 0, "Tombstone deletes should not reinsert"
+    assert stats["tombstone_ratio"] == 0.0, "Compaction should clear all tombstones"
+
+    # Test sampling mode records the probe length of only every N-th lookup, but counts every outcome
+    sampled = HashTable(track_stats=True, stats_sample_every=10)
+    sampled["apple"] = 1
+    for _ in range(100):
+        sampled.get("apple")
+    for _ in range(5):
+        sampled.get("missing")
+    stats = sampled.stats_snapshot()
+    assert stats["lookups"] == 105 and stats["sampled_lookups"] == 10, "Should sample 1 in 10 lookups"
+    assert sum(stats["probe_lengths"].values()) == 10, "Only sampled lookups should enter the histogram"
+    assert stats["hits"] == 100 and stats["misses"] == 5, "Hits and misses should count every lookup"
+
+    try:
+        HashTable().stats_snapshot()
+        assert False, "Should raise RuntimeError when statistics are disabled"
+    except RuntimeError:
+        pass
+
     print("All tests passed!")
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import struct
+from typing import Callable
+
+# The hash tables in 01a-01c sum the character codes of a key. That is easy to follow but
+# every anagram collides ("ab" and "ba" map to the same bucket) and similar keys such as
+# "key1", "key2", ... land in neighbouring buckets. This file collects better string hash
+# functions that can be passed to the tables via their hash_func parameter, plus a report
+# that measures how evenly a hash function spreads a given set of keys over the buckets.
+#
+# * additive_hash: the textbook version used so far (for comparison)
+# * fnv1a_hash:    FNV-1a (64-bit), one XOR and one multiply per byte
+# * xxhash32:      xxHash (32-bit), processes four 4-byte lanes per round
+# * siphash24:     SipHash-2-4 (64-bit), keyed and resistant to hash-flooding attacks
+# * hash:          Python's built-in hash(), implemented in C (SipHash-1-3 for strings
+#                  with a per-process random key). Usually the fastest choice by far,
+#                  but its values differ between processes, so never persist them.
+
+MASK_32 = 0xFFFFFFFF
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+FNV_OFFSET_BASIS_64 = 0xCBF29CE484222325
+FNV_PRIME_64 = 0x100000001B3
+
+XXH_PRIME32_1 = 0x9E3779B1
+XXH_PRIME32_2 = 0x85EBCA77
+XXH_PRIME32_3 = 0xC2B2AE3D
+XXH_PRIME32_4 = 0x27D4EB2F
+XXH_PRIME32_5 = 0x165667B1
+
+
+def additive_hash(key: str) -> int:
+    """Sum the character codes of a key (collides for all anagrams). O(k) time, O(1) space."""
+    h = 0
+    for char in key:
+        h += ord(char)
+    return h
+
+
+def fnv1a_hash_bytes(data: bytes) -> int:
+    """Compute the 64-bit FNV-1a hash of a byte string. O(k) time, O(1) space."""
+    h = FNV_OFFSET_BASIS_64
+    for byte in data:
+        h ^= byte
+        h = (h * FNV_PRIME_64) & MASK_64
+    return h
+
+
+def fnv1a_hash(key: str) -> int:
+    """Compute the 64-bit FNV-1a hash of a key's UTF-8 bytes. O(k) time, O(k) space."""
+    return fnv1a_hash_bytes(key.encode())
+
+
+def _rotl32(x: int, r: int) -> int:
+    """Rotate a 32-bit integer left by r bits. O(1) time, O(1) space."""
+    return ((x << r) | (x >> (32 - r))) & MASK_32
+
+
+def _xxh32_round(acc: int, lane: int) -> int:
+    """Mix one 4-byte lane into an accumulator. O(1) time, O(1) space."""
+    acc = (acc + lane * XXH_PRIME32_2) & MASK_32
+    return (_rotl32(acc, 13) * XXH_PRIME32_1) & MASK_32
+
+
+def xxhash32(key: str, seed: int = 0) -> int:
+    """Compute the 32-bit xxHash of a key. O(k) time, O(k) space."""
+    data = key.encode()
+    length = len(data)
+    i = 0
+
+    if length >= 16:
+        # Four independent accumulators, each consuming one 4-byte lane per 16-byte stripe
+        v1 = (seed + XXH_PRIME32_1 + XXH_PRIME32_2) & MASK_32
+        v2 = (seed + XXH_PRIME32_2) & MASK_32
+        v3 = seed & MASK_32
+        v4 = (seed - XXH_PRIME32_1) & MASK_32
+        while i <= length - 16:
+            lane1, lane2, lane3, lane4 = struct.unpack_from("<4I", data, i)
+            v1 = _xxh32_round(v1, lane1)
+            v2 = _xxh32_round(v2, lane2)
+            v3 = _xxh32_round(v3, lane3)
+            v4 = _xxh32_round(v4, lane4)
+            i += 16
+        h = (_rotl32(v1, 1) + _rotl32(v2, 7) + _rotl32(v3, 12) + _rotl32(v4, 18)) & MASK_32
+    else:
+        h = (seed + XXH_PRIME32_5) & MASK_32
+
+    h = (h + length) & MASK_32
+
+    # Remaining 4-byte words, then remaining single bytes
+    while i + 4 <= length:
+        (lane,) = struct.unpack_from("<I", data, i)
+        h = (h + lane * XXH_PRIME32_3) & MASK_32
+        h = (_rotl32(h, 17) * XXH_PRIME32_4) & MASK_32
+        i += 4
+    while i < length:
+        h = (h + data[i] * XXH_PRIME32_5) & MASK_32
+        h = (_rotl32(h, 11) * XXH_PRIME32_1) & MASK_32
+        i += 1
+
+    # Final avalanche so that every input bit affects every output bit
+    h ^= h >> 15
+    h = (h * XXH_PRIME32_2) & MASK_32
+    h ^= h >> 13
+    h = (h * XXH_PRIME32_3) & MASK_32
+    h ^= h >> 16
+    return h
+
+
+def _rotl64(x: int, r: int) -> int:
+    """Rotate a 64-bit integer left by r bits. O(1) time, O(1) space."""
+    return ((x << r) | (x >> (64 - r))) & MASK_64
+
+
+def siphash24(key: str, k0: int = 0x0706050403020100, k1: int = 0x0F0E0D0C0B0A0908) -> int:
+    """Compute the keyed 64-bit SipHash-2-4 of a key. O(k) time, O(k) space."""
+    data = key.encode()
+    length = len(data)
+
+    v0 = k0 ^ 0x736F6D6570736575
+    v1 = k1 ^ 0x646F72616E646F6D
+    v2 = k0 ^ 0x6C7967656E657261
+    v3 = k1 ^ 0x7465646279746573
+
+    def sip_round() -> None:
+        nonlocal v0, v1, v2, v3
+        v0 = (v0 + v1) & MASK_64
+        v1 = _rotl64(v1, 13) ^ v0
+        v0 = _rotl64(v0, 32)
+        v2 = (v2 + v3) & MASK_64
+        v3 = _rotl64(v3, 16) ^ v2
+        v0 = (v0 + v3) & MASK_64
+        v3 = _rotl64(v3, 21) ^ v0
+        v2 = (v2 + v1) & MASK_64
+        v1 = _rotl64(v1, 17) ^ v2
+        v2 = _rotl64(v2, 32)
+
+    # The last 8-byte block holds the remaining bytes and the message length in its top byte
+    tail = data[length - length % 8 :] + bytes(7 - length % 8) + bytes([length & 0xFF])
+    blocks = struct.unpack(f"<{length // 8}Q", data[: length - length % 8])
+    for m in blocks + struct.unpack("<Q", tail):
+        v3 ^= m
+        sip_round()
+        sip_round()
+        v0 ^= m
+
+    v2 ^= 0xFF
+    for _ in range(4):
+        sip_round()
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+HASH_FUNCTIONS: dict[str, Callable[[str], int]] = {
+    "additive": additive_hash,
+    "fnv1a": fnv1a_hash,
+    "xxhash32": xxhash32,
+    "siphash24": siphash24,
+    "builtin": hash,
+}
+
+
+def collision_report(keys: list[str], size: int, hash_func: Callable[[str], int]) -> dict[str, float]:
+    """Measure how evenly hash_func spreads keys over size buckets. O(nk + size) time, O(size) space."""
+    if size < 1:
+        raise ValueError("Size must be positive")
+
+    counts = [0] * size
+    for key in keys:
+        counts[hash_func(key) % size] += 1
+
+    n = len(keys)
+    used_buckets = size - counts.count(0)
+    # A perfectly random hash function fills size * (1 - (1 - 1/size)^n) buckets on average,
+    # so this many keys are expected to share a bucket with an earlier key
+    expected_collisions = n - size * (1 - (1 - 1 / size) ** n)
+    collisions = n - used_buckets
+    return {
+        "keys": n,
+        "buckets": size,
+        "used_buckets": used_buckets,
+        "collisions": collisions,
+        "expected_collisions": expected_collisions,
+        # ~1.0 is as good as random, values well above 1.0 mean pathological bucket skew
+        "collision_ratio": collisions / expected_collisions if expected_collisions else 0.0,
+        "max_chain": max(counts),
+    }
+
+
+def compare_hash_functions(keys: list[str], size: int) -> list[tuple[str, dict[str, float]]]:
+    """Report every registered hash function, fewest collisions first. O(nk + size) time, O(size) space."""
+    reports = [(name, collision_report(keys, size, func)) for name, func in HASH_FUNCTIONS.items()]
+    reports.sort(key=lambda item: (item[1]["collisions"], item[1]["max_chain"]))
+    return reports
+
+
+if __name__ == "__main__":
+    # Test against published reference values
+    assert fnv1a_hash("") == 0xCBF29CE484222325, "FNV-1a of empty string is the offset basis"
+    assert fnv1a_hash("a") == 0xAF63DC4C8601EC8C, "FNV-1a('a') reference value"
+    assert fnv1a_hash_bytes(b"\xff") == fnv1a_hash_bytes(bytes([255])) != fnv1a_hash("\xff"), (
+        "The bytes variant should hash raw bytes, the str variant their UTF-8 encoding"
+    )
+    assert xxhash32("") == 0x02CC5D05, "xxHash32('') reference value"
+    assert xxhash32("abc") == 0x32D153FF, "xxHash32('abc') reference value"
+    assert siphash24(bytes(range(15)).decode()) == 0xA129CA6149BE45E5, "SipHash-2-4 paper test vector"
+
+    # Test that the long-input paths are consistent and seeded
+    long_key = "The quick brown fox jumps over the lazy dog"
+    assert xxhash32(long_key) == xxhash32(long_key), "xxHash32 should be deterministic"
+    assert xxhash32(long_key) != xxhash32(long_key, seed=1), "Seed should change xxHash32"
+    assert siphash24(long_key) != siphash24(long_key, k0=1), "Key should change SipHash"
+
+    # Test that anagrams no longer collide
+    assert additive_hash("ab") == additive_hash("ba"), "Additive hash collides for anagrams"
+    for name in ("fnv1a", "xxhash32", "siphash24"):
+        func = HASH_FUNCTIONS[name]
+        assert func("ab") != func("ba"), f"{name} should distinguish anagrams"
+
+    # Test collision report on keys that are hard for the additive hash
+    keys = [f"key{i}" for i in range(1000)]
+    additive = collision_report(keys, 1024, additive_hash)
+    fnv = collision_report(keys, 1024, fnv1a_hash)
+    assert additive["keys"] == 1000 and additive["buckets"] == 1024, "Report should echo its inputs"
+    assert additive["used_buckets"] < 100, "Additive hash should crowd similar keys into few buckets"
+    assert fnv["collision_ratio"] < 1.5, "FNV-1a should be close to a random hash function"
+    assert fnv["max_chain"] < additive["max_chain"], "FNV-1a should have shorter chains"
+
+    ranking = compare_hash_functions(keys, 1024)
+    assert len(ranking) == len(HASH_FUNCTIONS), "Should report every hash function"
+    assert ranking[-1][0] == "additive", "Additive hash should rank last"
+
+    try:
+        collision_report(keys, 0, hash)
+        assert False, "Should raise ValueError for non-positive size"
+    except ValueError:
+        pass
+
+    print("All tests passed!")
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator
+
+# NOTE: Unlike 01a-01c, this table defaults to Python's built-in hash(). Robin Hood hashing is
+# meant for high load factors (0.9 here), where the clustered additive hash would make every
+# probe sequence long regardless of how entries are arranged.
+
+# Robin Hood hashing is linear probing with one extra rule: every slot remembers its probe
+# distance (how far its entry sits from the entry's home slot). While inserting, an entry that
+# has travelled further than the resident of a slot ("poor") takes that slot from the resident
+# ("rich"), and the displaced resident continues probing instead. This keeps all probe distances
+# close to the mean, so lookups have low variance, and it orders each cluster by home slot.
+# That ordering allows two optimizations over plain linear probing:
+# * A lookup can stop as soon as it reaches a slot whose entry is closer to home than the
+#   current probe distance, because the key would have displaced that entry on insert.
+# * A delete does not need tombstones or reinsertion: the following entries of the cluster
+#   are shifted back by one slot until an empty slot or an entry at its home slot is reached.
+
+
+class HashTable:
+    def __init__(
+        self,
+        capacity: int = 8,
+        max_load_factor: float = 0.9,
+        hash_func: Callable[[str], int] = hash,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        if not 0 < max_load_factor < 1:
+            # At least one empty slot is needed so that probing always terminates
+            raise ValueError("max_load_factor must be in (0, 1)")
+        self.MAX = capacity
+        self.max_load_factor = max_load_factor
+        self.hash_func = hash_func
+        self.arr = [None for _ in range(self.MAX)]
+        # Probe distance of the entry in each slot, -1 marks an empty slot
+        self.dist = [-1 for _ in range(self.MAX)]
+        self.length = 0
+
+    def get_hash(self, key: str) -> int:
+        """Compute the home slot for a given key. O(k) time, O(1) space."""
+        return self.hash_func(key) % self.MAX
+
+    def _find_index(self, key: str) -> int:
+        """Return the slot holding key, or -1 if missing. O(k) avg, O(k + n) worst time, O(1) space."""
+        index = self.get_hash(key)
+        dist = 0
+        while True:
+            slot_dist = self.dist[index]
+            # Empty slot (-1) or a richer entry: the key would have been placed here
+            if slot_dist < dist:
+                return -1
+            # An entry can only match if it sits at the same distance from the same home slot
+            if slot_dist == dist and self.arr[index][0] == key:
+                return index
+            index = (index + 1) % self.MAX
+            dist += 1
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        """Insert or update a key-value pair. O(k) amortized, O(k + n) worst time, O(1) space."""
+        index = self.get_hash(key)
+        dist = 0
+        entry = (key, val)
+        # Only the original entry can already exist; displaced entries are known to be unique
+        carrying_new_entry = True
+
+        while True:
+            slot_dist = self.dist[index]
+            if slot_dist == -1:
+                self.arr[index] = entry
+                self.dist[index] = dist
+                self.length += 1
+                break
+
+            if carrying_new_entry and slot_dist == dist and self.arr[index][0] == key:
+                self.arr[index] = entry
+                return
+
+            if slot_dist < dist:
+                # Take from the rich: swap in the poorer entry and carry on with the richer one
+                self.arr[index], entry = entry, self.arr[index]
+                self.dist[index], dist = dist, slot_dist
+                carrying_new_entry = False
+
+            index = (index + 1) % self.MAX
+            dist += 1
+
+        if self.length > self.max_load_factor * self.MAX:
+            self._resize(self.MAX * 2)
+
+    def __getitem__(self, key: str) -> Any:
+        """Retrieve value by key. O(k) avg, O(k + n) worst time, O(1) space."""
+        index = self._find_index(key)
+        if index == -1:
+            raise KeyError(key)
+        return self.arr[index][1]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k) avg, O(k + n) worst time, O(1) space."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a key and shift the rest of its cluster back. O(k) avg, O(k + n) worst time, O(1) space."""
+        index = self._find_index(key)
+        if index == -1:
+            raise KeyError(key)
+
+        # Backward-shift deletion: entries that are not at their home slot move one step closer
+        next_index = (index + 1) % self.MAX
+        while self.dist[next_index] > 0:
+            self.arr[index] = self.arr[next_index]
+            self.dist[index] = self.dist[next_index] - 1
+            index = next_index
+            next_index = (next_index + 1) % self.MAX
+
+        self.arr[index] = None
+        self.dist[index] = -1
+        self.length -= 1
+
+    def _resize(self, new_size: int) -> None:
+        """Reinsert all entries into new_size slots. O(nk) avg time, O(n) space."""
+        old_arr = self.arr
+        self.MAX = new_size
+        self.arr = [None for _ in range(self.MAX)]
+        self.dist = [-1 for _ in range(self.MAX)]
+        self.length = 0
+        for element in old_arr:
+            if element is not None:
+                self[element[0]] = element[1]
+
+    def __len__(self) -> int:
+        """Return the number of entries. O(1) time, O(1) space."""
+        return self.length
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is present. O(k) avg, O(k + n) worst time, O(1) space."""
+        return self._find_index(key) != -1
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Lazily yield all (key, value) pairs without copying the table. O(n) time, O(1) space."""
+        for element in self.arr:
+            if element is not None:
+                yield element
+
+    def keys(self) -> Iterator[str]:
+        """Lazily yield all keys. O(n) time, O(1) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(1) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys, like a dict. O(n) time, O(1) space."""
+        return self.keys()
+
+    def probe_stats(self) -> dict[str, float]:
+        """Return mean, variance and maximum of the probe distances. O(n) time, O(n) space."""
+        distances = [d for d in self.dist if d >= 0]
+        if not distances:
+            return {"mean": 0.0, "variance": 0.0, "max": 0}
+        mean = sum(distances) / len(distances)
+        variance = sum((d - mean) ** 2 for d in distances) / len(distances)
+        return {"mean": mean, "variance": variance, "max": max(distances)}
+
+
+if __name__ == "__main__":
+    ht = HashTable()
+
+    # Basic operations
+    ht["apple"] = 100
+    ht["banana"] = 200
+    ht["orange"] = 300
+
+    assert ht["apple"] == 100, "Should retrieve apple"
+    assert ht["banana"] == 200, "Should retrieve banana"
+    assert ht["orange"] == 300, "Should retrieve orange"
+
+    # Test KeyError for missing key
+    try:
+        _ = ht["grape"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test get() method
+    assert ht.get("grape") is None, "get() should return None for missing key"
+    assert ht.get("grape", "default") == "default", "get() should return default value"
+    assert ht.get("apple") == 100, "get() should return value for existing key"
+
+    # Test update
+    ht["apple"] = 150
+    assert ht["apple"] == 150, "Should update apple"
+    assert ht.length == 3, "Update should not add an entry"
+
+    # Test delete
+    del ht["banana"]
+    try:
+        _ = ht["banana"]
+        assert False, "Should raise KeyError for deleted key"
+    except KeyError:
+        pass  # Expected
+
+    try:
+        del ht["nonexistent"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test Robin Hood displacement with a hash function that forces collisions
+    # Keys are hashed by their first character, so "a1", "a2", "a3" share home slot 1
+    first_char = HashTable(capacity=10, hash_func=lambda key: ord(key[0]) - ord("`"))
+    first_char["a1"] = 1
+    first_char["a2"] = 2
+    first_char["a3"] = 3
+    assert first_char.dist[1:4] == [0, 1, 2], "Cluster should sit at distances 0, 1, 2"
+    # "c1" (home slot 3) passes the richer-or-equal "a3" (distance 2) and lands in slot 4
+    first_char["c1"] = 4
+    assert first_char.dist[3:5] == [2, 1], "'c1' should sit at distance 1"
+    # "a4" (home slot 1) reaches slot 4 with distance 3, so it takes the slot from the richer "c1"
+    # (distance 1), which moves on to slot 5
+    first_char["a4"] = 5
+    assert first_char.dist[1:6] == [0, 1, 2, 3, 2], "Poor 'a4' should displace rich 'c1'"
+    assert [first_char.arr[i][0] for i in range(1, 6)] == ["a1", "a2", "a3", "a4", "c1"], (
+        "Cluster should stay ordered by home slot"
+    )
+    assert first_char["c1"] == 4, "Displaced entry should stay retrievable"
+
+    # A missing key with home slot 2 stops early at slot 5 ("c1" has distance 2 < probe distance 3)
+    assert first_char.get("b1") is None, "Miss should terminate early"
+
+    # Test backward-shift deletion keeps the cluster reachable and without gaps
+    del first_char["a2"]
+    assert first_char.dist[1:6] == [0, 1, 2, 1, -1], "Entries should shift back by one slot"
+    assert [first_char[k] for k in ("a1", "a3", "a4", "c1")] == [1, 3, 5, 4], (
+        "Remaining keys should be retrievable after backward shift"
+    )
+
+    # Test high load factor with many keys
+    big_ht = HashTable(capacity=16)
+    for i in range(10000):
+        big_ht[f"key{i}"] = i
+    assert big_ht.length == 10000, "Should count 10000 entries"
+    assert big_ht.length <= big_ht.max_load_factor * big_ht.MAX, "Load factor should stay bounded"
+    assert all(big_ht[f"key{i}"] == i for i in range(10000)), "All keys should survive resizing"
+    for i in range(0, 10000, 2):
+        del big_ht[f"key{i}"]
+    assert all(big_ht.get(f"key{i}") == (None if i % 2 == 0 else i) for i in range(10000)), (
+        "Only odd keys should remain after deleting even keys"
+    )
+    stats = big_ht.probe_stats()
+    assert stats["mean"] < 3 and stats["variance"] < 10, "Probe distances should stay small"
+
+    # Test invalid configuration
+    try:
+        HashTable(max_load_factor=1.0)
+        assert False, "Should raise ValueError for a load factor of 1"
+    except ValueError:
+        pass
+
+    # Test views, length and membership
+    assert len(big_ht) == 5000, "len() should count live entries"
+    assert "key1" in big_ht and "key0" not in big_ht, "Membership should check keys"
+    expected_items = {f"key{i}": i for i in range(1, 10000, 2)}
+    assert dict(big_ht.items()) == expected_items, "items() should yield all pairs"
+    assert sorted(big_ht.values()) == list(range(1, 10000, 2)), "values() should yield every value once"
+    assert set(big_ht) == set(big_ht.keys()) == {f"key{i}" for i in range(1, 10000, 2)}, (
+        "Iteration should yield every key once"
+    )
+
+    print("All tests passed!")
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Iterator
+
+# Cuckoo hashing uses d tables (usually 2) with one independent hash function each. Every key
+# lives in exactly one of its d candidate slots (or in a tiny stash), so a lookup or delete
+# probes at most d slots plus the stash: O(1) worst case, instead of the O(n) worst case of
+# chaining (01b) and linear probing (01c).
+# The price is paid on insert: if all candidate slots are taken, the key kicks out one of the
+# residents, which moves to one of its own other candidate slots, possibly kicking out another
+# key, and so on (like a cuckoo chick pushing eggs out of the nest). Inserts are O(1) amortized
+# expected, as long as the load stays below ~50% for 2 tables (~90% for 3 or more).
+# If the chain of kicks gets too long (a cycle is likely), the homeless key is put into a small
+# stash. Only when the stash is full as well, all keys are rehashed with fresh hash functions.
+
+# NOTE: Keys can be any hashable type. The d independent hash functions are obtained by hashing
+# (seed, key) tuples with Python's built-in hash(), so a rehash only has to pick new seeds.
+
+
+class HashTable:
+    STASH_SIZE = 4
+
+    def __init__(
+        self,
+        capacity: int = 8,
+        num_tables: int = 2,
+        max_load_factor: float | None = None,
+        max_kicks: int = 32,
+        seed: int | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        if num_tables < 2:
+            raise ValueError("Cuckoo hashing needs at least two tables")
+        # Capacity is per table, so the table holds num_tables * capacity slots in total
+        self.MAX = capacity
+        self.num_tables = num_tables
+        if max_load_factor is None:
+            max_load_factor = 0.45 if num_tables == 2 else 0.85
+        self.max_load_factor = max_load_factor
+        self.max_kicks = max_kicks
+        self.rng = random.Random(seed)
+        self.seeds = [self.rng.getrandbits(64) for _ in range(num_tables)]
+        self.tables = [[None for _ in range(self.MAX)] for _ in range(num_tables)]
+        self.stash = []
+        self.length = 0
+        self.rehash_count = 0
+
+    def get_hash(self, key: Any, table: int) -> int:
+        """Compute the candidate slot of a key in one of the tables. O(k) time, O(1) space."""
+        return hash((self.seeds[table], key)) % self.MAX
+
+    def _find(self, key: Any) -> tuple[int, int]:
+        """Return (table, slot) of a key, (-1, stash index) if stashed, or (-1, -1). O(k) time, O(1) space."""
+        for table in range(self.num_tables):
+            slot = self.get_hash(key, table)
+            element = self.tables[table][slot]
+            if element is not None and element[0] == key:
+                return table, slot
+        for idx, element in enumerate(self.stash):
+            if element[0] == key:
+                return -1, idx
+        return -1, -1
+
+    def __getitem__(self, key: Any) -> Any:
+        """Retrieve value by key, probing at most num_tables slots and the stash. O(k) time, O(1) space."""
+        table, slot = self._find(key)
+        if table != -1:
+            return self.tables[table][slot][1]
+        if slot != -1:
+            return self.stash[slot][1]
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k) time, O(1) space."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Any, val: Any) -> None:
+        """Insert or update a key-value pair. O(k) amortized expected, O(nk) worst time, O(1) space."""
+        table, slot = self._find(key)
+        if table != -1:
+            self.tables[table][slot] = (key, val)
+            return
+        if slot != -1:
+            self.stash[slot] = (key, val)
+            return
+
+        if self.length + 1 > self.max_load_factor * self.num_tables * self.MAX:
+            self._rehash(self.MAX * 2)
+
+        homeless = self._insert((key, val))
+        if homeless is not None:
+            if len(self.stash) < self.STASH_SIZE:
+                self.stash.append(homeless)
+            else:
+                self._rehash(self.MAX, extra=homeless)
+        self.length += 1
+
+    def _insert(self, entry: tuple[Any, Any]) -> tuple[Any, Any] | None:
+        """Place an entry by kicking out residents; return any homeless entry. O(k) expected time, O(1) space."""
+        table = 0
+        for _ in range(self.max_kicks):
+            # Prefer any free candidate slot over kicking someone out
+            for candidate in range(self.num_tables):
+                slot = self.get_hash(entry[0], candidate)
+                if self.tables[candidate][slot] is None:
+                    self.tables[candidate][slot] = entry
+                    return None
+
+            # Evict the resident of the current table; it will try the next table, so it
+            # never immediately kicks the entry that just displaced it
+            slot = self.get_hash(entry[0], table)
+            entry, self.tables[table][slot] = self.tables[table][slot], entry
+            table = (table + 1) % self.num_tables
+        return entry
+
+    def _rehash(self, new_size: int, extra: tuple[Any, Any] | None = None) -> None:
+        """Reinsert all entries with fresh hash functions, growing if needed. O(nk) expected time, O(n) space."""
+        entries = [e for t in self.tables for e in t if e is not None] + self.stash
+        if extra is not None:
+            entries.append(extra)
+
+        while True:
+            self.rehash_count += 1
+            self.MAX = new_size
+            self.seeds = [self.rng.getrandbits(64) for _ in range(self.num_tables)]
+            self.tables = [[None for _ in range(self.MAX)] for _ in range(self.num_tables)]
+            self.stash = []
+            for entry in entries:
+                homeless = self._insert(entry)
+                if homeless is not None:
+                    if len(self.stash) == self.STASH_SIZE:
+                        break
+                    self.stash.append(homeless)
+            else:
+                return
+            # Fresh seeds were not enough; more room makes long kick chains much less likely
+            new_size *= 2
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete a key-value pair. O(k) time, O(1) space."""
+        table, slot = self._find(key)
+        if table != -1:
+            self.tables[table][slot] = None
+        elif slot != -1:
+            del self.stash[slot]
+        else:
+            raise KeyError(key)
+        self.length -= 1
+
+    def __len__(self) -> int:
+        """Return the number of entries. O(1) time, O(1) space."""
+        return self.length
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is present. O(k) time, O(1) space."""
+        return self._find(key) != (-1, -1)
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """Lazily yield all (key, value) pairs without copying the table. O(n) time, O(1) space."""
+        for table in self.tables:
+            for element in table:
+                if element is not None:
+                    yield element
+        yield from self.stash
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yield all keys. O(n) time, O(1) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(1) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys, like a dict. O(n) time, O(1) space."""
+        return self.keys()
+
+
+if __name__ == "__main__":
+    ht = HashTable(seed=42)
+
+    # Basic operations
+    ht["apple"] = 100
+    ht["banana"] = 200
+    ht["orange"] = 300
+
+    assert ht["apple"] == 100, "Should retrieve apple"
+    assert ht["banana"] == 200, "Should retrieve banana"
+    assert ht["orange"] == 300, "Should retrieve orange"
+
+    # Test KeyError for missing key
+    try:
+        _ = ht["grape"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test get() method
+    assert ht.get("grape") is None, "get() should return None for missing key"
+    assert ht.get("grape", "default") == "default", "get() should return default value"
+    assert ht.get("apple") == 100, "get() should return value for existing key"
+
+    # Test update
+    ht["apple"] = 150
+    assert ht["apple"] == 150, "Should update apple"
+    assert ht.length == 3, "Update should not add an entry"
+
+    # Test delete
+    del ht["banana"]
+    try:
+        _ = ht["banana"]
+        assert False, "Should raise KeyError for deleted key"
+    except KeyError:
+        pass  # Expected
+
+    try:
+        del ht["nonexistent"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test anagrams do not collide and non-string keys work
+    ht["ab"] = "first"
+    ht["ba"] = "second"
+    ht[(1, 2)] = "tuple"
+    assert ht["ab"] == "first" and ht["ba"] == "second", "Should retrieve both anagrams"
+    assert ht[(1, 2)] == "tuple", "Should retrieve tuple key"
+
+    # Test many keys with 2 and 3 tables: every key sits in one of its candidate slots or the stash
+    for num_tables in (2, 3):
+        big_ht = HashTable(num_tables=num_tables, seed=7)
+        for i in range(5000):
+            big_ht[f"key{i}"] = i
+        assert big_ht.length == 5000, "Should count 5000 entries"
+        assert len(big_ht.stash) <= HashTable.STASH_SIZE, "Stash should stay bounded"
+        total_slots = num_tables * big_ht.MAX
+        assert big_ht.length <= big_ht.max_load_factor * total_slots, "Load factor should stay bounded"
+        for i in range(5000):
+            key = f"key{i}"
+            in_table = any(
+                big_ht.tables[t][big_ht.get_hash(key, t)] == (key, i) for t in range(num_tables)
+            )
+            assert in_table or (key, i) in big_ht.stash, "Key should be in a candidate slot or stash"
+        for i in range(0, 5000, 2):
+            del big_ht[f"key{i}"]
+        assert all(big_ht.get(f"key{i}") == (None if i % 2 == 0 else i) for i in range(5000)), (
+            "Only odd keys should remain after deleting even keys"
+        )
+
+    # Test stash and rehash: with one slot per table, only two keys fit into the tables
+    tiny = HashTable(capacity=1, max_load_factor=3.0, seed=1)
+    for i in range(6):
+        tiny[i] = i
+    assert len(tiny.stash) == HashTable.STASH_SIZE, "Homeless keys should go to the stash"
+    assert tiny.rehash_count == 0, "No rehash should be needed while the stash has room"
+    assert all(tiny[i] == i for i in range(6)), "Stashed keys should be retrievable"
+    del tiny[3]
+    assert tiny.get(3) is None and len(tiny.stash) == 3, "Should delete from the stash"
+
+    tiny.max_load_factor = 10.0
+    tiny[3] = 3
+    tiny[6] = 6
+    assert tiny.rehash_count > 0, "A full stash should force a rehash"
+    assert tiny.MAX > 1, "Rehashing a hopeless layout should grow the tables"
+    assert all(tiny[i] == i for i in range(7)), "All keys should survive rehashing"
+
+    # Test invalid configuration
+    try:
+        HashTable(num_tables=1)
+        assert False, "Should raise ValueError for a single table"
+    except ValueError:
+        pass
+
+    # Test views, length and membership (including stashed entries)
+    assert len(tiny) == 7, "len() should count table and stash entries"
+    assert 6 in tiny and 7 not in tiny, "Membership should check tables and stash"
+    assert sorted(tiny) == sorted(tiny.keys()) == list(range(7)), "Iteration should yield every key once"
+    assert sorted(tiny.values()) == list(range(7)), "values() should yield every value once"
+    assert dict(tiny.items()) == {i: i for i in range(7)}, "items() should yield all pairs"
+
+    print("All tests passed!")
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterator
+
+# A thread-safe variant of the separate-chaining table (01b) for tables shared by many threads.
+# NOTE: Keys can be any hashable type; Python's built-in hash() is used.
+#
+# Lock striping: instead of one global lock, the buckets are split into s stripes, each guarded
+# by its own lock. A key always belongs to stripe hash(key) % s, and the bucket count is kept a
+# multiple of s, so a key stays in the same stripe across resizes. Writers to different stripes
+# never wait for each other.
+#
+# Optimistic reads: lookups take no lock at all. Every stripe has a version counter (a "seqlock")
+# that a writer increments before and after changing one of its buckets, so the version is odd
+# while a write is in progress. A reader notes the version, scans the bucket, and accepts the
+# result only if the version was even and has not changed meanwhile; otherwise it retries under
+# the stripe lock. Replacing list items and appending are atomic in CPython, so an unlucky read
+# can at worst be inconsistent (and is then discarded), never crash.
+#
+# Resizing: the resizing thread acquires all stripe locks (always in the same order, to avoid
+# deadlocks), fills a new bucket array and swaps it in. Writers wait during the resize, but
+# readers keep working lock-free on the old array, which no one modifies any more.
+
+
+class ConcurrentHashMap:
+    def __init__(
+        self,
+        capacity: int = 64,
+        num_stripes: int = 16,
+        max_load_factor: float = 0.75,
+    ) -> None:
+        if capacity < 1 or num_stripes < 1:
+            raise ValueError("Capacity and number of stripes must be positive")
+        self.num_stripes = num_stripes
+        self.max_load_factor = max_load_factor
+        # Round up to a multiple of num_stripes, see the note on lock striping above
+        self.MAX = -(-capacity // num_stripes) * num_stripes
+        self.arr = [[] for _ in range(self.MAX)]
+        self.locks = [threading.Lock() for _ in range(num_stripes)]
+        self.versions = [0] * num_stripes
+        # Entries per stripe; each counter is only modified under its stripe lock
+        self.counts = [0] * num_stripes
+        # Serializes resizers, so only one of several threads that see an overload rebuilds
+        self.resize_lock = threading.Lock()
+
+    def _lock_stripe(self, key: Any) -> tuple[list[list[tuple[Any, Any]]], int, int]:
+        """Acquire the stripe lock of a key; return (array, bucket index, stripe). O(k) time, O(1) space."""
+        h = hash(key)
+        stripe = h % self.num_stripes
+        self.locks[stripe].acquire()
+        # Holding any stripe lock blocks resizes, so the array cannot be swapped from now on
+        arr = self.arr
+        return arr, h % len(arr), stripe
+
+    def __setitem__(self, key: Any, val: Any) -> None:
+        """Insert or update a key-value pair. O(k) amortized, O(k + n) worst time, O(1) space."""
+        arr, h, stripe = self._lock_stripe(key)
+        try:
+            self.versions[stripe] += 1
+            bucket = arr[h]
+            for idx, element in enumerate(bucket):
+                if element[0] == key:
+                    bucket[idx] = (key, val)
+                    return
+            bucket.append((key, val))
+            self.counts[stripe] += 1
+            # Keys spread evenly over stripes, so one stripe's count estimates the total cheaply
+            overloaded = self.counts[stripe] * self.num_stripes > self.max_load_factor * len(arr)
+        finally:
+            self.versions[stripe] += 1
+            self.locks[stripe].release()
+
+        if overloaded:
+            self._resize(len(arr) * 2, arr)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Retrieve value by key, locking only if a writer interferes. O(k) avg, O(k + n) worst time, O(1) space."""
+        h = hash(key)
+        stripe = h % self.num_stripes
+
+        # Optimistic lock-free attempt
+        version = self.versions[stripe]
+        if version % 2 == 0:
+            arr = self.arr
+            found = False
+            val = None
+            for element in arr[h % len(arr)]:
+                if element[0] == key:
+                    found = True
+                    val = element[1]
+                    break
+            if self.versions[stripe] == version:
+                if found:
+                    return val
+                raise KeyError(key)
+
+        # A writer was active in this stripe; read again under the lock
+        arr, index, stripe = self._lock_stripe(key)
+        try:
+            for element in arr[index]:
+                if element[0] == key:
+                    return element[1]
+        finally:
+            self.locks[stripe].release()
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k) avg, O(k + n) worst time, O(1) space."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is present. O(k) avg, O(k + n) worst time, O(1) space."""
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete a key-value pair. O(k) avg, O(k + n) worst time, O(1) space."""
+        arr, h, stripe = self._lock_stripe(key)
+        try:
+            self.versions[stripe] += 1
+            bucket = arr[h]
+            for idx, element in enumerate(bucket):
+                if element[0] == key:
+                    del bucket[idx]
+                    self.counts[stripe] -= 1
+                    return
+        finally:
+            self.versions[stripe] += 1
+            self.locks[stripe].release()
+        raise KeyError(key)
+
+    def _resize(self, new_size: int, expected_arr: list[list[tuple[Any, Any]]]) -> None:
+        """Rebuild the bucket array while holding every stripe lock. O(nk) time, O(n) space."""
+        with self.resize_lock:
+            # Another thread may have resized while we were waiting
+            if self.arr is not expected_arr:
+                return
+            for lock in self.locks:
+                lock.acquire()
+            try:
+                new_arr = [[] for _ in range(new_size)]
+                for bucket in self.arr:
+                    for key, val in bucket:
+                        new_arr[hash(key) % new_size].append((key, val))
+                # Stripe membership does not change, so the per-stripe counts stay valid.
+                # No version bump: the old array is left untouched for concurrent readers.
+                self.arr = new_arr
+                self.MAX = new_size
+            finally:
+                for lock in reversed(self.locks):
+                    lock.release()
+
+    def __len__(self) -> int:
+        """Return the number of entries by summing the per-stripe counters. O(s) time, O(1) space."""
+        return sum(self.counts)
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """Lazily yield (key, value) pairs, weakly consistent under concurrent writes. O(n) time, O(1) space."""
+        # Like iterating Java's ConcurrentHashMap: never raises, but may miss concurrent changes
+        for bucket in self.arr:
+            yield from tuple(bucket)
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yield all keys. O(n) time, O(1) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(1) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys, like a dict. O(n) time, O(1) space."""
+        return self.keys()
+
+
+if __name__ == "__main__":
+    ht = ConcurrentHashMap()
+
+    # Basic operations
+    ht["apple"] = 100
+    ht["banana"] = 200
+    ht["orange"] = 300
+
+    assert ht["apple"] == 100, "Should retrieve apple"
+    assert ht["banana"] == 200, "Should retrieve banana"
+    assert ht["orange"] == 300, "Should retrieve orange"
+
+    # Test KeyError for missing key
+    try:
+        _ = ht["grape"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test get() method
+    assert ht.get("grape") is None, "get() should return None for missing key"
+    assert ht.get("grape", "default") == "default", "get() should return default value"
+    assert ht.get("apple") == 100, "get() should return value for existing key"
+
+    # Test update
+    ht["apple"] = 150
+    assert ht["apple"] == 150, "Should update apple"
+    assert len(ht) == 3, "Update should not add an entry"
+
+    # Test delete
+    del ht["banana"]
+    assert "banana" not in ht, "Deleted key should be missing"
+    try:
+        del ht["banana"]
+        assert False, "Should raise KeyError for deleted key"
+    except KeyError:
+        pass  # Expected
+
+    # Test capacity is rounded up to a multiple of the stripe count
+    assert ConcurrentHashMap(capacity=10, num_stripes=4).MAX == 12, "Capacity should be rounded up"
+
+    # Test concurrent writers and readers
+    shared = ConcurrentHashMap(capacity=8, num_stripes=8)
+    num_threads = 8
+    per_thread = 2000
+    errors = []
+
+    def writer(thread_id: int) -> None:
+        for i in range(per_thread):
+            shared[(thread_id, i)] = i
+        for i in range(0, per_thread, 2):
+            del shared[(thread_id, i)]
+
+    def reader(thread_id: int) -> None:
+        # Values only ever move from missing to i (and back to missing for even i)
+        for i in range(per_thread):
+            val = shared.get((thread_id, i))
+            if val is not None and val != i:
+                errors.append((thread_id, i, val))
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in range(num_threads)]
+    threads += [threading.Thread(target=reader, args=(t,)) for t in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, "Readers should never see a wrong value"
+    assert len(shared) == num_threads * per_thread // 2, "Should count the odd keys of every thread"
+    assert shared.MAX > 8, "Concurrent inserts should have resized the table"
+    assert all(
+        shared.get((t, i)) == (None if i % 2 == 0 else i)
+        for t in range(num_threads)
+        for i in range(per_thread)
+    ), "Only odd keys should remain"
+    expected_values = sorted(i for i in range(1, per_thread, 2) for _ in range(num_threads))
+    assert sorted(shared.values()) == expected_values, "values() should yield every value once"
+
+    # Test concurrent updates to the same keys from many threads
+    counters = ConcurrentHashMap()
+
+    def bump(thread_id: int) -> None:
+        for i in range(500):
+            counters[i % 10] = thread_id
+
+    threads = [threading.Thread(target=bump, args=(t,)) for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(counters) == 10 and set(counters) == set(range(10)), "Updates should never duplicate keys"
+
+    print("All tests passed!")
@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import time
+from typing import Any, Callable
+
+# A bounded cache combines the separate-chaining hash table (01b) with the doubly linked list
+# (02b): the hash table maps each key to its list node in O(1), and the list keeps the entries
+# in eviction order, so both lookups and evictions are O(1).
+# * LRU (least recently used): one list in access order. A hit moves the node to the tail,
+#   and the head is evicted.
+# * LFU (least frequently used): one list per access frequency, each in LRU order, plus the
+#   smallest frequency in use. A hit moves the node from list f to list f + 1, and the head of
+#   the list with the smallest frequency is evicted (the O(1) LFU scheme by Shah, Mitra and
+#   Matani, with the frequency lists looked up in a second hash table).
+# * TTL (time to live): one list in insertion order. With the same TTL for every entry this is
+#   also expiry order, so expired entries are always at the head and the head is evicted.
+# With a ttl, entries also expire under the LRU and LFU policies; they are then dropped lazily
+# when accessed (or by purge_expired()), so len() may include expired entries until then.
+# The cache is bounded by max_entries and/or max_bytes, where the size of an entry is measured
+# by size_func (default: sys.getsizeof of key and value, i.e. without nested objects).
+
+
+def load_module(file_name: str, module_name: str) -> Any:
+    """Load a sibling script (file names starting with digits cannot be imported). O(1) time."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), file_name)
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+separate_chaining = load_module("01b_HashTable_SeparateChaining.py", "hash_table_separate_chaining")
+doubly_linked_list = load_module("02b_DoublyLinkedList.py", "doubly_linked_list")
+
+
+# The list node of 02b plus the cache bookkeeping; its key lets an evicted node find its entry
+# in the hash table
+class Node(doubly_linked_list.Node):
+    __slots__ = ("key", "freq", "size", "expires_at")
+
+    def __init__(self, key: Any = None, data: Any = None) -> None:
+        super().__init__(data)
+        self.key = key
+        self.freq = 1
+        self.size = 0
+        self.expires_at = None
+
+
+# The list of 02b with the node-level O(1) operations a cache needs: the cache keeps every
+# entry's node in its hash table, so it never has to search the list for it
+class DoublyLinkedList(doubly_linked_list.DoublyLinkedList):
+    def append_node(self, node: Node) -> None:
+        """Link a node in at the tail. O(1) time, O(1) space."""
+        self._link_chain(self.tail, node, node, 1)
+
+    def remove_node(self, node: Node) -> None:
+        """Unlink a node of this list without searching for it. O(1) time, O(1) space."""
+        self._unlink_chain(node, node, 1)
+
+
+def new_table() -> Any:
+    """Create a 01b hash table for keys of any hashable type. O(1) time, O(1) space."""
+    return separate_chaining.HashTable(capacity=8, hash_func=hash)
+
+
+def default_size(key: Any, val: Any) -> int:
+    """Estimate the bytes of an entry (shallow). O(1) time, O(1) space."""
+    return sys.getsizeof(key) + sys.getsizeof(val)
+
+
+class BoundedCache:
+    POLICIES = ("lru", "lfu", "ttl")
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        policy: str = "lru",
+        ttl: float | None = None,
+        size_func: Callable[[Any, Any], int] = default_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries is None and max_bytes is None:
+            raise ValueError("Set max_entries and/or max_bytes")
+        if (max_entries is not None and max_entries < 1) or (max_bytes is not None and max_bytes < 1):
+            raise ValueError("Limits must be positive")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}, expected one of {self.POLICIES}")
+        if policy == "ttl" and ttl is None:
+            raise ValueError("The ttl policy needs a ttl")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.ttl = ttl
+        self.size_func = size_func
+        self.clock = clock
+
+        # key -> Node
+        self.table = new_table()
+        # LRU and TTL: a single list in eviction order
+        self.order = DoublyLinkedList()
+        # LFU: frequency -> DoublyLinkedList of the nodes with that frequency
+        self.freq_lists = new_table()
+        self.min_freq = 0
+
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _link(self, node: Node) -> None:
+        """Add a node to the eviction structure. O(1) time, O(1) space."""
+        if self.policy != "lfu":
+            self.order.append_node(node)
+            return
+        freq_list = self.freq_lists.get(node.freq)
+        if freq_list is None:
+            freq_list = DoublyLinkedList()
+            self.freq_lists[node.freq] = freq_list
+        freq_list.append_node(node)
+        if self.min_freq == 0 or node.freq < self.min_freq:
+            self.min_freq = node.freq
+
+    def _unlink(self, node: Node) -> None:
+        """Remove a node from the eviction structure. O(1) time, O(1) space."""
+        if self.policy != "lfu":
+            self.order.remove_node(node)
+            return
+        freq_list = self.freq_lists.get(node.freq)
+        freq_list.remove_node(node)
+        if freq_list.is_empty():
+            del self.freq_lists[node.freq]
+            if self.freq_lists.length == 0:
+                self.min_freq = 0
+
+    def _touch(self, node: Node) -> None:
+        """Record an access to a node. O(1) time, O(1) space."""
+        if self.policy == "lru":
+            self.order.remove_node(node)
+            self.order.append_node(node)
+        elif self.policy == "lfu":
+            old_freq = node.freq
+            self._unlink(node)
+            if self.min_freq == old_freq and self.freq_lists.get(old_freq) is None:
+                self.min_freq = old_freq + 1
+            node.freq += 1
+            self._link(node)
+        # TTL: the order is fixed by insertion time
+
+    def _remove(self, node: Node) -> None:
+        """Drop a node from the table and eviction structure. O(1) avg time, O(1) space."""
+        self._unlink(node)
+        del self.table[node.key]
+        self.current_bytes -= node.size
+
+    def _is_expired(self, node: Node, now: float) -> bool:
+        """Check whether a node's TTL has run out. O(1) time, O(1) space."""
+        return node.expires_at is not None and node.expires_at <= now
+
+    def _victim(self) -> Node:
+        """Return the node to evict next. O(1) time (O(f) after a delete empties the min list), O(1) space."""
+        if self.policy != "lfu":
+            return self.order.head
+        freq_list = self.freq_lists.get(self.min_freq)
+        if freq_list is None:
+            # Only after a delete or expiry emptied the min-frequency list: find the next one
+            self.min_freq = min(self.freq_lists.keys())
+            freq_list = self.freq_lists.get(self.min_freq)
+        return freq_list.head
+
+    def _make_room(self, extra_bytes: int) -> None:
+        """Evict until one more entry of extra_bytes fits. O(1) amortized time, O(1) space."""
+        if self.policy == "ttl":
+            self.purge_expired()
+        while self.table.length > 0 and (
+            (self.max_entries is not None and self.table.length + 1 > self.max_entries)
+            or (self.max_bytes is not None and self.current_bytes + extra_bytes > self.max_bytes)
+        ):
+            self._remove(self._victim())
+            self.evictions += 1
+
+    def __setitem__(self, key: Any, val: Any) -> None:
+        """Insert or update an entry, evicting others if needed. O(1) amortized avg time, O(1) space."""
+        size = self.size_func(key, val) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise ValueError("Entry is larger than max_bytes")
+
+        freq = 0
+        node = self.table.get(key)
+        if node is not None:
+            # Re-insert the updated entry; LFU keeps counting its accesses
+            freq = node.freq
+            self._remove(node)
+
+        self._make_room(size)
+        node = Node(key, val)
+        node.size = size
+        node.freq = freq + 1
+        if self.ttl is not None:
+            node.expires_at = self.clock() + self.ttl
+        self.table[key] = node
+        self._link(node)
+        self.current_bytes += size
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Retrieve a value and record the access, returning default if missing. O(1) avg time, O(1) space."""
+        node = self.table.get(key)
+        if node is not None and self._is_expired(node, self.clock()):
+            self._remove(node)
+            self.expirations += 1
+            node = None
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.data
+
+    def __getitem__(self, key: Any) -> Any:
+        """Retrieve a value and record the access. O(1) avg time, O(1) space."""
+        missing = object()
+        val = self.get(key, missing)
+        if val is missing:
+            raise KeyError(key)
+        return val
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete an entry. O(1) avg time, O(1) space."""
+        node = self.table.get(key)
+        if node is None:
+            raise KeyError(key)
+        self._remove(node)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check for a live entry without counting an access. O(1) avg time, O(1) space."""
+        node = self.table.get(key)
+        return node is not None and not self._is_expired(node, self.clock())
+
+    def __len__(self) -> int:
+        """Return the number of entries (including expired ones not yet dropped). O(1) time, O(1) space."""
+        return self.table.length
+
+    def purge_expired(self) -> int:
+        """Drop all expired entries and return their number. O(expired) for ttl, O(n) otherwise, O(n) space."""
+        if self.ttl is None:
+            return 0
+        now = self.clock()
+        if self.policy == "ttl":
+            # Insertion order is expiry order, so the expired entries form a prefix
+            expired = []
+            node = self.order.head
+            while node is not None and self._is_expired(node, now):
+                expired.append(node)
+                node = node.next
+        elif self.policy == "lru":
+            expired = []
+            node = self.order.head
+            while node is not None:
+                if self._is_expired(node, now):
+                    expired.append(node)
+                node = node.next
+        else:
+            expired = [node for node in self.table.values() if self._is_expired(node, now)]
+        for node in expired:
+            self._remove(node)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss/eviction counters and current usage. O(1) time, O(1) space."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": self.table.length,
+            "bytes": self.current_bytes,
+        }
+
+
+if __name__ == "__main__":
+    # Test LRU eviction
+    lru = BoundedCache(max_entries=3)
+    lru["a"] = 1
+    lru["b"] = 2
+    lru["c"] = 3
+    assert lru["a"] == 1, "Should retrieve a (and mark it as recently used)"
+    lru["d"] = 4  # Evicts b, the least recently used
+    assert "b" not in lru, "b should be evicted"
+    assert lru.get("a") == 1 and lru.get("c") == 3 and lru.get("d") == 4, "Others should remain"
+    assert len(lru) == 3, "Cache should hold 3 entries"
+    lru["c"] = 30  # Update makes c the most recently used
+    lru["e"] = 5  # Evicts a
+    assert "a" not in lru and lru["c"] == 30, "Update should refresh recency"
+
+    # Test KeyError and counters
+    try:
+        _ = lru["missing"]
+        assert False, "Should raise KeyError for missing key"
+    except KeyError:
+        pass  # Expected
+    stats = lru.stats()
+    assert stats["evictions"] == 2, "Should count 2 evictions"
+    assert stats["hits"] == 5 and stats["misses"] == 1, "Should count hits and misses"
+
+    # Test delete
+    del lru["c"]
+    assert "c" not in lru and len(lru) == 2, "Should delete c"
+    try:
+        del lru["c"]
+        assert False, "Should raise KeyError for deleted key"
+    except KeyError:
+        pass  # Expected
+
+    # Test LFU eviction
+    lfu = BoundedCache(max_entries=3, policy="lfu")
+    lfu["a"] = 1
+    lfu["b"] = 2
+    lfu["c"] = 3
+    for _ in range(3):
+        lfu.get("a")
+    lfu.get("b")
+    lfu["d"] = 4  # Evicts c, the least frequently used
+    assert "c" not in lfu and "a" in lfu and "b" in lfu, "c should be evicted"
+    lfu.get("d")
+    lfu["e"] = 5  # b and d were both used twice; b is the least recently used of them
+    assert "b" not in lfu and "d" in lfu, "Ties should be broken by recency"
+
+    lfu["f"] = 6  # New entries start at frequency 1, so f goes before the older d
+    assert "e" not in lfu and "d" in lfu, "Newest entry should be the least frequently used"
+
+    # Deleting the only entry of the min frequency must not break eviction
+    lfu_sized = BoundedCache(max_bytes=10, policy="lfu", size_func=lambda key, val: len(val))
+    lfu_sized["p"] = "pppp"
+    lfu_sized["q"] = "qqqq"
+    lfu_sized.get("q")
+    del lfu_sized["p"]  # The min frequency 1 has no entries left
+    lfu_sized["r"] = "r" * 10
+    assert "q" not in lfu_sized and lfu_sized["r"] == "r" * 10, "Should find the next frequency to evict"
+
+    # Test TTL expiry with a fake clock
+    now = [0.0]
+    ttl = BoundedCache(max_entries=10, policy="ttl", ttl=5.0, clock=lambda: now[0])
+    ttl["a"] = 1
+    now[0] = 2.0
+    ttl["b"] = 2
+    now[0] = 5.0
+    assert ttl.get("a") is None, "a should have expired at t=5"
+    assert ttl["b"] == 2, "b should live until t=7"
+    now[0] = 8.0
+    assert "b" not in ttl, "b should have expired at t=7"
+    ttl["c"] = 3  # Inserting purges the expired prefix
+    assert len(ttl) == 1 and ttl.stats()["expirations"] == 2, "Expired entries should be dropped"
+
+    # TTL policy evicts the oldest entry when full
+    small_ttl = BoundedCache(max_entries=2, policy="ttl", ttl=100.0, clock=lambda: now[0])
+    small_ttl["x"] = 1
+    small_ttl["y"] = 2
+    small_ttl.get("x")
+    small_ttl["z"] = 3
+    assert "x" not in small_ttl and "y" in small_ttl, "Oldest entry should be evicted"
+
+    # TTL also applies to the LRU and LFU policies
+    for policy in ("lru", "lfu"):
+        now[0] = 0.0
+        expiring = BoundedCache(max_entries=10, policy=policy, ttl=1.0, clock=lambda: now[0])
+        for i in range(5):
+            expiring[i] = i
+        now[0] = 2.0
+        assert expiring.purge_expired() == 5, "All entries should expire"
+        assert len(expiring) == 0, "purge_expired() should drop them"
+
+    # Test byte budget
+    sized = BoundedCache(max_bytes=100, size_func=lambda key, val: len(val))
+    sized["a"] = "x" * 40
+    sized["b"] = "x" * 40
+    sized["c"] = "x" * 40  # Evicts a to stay within 100 bytes
+    assert "a" not in sized and sized.stats()["bytes"] == 80, "Should stay within the byte budget"
+    sized["b"] = "x" * 10
+    assert sized.stats()["bytes"] == 50, "Update should adjust the byte count"
+    try:
+        sized["big"] = "x" * 101
+        assert False, "Should raise ValueError for an entry larger than max_bytes"
+    except ValueError:
+        pass
+
+    # Test many operations keep the structures consistent
+    big = BoundedCache(max_entries=100, policy="lfu")
+    for i in range(10000):
+        big[i % 250] = i
+        big.get(i % 7)
+    assert len(big) == 100, "Cache should stay at max_entries"
+    assert all(big.get(i) is not None for i in range(7)), "Hot keys should survive under LFU"
+
+    # Test invalid configuration
+    invalid = ({}, {"max_entries": 0}, {"max_entries": 1, "policy": "fifo"}, {"max_entries": 1, "policy": "ttl"})
+    for kwargs in invalid:
+        try:
+            BoundedCache(**kwargs)
+            assert False, f"Should raise ValueError for {kwargs}"
+        except ValueError:
+            pass
+
+    print("All tests passed!")
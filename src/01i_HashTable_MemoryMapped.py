@@ -0,0 +1,610 @@
+from __future__ import annotations
+
+import importlib.util
+import mmap
+import os
+import pickle
+import struct
+import threading
+import zlib
+from typing import Any, BinaryIO, Iterator
+
+# A persistent variant of the linear-probing table (01c) for key sets that do not fit into RAM.
+# The table lives in two files next to each other:
+# * <path>.log: an append-only value log. Every insert, update and delete appends one record
+#   (CRC32, key length, value length, flags, UTF-8 key, pickled value). Records are never
+#   modified, so the log is the single source of truth.
+# * <path>.idx: the slot array, accessed through mmap. A header is followed by fixed-width
+#   16-byte slots holding a 64-bit key hash and the log offset of the key's latest record
+#   (0 for an empty slot, -1 for a tombstone). Only the pages that are touched get loaded, so
+#   opening a cleanly closed table is near-instant no matter how large it is, and the OS page
+#   cache decides what stays in memory.
+# A lookup probes the slots like 01c, but only compares the stored hashes; the key itself is
+# read from the log only when the hashes match.
+#
+# NOTE: Keys must be strings. Python's built-in hash() is salted per process (see 01d), so the
+# slots store the 64-bit FNV-1a hash instead, which stays the same across restarts.
+#
+# Crash safety: a write first appends its record to the log and only then updates the slot
+# (write-ahead), so the log always contains every acknowledged write. The index header carries
+# a "clean" flag that is cleared while the table is open and set by close(), together with the
+# log size and a random generation number shared with the log header. If any of them does not
+# match on open (crash, torn write, foreign index), the index is rebuilt by replaying the log,
+# and a torn record at the end of the log (detected by its CRC) is cut off.
+# With sync=True every write is also fsync'ed, otherwise a crash may lose the last writes that
+# were still in the OS buffers (but never corrupts the table).
+#
+# Compaction: updates and deletes leave dead records behind, so compact() copies the live
+# records into a fresh log and index and swaps the files in. With background=True the copy runs
+# in a thread while the table stays usable: records written meanwhile are replayed from the end
+# of the old log before the swap, which is the only part that blocks other operations.
+
+INDEX_MAGIC = b"HTIDX001"
+LOG_MAGIC = b"HTLOG001"
+# Magic, capacity, length, tombstones, log size, generation, clean flag
+INDEX_HEADER = struct.Struct("<8sQQQQQB7x")
+# Key hash and log offset of the key's record
+SLOT = struct.Struct("<Qq")
+# Magic, generation
+LOG_HEADER = struct.Struct("<8sQ")
+# CRC32 of everything after it, key length, value length, flags
+RECORD_HEADER = struct.Struct("<IIIB")
+
+EMPTY = 0
+TOMBSTONE = -1
+PUT = 0
+DELETE = 1
+
+
+def load_hash_functions() -> Any:
+    """Load the 01d module (file names starting with digits cannot be imported). O(1) time."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "01d_HashFunctions.py")
+    spec = importlib.util.spec_from_file_location("hash_functions", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# The slots store the 64-bit FNV-1a hash of the UTF-8 encoded key
+fnv1a_hash_bytes = load_hash_functions().fnv1a_hash_bytes
+
+
+def encode_record(flags: int, key_bytes: bytes, val_bytes: bytes) -> bytes:
+    """Serialize one log record including its checksum. O(k + v) time, O(k + v) space."""
+    body = RECORD_HEADER.pack(0, len(key_bytes), len(val_bytes), flags)[4:] + key_bytes + val_bytes
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+def read_record(file: BinaryIO, offset: int) -> tuple[int, bytes, bytes, int] | None:
+    """Return (flags, key, value, next offset) of a record, or None if torn. O(k + v) time, O(k + v) space."""
+    file.seek(offset)
+    header = file.read(RECORD_HEADER.size)
+    if len(header) < RECORD_HEADER.size:
+        return None
+    crc, key_len, val_len, flags = RECORD_HEADER.unpack(header)
+    payload = file.read(key_len + val_len)
+    if len(payload) < key_len + val_len or zlib.crc32(header[4:] + payload) != crc:
+        return None
+    return flags, payload[:key_len], payload[key_len:], offset + RECORD_HEADER.size + key_len + val_len
+
+
+def create_index_file(path: str, capacity: int) -> tuple[BinaryIO, mmap.mmap]:
+    """Create a zero-filled index file (all slots empty) and map it. O(capacity) time, O(1) space."""
+    file = open(path, "w+b")
+    # A zero offset marks an empty slot, so a sparse zero-filled file is an empty table
+    file.truncate(INDEX_HEADER.size + capacity * SLOT.size)
+    return file, mmap.mmap(file.fileno(), 0)
+
+
+class MappedHashTable:
+    MAX_LOAD_FACTOR = 0.5
+
+    def __init__(self, path: str, capacity: int = 1024, sync: bool = False) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.path = path
+        self.index_path = path + ".idx"
+        self.log_path = path + ".log"
+        self.sync = sync
+        # Reentrant, since compaction and resizing run inside other locked operations
+        self.lock = threading.RLock()
+        self.compaction_thread = None
+        self.compacting = False
+        self.compaction_count = 0
+        self.closed = False
+        # True if opening had to replay the log (for tests and monitoring)
+        self.rebuilt = False
+
+        if os.path.exists(self.log_path):
+            self._open_log()
+            if not self._open_index():
+                self._rebuild_index(capacity)
+                self.rebuilt = True
+        else:
+            generation = int.from_bytes(os.urandom(8), "little")
+            with open(self.log_path, "wb") as file:
+                file.write(LOG_HEADER.pack(LOG_MAGIC, generation))
+                file.flush()
+                os.fsync(file.fileno())
+            self._open_log()
+            self.index_file, self.index_map = create_index_file(self.index_path, capacity)
+            self.MAX = capacity
+            self.length = 0
+            self.tombstone_count = 0
+        # Until close() sets it again, a crash leaves the flag cleared and forces a rebuild
+        self._write_header(clean=False)
+        self.index_map.flush()
+
+    def _open_log(self) -> None:
+        """Open the value log and read its header. O(1) time, O(1) space."""
+        self.log = open(self.log_path, "r+b")
+        magic, self.generation = LOG_HEADER.unpack(self.log.read(LOG_HEADER.size))
+        if magic != LOG_MAGIC:
+            self.log.close()
+            raise ValueError(f"{self.log_path} is not a hash table log")
+        self.log_size = os.path.getsize(self.log_path)
+
+    def _open_index(self) -> bool:
+        """Map the index file if it matches the log, else return False. O(1) time, O(1) space."""
+        if not os.path.exists(self.index_path) or os.path.getsize(self.index_path) < INDEX_HEADER.size:
+            return False
+        file = open(self.index_path, "r+b")
+        index_map = mmap.mmap(file.fileno(), 0)
+        magic, capacity, length, tombstones, log_size, generation, clean = INDEX_HEADER.unpack_from(index_map)
+        if (
+            magic != INDEX_MAGIC
+            or not clean
+            or generation != self.generation
+            or log_size != self.log_size
+            or len(index_map) != INDEX_HEADER.size + capacity * SLOT.size
+        ):
+            index_map.close()
+            file.close()
+            return False
+        self.index_file, self.index_map = file, index_map
+        self.MAX = capacity
+        self.length = length
+        self.tombstone_count = tombstones
+        return True
+
+    def _rebuild_index(self, capacity: int) -> None:
+        """Recreate the index by replaying the log, cutting off a torn tail. O(r) avg time, O(1) space."""
+        self.index_file, self.index_map = create_index_file(self.index_path, capacity)
+        self.MAX = capacity
+        self.length = 0
+        self.tombstone_count = 0
+
+        offset = LOG_HEADER.size
+        while True:
+            record = read_record(self.log, offset)
+            if record is None:
+                break
+            flags, key_bytes, _, next_offset = record
+            if flags == PUT:
+                self._index_put(key_bytes, fnv1a_hash_bytes(key_bytes), offset)
+            else:
+                self._index_delete(key_bytes, fnv1a_hash_bytes(key_bytes))
+            offset = next_offset
+
+        if offset < self.log_size:
+            # Whatever follows the last complete record was never acknowledged
+            self.log.truncate(offset)
+            self.log_size = offset
+
+    def _write_header(self, clean: bool) -> None:
+        """Store the counters and the clean flag in the index header. O(1) time, O(1) space."""
+        INDEX_HEADER.pack_into(
+            self.index_map,
+            0,
+            INDEX_MAGIC,
+            self.MAX,
+            self.length,
+            self.tombstone_count,
+            self.log_size,
+            self.generation,
+            clean,
+        )
+
+    def _slot(self, index: int) -> tuple[int, int]:
+        """Return (hash, offset) of a slot. O(1) time, O(1) space."""
+        return SLOT.unpack_from(self.index_map, INDEX_HEADER.size + index * SLOT.size)
+
+    def _set_slot(self, index: int, h: int, offset: int) -> None:
+        """Overwrite a slot. O(1) time, O(1) space."""
+        SLOT.pack_into(self.index_map, INDEX_HEADER.size + index * SLOT.size, h, offset)
+
+    def _read_key(self, offset: int) -> bytes:
+        """Read only the key of a log record. O(k) time, O(k) space."""
+        self.log.seek(offset)
+        _, key_len, _, _ = RECORD_HEADER.unpack(self.log.read(RECORD_HEADER.size))
+        return self.log.read(key_len)
+
+    def _find_slot(self, key_bytes: bytes, h: int) -> tuple[int, bool]:
+        """Return (slot of key, True) or (slot to insert at, False). O(k) avg, O(k + n) worst time, O(1) space."""
+        index = h % self.MAX
+        free = -1
+        for _ in range(self.MAX):
+            slot_hash, offset = self._slot(index)
+            if offset == EMPTY:
+                return (index if free == -1 else free), False
+            if offset == TOMBSTONE:
+                if free == -1:
+                    free = index
+            elif slot_hash == h and self._read_key(offset) == key_bytes:
+                return index, True
+            index = (index + 1) % self.MAX
+        return free, False
+
+    def _append(self, flags: int, key_bytes: bytes, val_bytes: bytes) -> int:
+        """Append a record to the log and return its offset. O(k + v) time, O(k + v) space."""
+        offset = self.log_size
+        record = encode_record(flags, key_bytes, val_bytes)
+        self.log.seek(offset)
+        self.log.write(record)
+        # Flush to the OS on every write, so readers on other handles (compaction) see it
+        self.log.flush()
+        if self.sync:
+            os.fsync(self.log.fileno())
+        self.log_size += len(record)
+        return offset
+
+    def _index_put(self, key_bytes: bytes, h: int, offset: int) -> None:
+        """Point the key's slot at a log offset, growing if needed. O(k) amortized avg time, O(1) space."""
+        index, found = self._find_slot(key_bytes, h)
+        if not found:
+            if self._slot(index)[1] == TOMBSTONE:
+                self.tombstone_count -= 1
+            self.length += 1
+        self._set_slot(index, h, offset)
+
+        if self.length + self.tombstone_count > self.MAX_LOAD_FACTOR * self.MAX:
+            # Grow if live entries fill half of the limit, otherwise just drop the tombstones
+            grow = self.length > self.MAX_LOAD_FACTOR * self.MAX / 2
+            self._resize(self.MAX * 2 if grow else self.MAX)
+
+    def _index_delete(self, key_bytes: bytes, h: int) -> bool:
+        """Turn the key's slot into a tombstone; return False if missing. O(k) avg time, O(1) space."""
+        index, found = self._find_slot(key_bytes, h)
+        if not found:
+            return False
+        self._set_slot(index, h, TOMBSTONE)
+        self.length -= 1
+        self.tombstone_count += 1
+        return True
+
+    def _resize(self, new_size: int) -> None:
+        """Copy the live slots into a new index file and swap it in. O(n) time, O(1) space."""
+        tmp_path = self.index_path + ".tmp"
+        file, new_map = create_index_file(tmp_path, new_size)
+        for index in range(self.MAX):
+            h, offset = self._slot(index)
+            if offset > 0:
+                # Keys are unique, so only an empty slot has to be found (no key comparisons)
+                new_index = h % new_size
+                while SLOT.unpack_from(new_map, INDEX_HEADER.size + new_index * SLOT.size)[1] != EMPTY:
+                    new_index = (new_index + 1) % new_size
+                SLOT.pack_into(new_map, INDEX_HEADER.size + new_index * SLOT.size, h, offset)
+
+        self.index_map.close()
+        self.index_file.close()
+        os.replace(tmp_path, self.index_path)
+        self.index_file, self.index_map = file, new_map
+        self.MAX = new_size
+        self.tombstone_count = 0
+        self._write_header(clean=False)
+
+    def _put_raw(self, key_bytes: bytes, val_bytes: bytes) -> None:
+        """Insert or update an already serialized entry. O(k + v) amortized avg time, O(k + v) space."""
+        with self.lock:
+            # Write-ahead: the record is in the log before any slot points at it
+            offset = self._append(PUT, key_bytes, val_bytes)
+            self._index_put(key_bytes, fnv1a_hash_bytes(key_bytes), offset)
+
+    def _delete_raw(self, key_bytes: bytes) -> bool:
+        """Delete a serialized key; return False if missing. O(k) avg time, O(k) space."""
+        with self.lock:
+            h = fnv1a_hash_bytes(key_bytes)
+            _, found = self._find_slot(key_bytes, h)
+            if not found:
+                return False
+            self._append(DELETE, key_bytes, b"")
+            return self._index_delete(key_bytes, h)
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        """Insert or update a key-value pair. O(k + v) amortized avg, O(k + n) worst time, O(k + v) space."""
+        self._put_raw(key.encode(), pickle.dumps(val))
+
+    def __getitem__(self, key: str) -> Any:
+        """Retrieve value by key. O(k + v) avg, O(k + n) worst time, O(v) space."""
+        key_bytes = key.encode()
+        with self.lock:
+            index, found = self._find_slot(key_bytes, fnv1a_hash_bytes(key_bytes))
+            if not found:
+                raise KeyError(key)
+            _, _, val_bytes, _ = read_record(self.log, self._slot(index)[1])
+        return pickle.loads(val_bytes)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k + v) avg, O(k + n) worst time, O(v) space."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a key-value pair by logging a delete record. O(k) avg, O(k + n) worst time, O(k) space."""
+        if not self._delete_raw(key.encode()):
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is present. O(k) avg, O(k + n) worst time, O(k) space."""
+        key_bytes = key.encode()
+        with self.lock:
+            return self._find_slot(key_bytes, fnv1a_hash_bytes(key_bytes))[1]
+
+    def __len__(self) -> int:
+        """Return the number of entries. O(1) time, O(1) space."""
+        return self.length
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Lazily yield all (key, value) pairs, weakly consistent under writes. O(n) time, O(v) space."""
+        index = 0
+        while True:
+            with self.lock:
+                if index >= self.MAX:
+                    return
+                offset = self._slot(index)[1]
+                record = read_record(self.log, offset) if offset > 0 else None
+            index += 1
+            if record is not None:
+                yield record[1].decode(), pickle.loads(record[2])
+
+    def keys(self) -> Iterator[str]:
+        """Lazily yield all keys. O(n) time, O(v) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(v) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys, like a dict. O(n) time, O(v) space."""
+        return self.keys()
+
+    def dead_bytes(self) -> int:
+        """Return the log bytes not used by live records (reclaimable by compact()). O(n) time, O(1) space."""
+        with self.lock:
+            live = LOG_HEADER.size
+            for index in range(self.MAX):
+                offset = self._slot(index)[1]
+                if offset > 0:
+                    self.log.seek(offset)
+                    _, key_len, val_len, _ = RECORD_HEADER.unpack(self.log.read(RECORD_HEADER.size))
+                    live += RECORD_HEADER.size + key_len + val_len
+            return self.log_size - live
+
+    def compact(self, background: bool = False) -> threading.Thread | None:
+        """Rewrite the log with live records only; return the background thread. O(r) time, O(1) space."""
+        with self.lock:
+            if self.compacting:
+                raise RuntimeError("A compaction is already running")
+            self.compacting = True
+            snapshot_end = self.log_size
+        if not background:
+            self._compact(snapshot_end)
+            return None
+        self.compaction_thread = threading.Thread(target=self._compact, args=(snapshot_end,), daemon=True)
+        self.compaction_thread.start()
+        return self.compaction_thread
+
+    def _compact(self, snapshot_end: int) -> None:
+        """Copy live records into new files, replay newer records and swap the files in. O(r) time, O(1) space."""
+        target_path = self.path + ".compact"
+        try:
+            # Leftovers of a compaction that crashed are incomplete, start from scratch
+            for leftover in (target_path + ".idx", target_path + ".log"):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            target = MappedHashTable(target_path, capacity=max(8, 2 * self.length), sync=False)
+
+            # Phase 1 (concurrent): copy every record that is still the latest one for its key.
+            # A separate handle keeps the shared file position of self.log out of the way.
+            with open(self.log_path, "rb") as reader:
+                offset = LOG_HEADER.size
+                while offset < snapshot_end:
+                    flags, key_bytes, val_bytes, next_offset = read_record(reader, offset)
+                    if flags == PUT:
+                        with self.lock:
+                            index, found = self._find_slot(key_bytes, fnv1a_hash_bytes(key_bytes))
+                            live = found and self._slot(index)[1] == offset
+                        if live:
+                            target._put_raw(key_bytes, val_bytes)
+                    offset = next_offset
+
+                # Phase 2 (blocking): replay what was written meanwhile, then swap the files
+                with self.lock:
+                    while offset < self.log_size:
+                        flags, key_bytes, val_bytes, offset = read_record(reader, offset)
+                        if flags == PUT:
+                            target._put_raw(key_bytes, val_bytes)
+                        else:
+                            target._delete_raw(key_bytes)
+                    target.close()
+
+                    self.index_map.close()
+                    self.index_file.close()
+                    self.log.close()
+                    # A crash between the two renames leaves index and log with different
+                    # generations, so the next open rebuilds the index from the new log
+                    os.replace(target.log_path, self.log_path)
+                    os.replace(target.index_path, self.index_path)
+                    self._open_log()
+                    self._open_index()
+                    self._write_header(clean=False)
+                    self.index_map.flush()
+                    self.compaction_count += 1
+        finally:
+            self.compacting = False
+
+    def flush(self) -> None:
+        """Write the header and force log and index to disk. O(d) time for d dirty pages, O(1) space."""
+        with self.lock:
+            self.log.flush()
+            os.fsync(self.log.fileno())
+            self._write_header(clean=False)
+            self.index_map.flush()
+
+    def close(self) -> None:
+        """Wait for a background compaction, flush and mark the index clean. O(d) time, O(1) space."""
+        if self.closed:
+            return
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+        with self.lock:
+            self.flush()
+            self._write_header(clean=True)
+            self.index_map.flush()
+            self.index_map.close()
+            self.index_file.close()
+            self.log.close()
+            self.closed = True
+
+    def __enter__(self) -> MappedHashTable:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "table")
+        ht = MappedHashTable(path, capacity=8)
+
+        # Basic operations
+        ht["apple"] = 100
+        ht["banana"] = 200
+        ht["orange"] = 300
+
+        assert ht["apple"] == 100, "Should retrieve apple"
+        assert ht["banana"] == 200, "Should retrieve banana"
+        assert ht["orange"] == 300, "Should retrieve orange"
+
+        # Test KeyError for missing key
+        try:
+            _ = ht["grape"]
+            assert False, "Should raise KeyError for non-existent key"
+        except KeyError:
+            pass  # Expected
+
+        # Test get() method
+        assert ht.get("grape") is None, "get() should return None for missing key"
+        assert ht.get("grape", "default") == "default", "get() should return default value"
+        assert ht.get("apple") == 100, "get() should return value for existing key"
+
+        # Test update
+        ht["apple"] = 150
+        assert ht["apple"] == 150, "Should update apple"
+        assert len(ht) == 3, "Update should not add an entry"
+
+        # Test delete
+        del ht["banana"]
+        assert "banana" not in ht, "Deleted key should be missing"
+        try:
+            del ht["banana"]
+            assert False, "Should raise KeyError for deleted key"
+        except KeyError:
+            pass  # Expected
+
+        # Test anagrams, arbitrary values and growth of the slot file
+        ht["ab"] = {"nested": [1, 2]}
+        ht["ba"] = "second"
+        for i in range(2000):
+            ht[f"key{i}"] = i
+        assert ht["ab"] == {"nested": [1, 2]} and ht["ba"] == "second", "Should store any picklable value"
+        assert ht.MAX > 8 and len(ht) == 2004, "Slot file should have grown"
+        assert ht.length <= ht.MAX_LOAD_FACTOR * ht.MAX, "Load factor should stay bounded"
+        ht.close()
+
+        # Test warm start: a cleanly closed table is mapped as is
+        with MappedHashTable(path) as reopened:
+            assert not reopened.rebuilt, "Clean index should not be rebuilt"
+            assert len(reopened) == 2004 and reopened["key1999"] == 1999, "Entries should persist"
+            assert reopened["apple"] == 150 and "banana" not in reopened, "Updates and deletes should persist"
+            assert dict(reopened.items()) == {
+                "apple": 150,
+                "orange": 300,
+                "ab": {"nested": [1, 2]},
+                "ba": "second",
+                **{f"key{i}": i for i in range(2000)},
+            }, "items() should yield all pairs"
+
+        # Test crash recovery: the index is never marked clean, so it is rebuilt from the log
+        crashed = MappedHashTable(path)
+        crashed["key0"] = "after restart"
+        del crashed["key1"]
+        crashed.log.flush()
+        crashed.index_map.close()
+        crashed.index_file.close()
+        crashed.log.close()
+        with MappedHashTable(path) as recovered:
+            assert recovered.rebuilt, "Unclean index should be rebuilt"
+            assert recovered["key0"] == "after restart" and "key1" not in recovered, "Log should be replayed"
+            assert len(recovered) == 2003, "Rebuilt index should count live entries"
+
+        # Test a torn record at the end of the log is cut off
+        with open(path + ".log", "ab") as log_file:
+            log_file.write(encode_record(PUT, b"torn", pickle.dumps(1))[:-3])
+        with MappedHashTable(path) as recovered:
+            assert recovered.rebuilt and "torn" not in recovered, "Torn record should be ignored"
+            assert recovered.log_size == os.path.getsize(path + ".log"), "Torn tail should be truncated"
+            assert recovered["key1999"] == 1999, "Earlier records should survive"
+
+        # Test foreground compaction reclaims dead records
+        with MappedHashTable(path) as table:
+            for i in range(2, 2000):
+                table[f"key{i}"] = -i
+            size_before = table.log_size
+            assert table.dead_bytes() > 0, "Overwrites should leave dead records"
+            table.compact()
+            assert table.dead_bytes() == 0 and table.log_size < size_before, "Compaction should shrink the log"
+            assert table.compaction_count == 1, "Should count the compaction"
+            assert all(table[f"key{i}"] == -i for i in range(2, 2000)), "Values should survive compaction"
+            assert "key1" not in table and len(table) == 2003, "Deletes should survive compaction"
+        with MappedHashTable(path) as reopened:
+            assert not reopened.rebuilt and reopened["key1999"] == -1999, "Compacted table should reopen cleanly"
+
+        # Test background compaction while writing
+        with MappedHashTable(path) as table:
+            for i in range(500):
+                table[f"key{i}"] = i  # Also brings back key1
+            thread = table.compact(background=True)
+            for i in range(500, 1000):
+                table[f"key{i}"] = i
+            del table["key2"]
+            table["new"] = "during compaction"
+            thread.join()
+            assert table.compaction_count == 1, "Background compaction should finish"
+            assert all(table[f"key{i}"] == i for i in range(3, 1000)), "No write should be lost"
+            assert "key2" not in table and table["new"] == "during compaction", "Concurrent changes should persist"
+            assert len(table) == 2004, "Length should match after the swap"
+
+        # Test invalid configuration and foreign files
+        try:
+            MappedHashTable(os.path.join(tmp_dir, "other"), capacity=0)
+            assert False, "Should raise ValueError for non-positive capacity"
+        except ValueError:
+            pass
+        with open(os.path.join(tmp_dir, "foreign.log"), "wb") as foreign:
+            foreign.write(b"NOTALOG!" + bytes(8))
+        try:
+            MappedHashTable(os.path.join(tmp_dir, "foreign"))
+            assert False, "Should raise ValueError for a file that is not a log"
+        except ValueError:
+            pass
+
+    print("All tests passed!")
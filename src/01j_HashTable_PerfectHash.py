@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Any, Iterable, Iterator
+
+# For a key set that never changes (built once, read very often), a minimal perfect hash
+# function maps the n keys to the slots 0..n-1 without any collision. The table then needs
+# exactly n slots (no empty slots, no chains, no probe sequences) and every lookup is a single
+# array access plus one key comparison (to reject keys that were not in the set).
+#
+# This file uses the CHD ("compress, hash and displace") construction by Belazzougui, Botelho
+# and Dietzfelbinger:
+# 1. The keys are split into r = n / avg_bucket_size small buckets by a first hash function.
+# 2. The buckets are placed largest first. For each bucket, the displacement d = 0, 1, 2, ...
+#    is tried until the second hash function h(d, key) sends all keys of the bucket to distinct
+#    free slots; d is stored in the displacement array G for this bucket.
+# 3. Buckets with a single key are placed last, directly into the remaining free slots. Their
+#    slot s is stored as -s - 1 in G, so a negative entry means "no second hash needed".
+# Lookup: d = G[bucket(key)], slot = -d - 1 if d < 0 else h(d, key) % n, then compare the key.
+# If some bucket finds no displacement, the construction restarts with a new seed.
+#
+# Memory: keys and values sit in two flat lists of exactly n entries, and G adds one 4-byte
+# integer per bucket (about 2 bytes per key with the default avg_bucket_size of 2). The default
+# 100-bucket chaining table (01b) instead holds one list per bucket plus one tuple per entry.
+# Larger buckets shrink G further, but the last multi-key buckets then have to fit into an
+# almost full table, so the construction gets much slower (about 10x from 2 to 4 keys).
+#
+# NOTE: Keys can be any hashable type. Both hash functions are derived from Python's built-in
+# hash() by a seeded 64-bit mixer (the splitmix64 finalizer). Hashing (seed, d, key) tuples as
+# in the cuckoo table (01f) is not enough here: CPython's tuple hash keeps keys of the same
+# bucket correlated for every d, so some pairs would collide whatever the displacement. String
+# hashes are salted per process, so a frozen table has to be rebuilt (not persisted) in a new
+# process, and distinct keys with equal hash() values (such as -1 and -2) cannot be separated.
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN_64 = 0x9E3779B97F4A7C15
+
+
+def mix64(x: int) -> int:
+    """Scramble a 64-bit integer so that every input bit affects every output bit. O(1) time, O(1) space."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return x ^ (x >> 31)
+
+
+class FrozenHashTable:
+    MAX_DISPLACEMENT = 1 << 16
+    MAX_SEEDS = 32
+
+    def __init__(self, items: Iterable[tuple[Any, Any]] = (), avg_bucket_size: float = 2.0) -> None:
+        if avg_bucket_size <= 0:
+            raise ValueError("avg_bucket_size must be positive")
+        # Like dict(), a repeated key keeps its last value
+        entries = list(dict(items).items())
+        self.length = len(entries)
+        self.num_buckets = max(1, math.ceil(self.length / avg_bucket_size))
+
+        for seed in range(self.MAX_SEEDS):
+            self.seed = seed
+            if self._build(entries):
+                return
+        raise RuntimeError("No perfect hash function found; try a smaller avg_bucket_size")
+
+    def get_hash(self, key: Any) -> int:
+        """Compute the seeded 64-bit hash of a key. O(k) time, O(1) space."""
+        return mix64((hash(key) + self.seed * GOLDEN_64) & MASK_64)
+
+    def get_bucket(self, h: int) -> int:
+        """Compute the bucket of a key hash (first hash function). O(1) time, O(1) space."""
+        return h % self.num_buckets
+
+    def get_slot(self, h: int, displacement: int) -> int:
+        """Compute the slot of a key hash for a displacement (second hash function). O(1) time, O(1) space."""
+        return mix64((h + displacement * GOLDEN_64) & MASK_64) % self.length
+
+    def _build(self, entries: list[tuple[Any, Any]]) -> bool:
+        """Place all buckets with the current seed; return False if one fails. O(n) expected time, O(n) space."""
+        n = self.length
+        buckets = [[] for _ in range(self.num_buckets)]
+        for key, val in entries:
+            h = self.get_hash(key)
+            buckets[self.get_bucket(h)].append((h, key, val))
+        order = sorted(range(self.num_buckets), key=lambda b: len(buckets[b]), reverse=True)
+
+        # Signed 32-bit: displacements are >= 0, singleton slots are encoded as -slot - 1
+        self.G = array("i", [0]) * self.num_buckets
+        self.keys_arr = [None] * n
+        self.vals_arr = [None] * n
+        taken = bytearray(n)
+
+        idx = 0
+        while idx < len(order) and len(buckets[order[idx]]) > 1:
+            bucket = buckets[order[idx]]
+            for displacement in range(self.MAX_DISPLACEMENT):
+                slots = [self.get_slot(h, displacement) for h, _, _ in bucket]
+                if len(set(slots)) == len(slots) and not any(taken[slot] for slot in slots):
+                    break
+            else:
+                return False
+            self.G[order[idx]] = displacement
+            for slot, (_, key, val) in zip(slots, bucket):
+                taken[slot] = 1
+                self.keys_arr[slot] = key
+                self.vals_arr[slot] = val
+            idx += 1
+
+        # Singletons fill the remaining free slots one by one (empty buckets keep G = 0)
+        free_slots = (slot for slot in range(n) if not taken[slot])
+        while idx < len(order) and len(buckets[order[idx]]) == 1:
+            slot = next(free_slots)
+            _, key, val = buckets[order[idx]][0]
+            self.G[order[idx]] = -slot - 1
+            self.keys_arr[slot] = key
+            self.vals_arr[slot] = val
+            idx += 1
+        return True
+
+    def _find_slot(self, key: Any) -> int:
+        """Return the only slot the key can be in. O(k) time, O(1) space."""
+        h = self.get_hash(key)
+        displacement = self.G[self.get_bucket(h)]
+        if displacement < 0:
+            return -displacement - 1
+        return self.get_slot(h, displacement)
+
+    def __getitem__(self, key: Any) -> Any:
+        """Retrieve value by key with exactly one probe. O(k) time, O(1) space."""
+        if self.length:
+            slot = self._find_slot(key)
+            if self.keys_arr[slot] == key:
+                return self.vals_arr[slot]
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k) time, O(1) space."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Any, val: Any) -> None:
+        """Reject modifications; build a new table instead. O(1) time, O(1) space."""
+        raise TypeError("FrozenHashTable is immutable")
+
+    def __delitem__(self, key: Any) -> None:
+        """Reject modifications; build a new table instead. O(1) time, O(1) space."""
+        raise TypeError("FrozenHashTable is immutable")
+
+    def __len__(self) -> int:
+        """Return the number of entries. O(1) time, O(1) space."""
+        return self.length
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is present with exactly one probe. O(k) time, O(1) space."""
+        return self.length > 0 and self.keys_arr[self._find_slot(key)] == key
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """Lazily yield all (key, value) pairs. O(n) time, O(1) space."""
+        return zip(self.keys_arr, self.vals_arr)
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yield all keys. O(n) time, O(1) space."""
+        return iter(self.keys_arr)
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(1) space."""
+        return iter(self.vals_arr)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys, like a dict. O(n) time, O(1) space."""
+        return self.keys()
+
+
+def freeze(table: Any, avg_bucket_size: float = 2.0) -> FrozenHashTable:
+    """Build an immutable perfect-hash copy of any table with items() (01b, 01c, dict). O(n) expected time."""
+    return FrozenHashTable(table.items(), avg_bucket_size)
+
+
+if __name__ == "__main__":
+    ht = freeze({"apple": 100, "banana": 200, "orange": 300})
+
+    # Basic operations
+    assert ht["apple"] == 100, "Should retrieve apple"
+    assert ht["banana"] == 200, "Should retrieve banana"
+    assert ht["orange"] == 300, "Should retrieve orange"
+
+    # Test KeyError for missing key
+    try:
+        _ = ht["grape"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test get() method
+    assert ht.get("grape") is None, "get() should return None for missing key"
+    assert ht.get("grape", "default") == "default", "get() should return default value"
+    assert ht.get("apple") == 100, "get() should return value for existing key"
+
+    # Test immutability
+    for modify in (lambda: ht.__setitem__("apple", 1), lambda: ht.__delitem__("apple")):
+        try:
+            modify()
+            assert False, "Should raise TypeError on modification"
+        except TypeError:
+            pass  # Expected
+    assert ht["apple"] == 100, "Failed modifications should not change the table"
+
+    # Test a large key set: exactly n slots, every key in the slot its hash points to
+    data = {f"key{i}": i for i in range(10000)}
+    big = freeze(data)
+    assert len(big) == 10000 and len(big.keys_arr) == 10000, "Table should have no empty slots"
+    assert None not in big.keys_arr, "Every slot should hold a key"
+    assert all(big.keys_arr[big._find_slot(key)] == key for key in data), "Every key needs a single probe"
+    assert all(big[key] == val for key, val in data.items()), "Should retrieve every value"
+    assert all(f"other{i}" not in big for i in range(1000)), "Unknown keys should be rejected"
+    assert len(big.G) == 5000, "Should use n / avg_bucket_size buckets"
+    assert dict(big.items()) == data, "items() should yield all pairs"
+    assert sorted(big.values()) == list(range(10000)), "values() should yield every value once"
+
+    # Larger buckets need fewer displacement entries but more attempts per bucket
+    dense = freeze(data, avg_bucket_size=4)
+    assert len(dense.G) == 2500 and all(dense[key] == val for key, val in data.items()), (
+        "Larger buckets should still give a perfect hash"
+    )
+
+    # Test any iterable of pairs and non-string keys (last value wins, like dict)
+    mixed = FrozenHashTable([(1, "one"), ((2, 3), "tuple"), (None, "none"), (1, "uno")])
+    assert len(mixed) == 3 and mixed[1] == "uno", "Repeated key should keep its last value"
+    assert mixed[(2, 3)] == "tuple" and mixed[None] == "none", "Should support any hashable key"
+
+    # Test empty and single-entry tables
+    empty = FrozenHashTable()
+    assert len(empty) == 0 and "a" not in empty and empty.get("a") is None, "Empty table has no keys"
+    single = freeze({"only": 1})
+    assert single["only"] == 1 and "other" not in single, "Single entry should be retrievable"
+
+    # Test invalid configuration
+    try:
+        FrozenHashTable(avg_bucket_size=0)
+        assert False, "Should raise ValueError for non-positive bucket size"
+    except ValueError:
+        pass
+
+    print("All tests passed!")
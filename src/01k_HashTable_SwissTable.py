@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+# A Swiss table (the design behind Abseil's flat_hash_map and Rust's hashbrown) is open
+# addressing with one extra byte of metadata per slot, the "control byte":
+# * EMPTY (0x80) or DELETED (0xFE, a tombstone): the high bit is set
+# * 0..127: the slot is full, and the byte holds the low 7 bits of the key's hash (h2)
+# The remaining bits of the hash (h1) choose where probing starts. Instead of comparing the
+# full key at every slot like linear probing (01c), a lookup looks at a whole group of 16
+# control bytes at once, and only compares keys in the slots whose control byte equals h2.
+# A non-matching key survives this filter with probability 1/128, so almost all probing is
+# done on the compact control array, which stays in the CPU cache. A miss ends at the first
+# group that contains an EMPTY byte, usually after the first group and without touching a key.
+#
+# Probing moves in steps of whole groups with growing stride (16, 32, 48, ... slots, a
+# "triangular" sequence), which visits every group once when the capacity is a power of two.
+# To scan a group that wraps around the end of the table as one contiguous slice, the first 15
+# control bytes are mirrored after the last one.
+#
+# NOTE: The C implementations compare 16 control bytes with a single SIMD instruction. Here
+# bytearray.find() and the "in" operator play that role: they scan the group slice in C
+# (memchr) rather than one slot per Python loop iteration, without an extra dependency.
+# Keys can be any hashable type; Python's built-in hash() is used.
+
+GROUP_WIDTH = 16
+EMPTY = 0x80
+DELETED = 0xFE
+H2_MASK = 0x7F
+
+
+class HashTable:
+    # Resize once full and deleted slots together exceed 7/8 of the capacity (as in Abseil)
+    MAX_LOAD_FACTOR = 7 / 8
+
+    def __init__(self, capacity: int = 16) -> None:
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        # A power of two, at least one group, so that triangular probing reaches every group
+        self.MAX = max(GROUP_WIDTH, 1 << (capacity - 1).bit_length())
+        self.ctrl = bytearray([EMPTY]) * (self.MAX + GROUP_WIDTH - 1)
+        self.key_arr = [None] * self.MAX
+        self.val_arr = [None] * self.MAX
+        self.length = 0
+        self.deleted = 0
+
+    def get_hash(self, key: Any) -> tuple[int, int]:
+        """Split the hash of a key into start position h1 and 7-bit fingerprint h2. O(k) time, O(1) space."""
+        h = hash(key)
+        return (h >> 7) & (self.MAX - 1), h & H2_MASK
+
+    def _set_ctrl(self, slot: int, value: int) -> None:
+        """Write a control byte and its mirrored copy. O(1) time, O(1) space."""
+        self.ctrl[slot] = value
+        if slot < GROUP_WIDTH - 1:
+            self.ctrl[self.MAX + slot] = value
+
+    def _find_index(self, key: Any, pos: int, h2: int) -> int:
+        """Return the slot holding key, or -1 if missing. O(k) avg, O(k + n) worst time, O(1) space."""
+        mask = self.MAX - 1
+        ctrl = self.ctrl
+        stride = 0
+        while True:
+            group = ctrl[pos : pos + GROUP_WIDTH]
+            # Only slots whose fingerprint matches are worth a key comparison
+            i = group.find(h2)
+            while i != -1:
+                slot = (pos + i) & mask
+                if self.key_arr[slot] == key:
+                    return slot
+                i = group.find(h2, i + 1)
+            # Inserts fill the first free slot of the probe sequence, so the key would be here
+            if EMPTY in group:
+                return -1
+            stride += GROUP_WIDTH
+            pos = (pos + stride) & mask
+
+    def _find_free(self, pos: int) -> int:
+        """Return the first EMPTY or DELETED slot of a probe sequence. O(1) avg, O(n) worst time, O(1) space."""
+        mask = self.MAX - 1
+        stride = 0
+        while True:
+            group = self.ctrl[pos : pos + GROUP_WIDTH]
+            empty = group.find(EMPTY)
+            deleted = group.find(DELETED)
+            if empty != -1 or deleted != -1:
+                i = empty if deleted == -1 or (empty != -1 and empty < deleted) else deleted
+                return (pos + i) & mask
+            stride += GROUP_WIDTH
+            pos = (pos + stride) & mask
+
+    def __setitem__(self, key: Any, val: Any) -> None:
+        """Insert or update a key-value pair. O(k) amortized, O(k + n) worst time, O(1) space."""
+        pos, h2 = self.get_hash(key)
+        slot = self._find_index(key, pos, h2)
+        if slot != -1:
+            self.val_arr[slot] = val
+            return
+
+        if self.length + self.deleted + 1 > self.MAX_LOAD_FACTOR * self.MAX:
+            # Grow if live entries alone take half of the limit, otherwise only drop tombstones
+            grow = self.length + 1 > self.MAX_LOAD_FACTOR * self.MAX / 2
+            self._resize(self.MAX * 2 if grow else self.MAX)
+            pos, h2 = self.get_hash(key)
+
+        slot = self._find_free(pos)
+        if self.ctrl[slot] == DELETED:
+            self.deleted -= 1
+        self._set_ctrl(slot, h2)
+        self.key_arr[slot] = key
+        self.val_arr[slot] = val
+        self.length += 1
+
+    def __getitem__(self, key: Any) -> Any:
+        """Retrieve value by key. O(k) avg, O(k + n) worst time, O(1) space."""
+        slot = self._find_index(key, *self.get_hash(key))
+        if slot == -1:
+            raise KeyError(key)
+        return self.val_arr[slot]
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k) avg, O(k + n) worst time, O(1) space."""
+        slot = self._find_index(key, *self.get_hash(key))
+        return default if slot == -1 else self.val_arr[slot]
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete a key-value pair, leaving a DELETED control byte. O(k) avg, O(k + n) worst time, O(1) space."""
+        slot = self._find_index(key, *self.get_hash(key))
+        if slot == -1:
+            raise KeyError(key)
+        # A tombstone keeps later keys of the probe sequence reachable (see 01c)
+        self._set_ctrl(slot, DELETED)
+        self.key_arr[slot] = None
+        self.val_arr[slot] = None
+        self.length -= 1
+        self.deleted += 1
+
+    def _resize(self, new_size: int) -> None:
+        """Reinsert all entries into new_size slots, dropping tombstones. O(nk) avg time, O(n) space."""
+        old_ctrl, old_keys, old_vals = self.ctrl, self.key_arr, self.val_arr
+        old_size = self.MAX
+        self.MAX = new_size
+        self.ctrl = bytearray([EMPTY]) * (self.MAX + GROUP_WIDTH - 1)
+        self.key_arr = [None] * self.MAX
+        self.val_arr = [None] * self.MAX
+        self.deleted = 0
+        for slot in range(old_size):
+            if old_ctrl[slot] < EMPTY:
+                # Keys are unique, so only a free slot has to be found (no key comparisons)
+                key = old_keys[slot]
+                pos, h2 = self.get_hash(key)
+                new_slot = self._find_free(pos)
+                self._set_ctrl(new_slot, h2)
+                self.key_arr[new_slot] = key
+                self.val_arr[new_slot] = old_vals[slot]
+
+    def __len__(self) -> int:
+        """Return the number of entries. O(1) time, O(1) space."""
+        return self.length
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether a key is present. O(k) avg, O(k + n) worst time, O(1) space."""
+        return self._find_index(key, *self.get_hash(key)) != -1
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """Lazily yield all (key, value) pairs without copying the table. O(n) time, O(1) space."""
+        for slot in range(self.MAX):
+            if self.ctrl[slot] < EMPTY:
+                yield self.key_arr[slot], self.val_arr[slot]
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yield all keys. O(n) time, O(1) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yield all values. O(n) time, O(1) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys, like a dict. O(n) time, O(1) space."""
+        return self.keys()
+
+
+if __name__ == "__main__":
+    ht = HashTable()
+
+    # Basic operations
+    ht["apple"] = 100
+    ht["banana"] = 200
+    ht["orange"] = 300
+
+    assert ht["apple"] == 100, "Should retrieve apple"
+    assert ht["banana"] == 200, "Should retrieve banana"
+    assert ht["orange"] == 300, "Should retrieve orange"
+
+    # Test KeyError for missing key
+    try:
+        _ = ht["grape"]
+        assert False, "Should raise KeyError for non-existent key"
+    except KeyError:
+        pass  # Expected
+
+    # Test get() method
+    assert ht.get("grape") is None, "get() should return None for missing key"
+    assert ht.get("grape", "default") == "default", "get() should return default value"
+    assert ht.get("apple") == 100, "get() should return value for existing key"
+
+    # Test update
+    ht["apple"] = 150
+    assert ht["apple"] == 150, "Should update apple"
+    assert len(ht) == 3, "Update should not add an entry"
+
+    # Test delete
+    del ht["banana"]
+    assert "banana" not in ht and ht.deleted == 1, "Delete should leave a tombstone"
+    try:
+        del ht["banana"]
+        assert False, "Should raise KeyError for deleted key"
+    except KeyError:
+        pass  # Expected
+
+    # Test control bytes: fingerprints of full slots, mirrored bytes at the end
+    assert sum(1 for c in ht.ctrl[: ht.MAX] if c < EMPTY) == 2, "Two slots should be full"
+    assert ht.ctrl[ht.MAX :] == ht.ctrl[: GROUP_WIDTH - 1], "First group should be mirrored"
+
+    # Test probing across group boundaries and wrap-around with colliding start positions
+    class Collider:
+        """Key whose hash is fully controlled by the test, counting key comparisons."""
+
+        comparisons = 0
+
+        def __init__(self, h: int) -> None:
+            self.h = h
+
+        def __hash__(self) -> int:
+            return self.h
+
+        def __eq__(self, other: object) -> bool:
+            Collider.comparisons += 1
+            return isinstance(other, Collider) and self.h == other.h
+
+    small = HashTable(capacity=32)
+    # Same start position (slot 30) and fingerprint: 20 keys spill over the end of the table
+    colliding = [Collider((30 << 7) | 5 | (i << 20)) for i in range(20)]
+    for i, key in enumerate(colliding):
+        small[key] = i
+    assert all(small[key] == i for i, key in enumerate(colliding)), "Should find keys past the wrap-around"
+    assert small.ctrl[:GROUP_WIDTH - 1] == small.ctrl[small.MAX :], "Mirror should follow wrapped inserts"
+    del small[colliding[3]]
+    assert colliding[3] not in small and small[colliding[19]] == 19, "Tombstone should keep keys reachable"
+    small[colliding[3]] = "back"
+    assert small.deleted == 0 and small[colliding[3]] == "back", "Insert should reuse the tombstone"
+
+    # Test that misses almost never compare keys thanks to the fingerprints
+    filtered = HashTable()
+    for i in range(5000):
+        filtered[Collider(hash(f"key{i}"))] = i
+    Collider.comparisons = 0
+    for i in range(5000):
+        assert Collider(hash(f"other{i}")) not in filtered, "Unknown key should be missing"
+    assert Collider.comparisons < 500, "Fingerprints should filter out almost all key comparisons"
+
+    # Test many keys: growth, load factor and tombstone cleanup
+    big_ht = HashTable()
+    for i in range(10000):
+        big_ht[f"key{i}"] = i
+    assert len(big_ht) == 10000, "Should count 10000 entries"
+    assert big_ht.length <= HashTable.MAX_LOAD_FACTOR * big_ht.MAX, "Load factor should stay bounded"
+    assert all(big_ht[f"key{i}"] == i for i in range(10000)), "All keys should survive resizing"
+    for i in range(0, 10000, 2):
+        del big_ht[f"key{i}"]
+    assert all(big_ht.get(f"key{i}") == (None if i % 2 == 0 else i) for i in range(10000)), (
+        "Only odd keys should remain after deleting even keys"
+    )
+    size_before = big_ht.MAX
+    for i in range(10000, 20000):
+        big_ht[f"key{i}"] = i
+        del big_ht[f"key{i}"]
+    assert big_ht.MAX == size_before, "Insert/delete churn should rehash in place, not grow"
+    assert big_ht.length + big_ht.deleted <= HashTable.MAX_LOAD_FACTOR * big_ht.MAX, "Tombstones should be dropped"
+
+    # Test views, length and membership
+    assert len(big_ht) == 5000, "len() should count live entries"
+    assert "key1" in big_ht and "key0" not in big_ht, "Membership should check keys"
+    expected_items = {f"key{i}": i for i in range(1, 10000, 2)}
+    assert dict(big_ht.items()) == expected_items, "items() should yield all pairs"
+    assert sorted(big_ht.values()) == list(range(1, 10000, 2)), "values() should yield every value once"
+    assert set(big_ht) == set(big_ht.keys()) == set(expected_items), "Iteration should yield every key once"
+
+    # Test capacity is rounded up to a power of two of at least one group
+    assert HashTable(capacity=1).MAX == 16 and HashTable(capacity=100).MAX == 128, "Capacity should be rounded"
+    try:
+        HashTable(capacity=0)
+        assert False, "Should raise ValueError for non-positive capacity"
+    except ValueError:
+        pass
+
+    print("All tests passed!")
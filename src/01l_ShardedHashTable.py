@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import importlib.util
+import multiprocessing
+import os
+import threading
+from multiprocessing.connection import Connection
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Iterable, Iterator
+
+# A single Python process can only update a table on one core (the GIL). A sharded table
+# splits the keys over N worker processes, each owning its own separate-chaining hash table,
+# so N shards can ingest on N cores. The parent process only routes requests:
+# * Routing uses consistent hashing: every shard is placed on a hash ring at many pseudo-random
+#   points ("virtual nodes"), and a key belongs to the shard of the first point at or after the
+#   key's own ring position. Adding a shard then only moves the keys that fall just before its
+#   new points (about 1/(N + 1) of all keys), while hash(key) % N would move almost all of them.
+# * Requests are batched: writes are buffered per shard and sent as one message once batch_size
+#   of them are pending, so the per-message cost of pickling and the pipe round trip is paid
+#   once per batch instead of once per key.
+# * Requests are pipelined: a full write batch is sent without waiting for its acknowledgement,
+#   which is collected at the next flush or read, and the bulk methods send one batch to every
+#   shard before waiting for any reply. The caller keeps filling batches while the shards apply
+#   the previous ones, and all shards work at the same time.
+# Reads flush the pending writes first, so the table always reads its own writes.
+#
+# NOTE: Keys must be strings. The ring positions use BLAKE2b, which (unlike Python's built-in
+# hash() of strings) gives the same value in every process. Values can be anything picklable.
+# Requests travel over pipes as pickled batches; shared memory would only pay off for
+# fixed-size values and would need its own allocator for the table.
+
+# Write batches per shard that may be sent before their acknowledgements are read. The bound
+# keeps the unread acknowledgements far below the pipe buffer, so a worker never blocks on them.
+MAX_IN_FLIGHT = 16
+
+
+def load_hash_table() -> type:
+    """Load HashTable from 01b (file names starting with digits cannot be imported). O(1) time."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "01b_HashTable_SeparateChaining.py")
+    spec = importlib.util.spec_from_file_location("hash_table_separate_chaining", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.HashTable
+
+
+def ring_hash(key: str) -> int:
+    """Compute a 64-bit ring position that is the same in every process. O(k) time, O(1) space."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+
+
+class HashRing:
+    def __init__(self, virtual_nodes: int = 64) -> None:
+        if virtual_nodes < 1:
+            raise ValueError("virtual_nodes must be positive")
+        self.virtual_nodes = virtual_nodes
+        # Sorted ring positions and the shard owning each of them
+        self.points = []
+        self.owners = []
+
+    def add_node(self, node: int) -> None:
+        """Place a node at virtual_nodes points of the ring. O(v * p) time, O(v) space."""
+        for replica in range(self.virtual_nodes):
+            point = ring_hash(f"shard-{node}#{replica}")
+            idx = bisect.bisect_left(self.points, point)
+            self.points.insert(idx, point)
+            self.owners.insert(idx, node)
+
+    def owner(self, key: str) -> int:
+        """Return the node of the first point at or after the key's position. O(k + log p) time, O(1) space."""
+        if not self.points:
+            raise IndexError("Hash ring is empty")
+        idx = bisect.bisect_left(self.points, ring_hash(key))
+        # Past the last point, the ring wraps around to the first one
+        return self.owners[idx % len(self.points)]
+
+
+def is_picklable(obj: Any) -> bool:
+    """Check whether obj can be sent over a pipe. O(m) time, O(m) space for an object of m bytes."""
+    try:
+        ForkingPickler.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def shard_worker(conn: Connection, shard_id: int) -> None:
+    """Serve batched requests for one shard until told to stop. O(b) time per batch of b keys."""
+    # Each worker owns a separate-chaining table (01b). It uses the built-in hash(), which is
+    # consistent within the worker process that owns the table.
+    table = load_hash_table()(hash_func=hash)
+    absent = object()
+    while True:
+        op, args = conn.recv()
+        try:
+            if op == "set_many":
+                for key, val in args:
+                    table[key] = val
+                result = None
+            elif op == "get_many":
+                # Values plus the positions of missing keys; the caller fills in its default,
+                # which may be a sentinel object that would not survive pickling
+                values = []
+                missing = []
+                for idx, key in enumerate(args):
+                    element = table.get(key, absent)
+                    if element is absent:
+                        missing.append(idx)
+                        element = None
+                    values.append(element)
+                result = (values, missing)
+            elif op == "delete_many":
+                # Returns the keys that were missing, so the caller can raise KeyError
+                result = []
+                for key in args:
+                    try:
+                        del table[key]
+                    except KeyError:
+                        result.append(key)
+            elif op == "len":
+                result = table.length
+            elif op == "items":
+                result = list(table.items())
+            elif op == "rebalance":
+                # Hand over (and forget) every key that the new ring assigns to another shard
+                ring = args
+                result = [(key, val) for key, val in table.items() if ring.owner(key) != shard_id]
+                for key, _ in result:
+                    del table[key]
+            elif op == "stop":
+                conn.send(("ok", None))
+                return
+            else:
+                raise ValueError(f"Unknown operation {op!r}")
+            conn.send(("ok", result))
+        except Exception as exc:
+            conn.send(("error", exc))
+
+
+class ShardedHashTable:
+    def __init__(self, num_shards: int = 4, virtual_nodes: int = 64, batch_size: int = 256) -> None:
+        if num_shards < 1:
+            raise ValueError("num_shards must be positive")
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.batch_size = batch_size
+        self.ring = HashRing(virtual_nodes)
+        self.conns = {}
+        self.processes = {}
+        # Buffered writes per shard: (key, value) pairs not sent yet
+        self.pending = {}
+        # Write batches sent per shard whose acknowledgements have not been read yet
+        self.in_flight = {}
+        self.closed = False
+        for _ in range(num_shards):
+            self._start_shard()
+
+    def _start_shard(self) -> int:
+        """Start a worker process and add it to the ring. O(v * p) time, O(v) space."""
+        shard_id = len(self.processes)
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=shard_worker, args=(child_conn, shard_id), daemon=True)
+        process.start()
+        child_conn.close()
+        self.conns[shard_id] = parent_conn
+        self.processes[shard_id] = process
+        self.pending[shard_id] = []
+        self.in_flight[shard_id] = 0
+        self.ring.add_node(shard_id)
+        return shard_id
+
+    def _send(self, shard_id: int, op: str, args: Any = None) -> None:
+        """Send one request to a shard without waiting for the reply. O(b) time, O(b) space."""
+        self.conns[shard_id].send((op, args))
+
+    def _receive(self, shard_ids: Iterable[int], error: Exception | None = None) -> dict[int, Any]:
+        """Read one reply per shard id, raising the first error only after all are read. O(b) time, O(b) space."""
+        replies = {}
+        for shard_id in shard_ids:
+            status, result = self.conns[shard_id].recv()
+            if status == "error" and error is None:
+                error = result
+            replies[shard_id] = result
+        # Raising before every reply is read would leave stale replies in the pipes, which the
+        # next request to those shards would then take for its own
+        if error is not None:
+            raise error
+        return replies
+
+    def _broadcast(self, requests: dict[int, tuple[str, Any]]) -> dict[int, Any]:
+        """Send all requests first, then collect the replies (pipelining). O(b) time, O(b) space."""
+        error = None
+        sent = []
+        for shard_id, (op, args) in requests.items():
+            try:
+                self._send(shard_id, op, args)
+                sent.append(shard_id)
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        return self._receive(sent, error)
+
+    def _collect_acks(self, shard_ids: Iterable[int], error: Exception | None = None) -> None:
+        """Read the acknowledgements of the write batches sent to the shards. O(a) time, O(a) space."""
+        expected = []
+        for shard_id in shard_ids:
+            expected.extend([shard_id] * self.in_flight[shard_id])
+            self.in_flight[shard_id] = 0
+        self._receive(expected, error)
+
+    def _send_writes(self, shard_id: int) -> None:
+        """Send a shard's buffered writes without waiting for the acknowledgement. O(b) time, O(b) space."""
+        if self.in_flight[shard_id] >= MAX_IN_FLIGHT:
+            self._collect_acks([shard_id])
+        batch = self.pending[shard_id]
+        try:
+            self._send(shard_id, "set_many", batch)
+        except Exception:
+            # Connection.send() pickles the whole message before writing it, so nothing reached
+            # the pipe: keep the writes buffered, except the ones that can never be sent
+            self.pending[shard_id] = [pair for pair in batch if is_picklable(pair)]
+            raise
+        self.pending[shard_id] = []
+        self.in_flight[shard_id] += 1
+
+    def _group(self, keys: Iterable[str]) -> dict[int, list[str]]:
+        """Split keys by owning shard. O(nk) time, O(n) space."""
+        groups = {}
+        for key in keys:
+            groups.setdefault(self.ring.owner(key), []).append(key)
+        return groups
+
+    def flush(self) -> None:
+        """Send all buffered writes and wait until every shard has applied them. O(b) time, O(b) space."""
+        error = None
+        for shard_id, batch in self.pending.items():
+            if not batch:
+                continue
+            try:
+                self._send_writes(shard_id)
+            except Exception as exc:
+                if error is None:
+                    error = exc
+        # Also collects the acknowledgements of the batches that __setitem__ has pipelined
+        self._collect_acks(self.conns, error)
+
+    def __setitem__(self, key: str, val: Any) -> None:
+        """Buffer a write; a full batch is sent without waiting for the reply. O(k) amortized time, O(1) space."""
+        shard_id = self.ring.owner(key)
+        self.pending[shard_id].append((key, val))
+        if len(self.pending[shard_id]) >= self.batch_size:
+            self._send_writes(shard_id)
+
+    def set_many(self, pairs: Iterable[tuple[str, Any]]) -> None:
+        """Insert or update many pairs with one batch per shard, processed in parallel. O(nk) time, O(n) space."""
+        for key, val in pairs:
+            self.pending[self.ring.owner(key)].append((key, val))
+        self.flush()
+
+    def get_many(self, keys: Iterable[str], default: Any = None) -> list[Any]:
+        """Retrieve values for many keys with one batch per shard. O(nk) time, O(n) space."""
+        self.flush()
+        keys = list(keys)
+        groups = self._group(keys)
+        replies = self._broadcast({shard_id: ("get_many", group) for shard_id, group in groups.items()})
+        found = {}
+        for shard_id, group in groups.items():
+            values, missing = replies[shard_id]
+            for idx in missing:
+                values[idx] = default
+            found.update(zip(group, values))
+        return [found[key] for key in keys]
+
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        """Delete many keys with one batch per shard; return the missing ones. O(nk) time, O(n) space."""
+        self.flush()
+        groups = self._group(keys)
+        replies = self._broadcast({shard_id: ("delete_many", group) for shard_id, group in groups.items()})
+        return [key for missing in replies.values() for key in missing]
+
+    def __getitem__(self, key: str) -> Any:
+        """Retrieve value by key from its shard. O(k) avg time (one round trip), O(1) space."""
+        missing = object()
+        val = self.get(key, missing)
+        if val is missing:
+            raise KeyError(key)
+        return val
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve value by key, returning default if missing. O(k) avg time (one round trip), O(1) space."""
+        return self.get_many([key], default)[0]
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a key-value pair from its shard. O(k) avg time (one round trip), O(1) space."""
+        if self.delete_many([key]):
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key is present. O(k) avg time (one round trip), O(1) space."""
+        missing = object()
+        return self.get_many([key], missing)[0] is not missing
+
+    def __len__(self) -> int:
+        """Return the number of entries, summed over all shards in parallel. O(s) time, O(s) space."""
+        self.flush()
+        return sum(self._broadcast({shard_id: ("len", None) for shard_id in self.conns}).values())
+
+    def shard_sizes(self) -> dict[int, int]:
+        """Return the number of entries per shard. O(s) time, O(s) space."""
+        self.flush()
+        return self._broadcast({shard_id: ("len", None) for shard_id in self.conns})
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Yield all (key, value) pairs, fetched from all shards in parallel. O(n) time, O(n) space."""
+        self.flush()
+        for pairs in self._broadcast({shard_id: ("items", None) for shard_id in self.conns}).values():
+            yield from pairs
+
+    def keys(self) -> Iterator[str]:
+        """Yield all keys. O(n) time, O(n) space."""
+        for key, _ in self.items():
+            yield key
+
+    def values(self) -> Iterator[Any]:
+        """Yield all values. O(n) time, O(n) space."""
+        for _, val in self.items():
+            yield val
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys, like a dict. O(n) time, O(n) space."""
+        return self.keys()
+
+    def add_shard(self) -> int:
+        """Start a shard and move it the keys the ring now assigns to it; return their number. O(n) time."""
+        self.flush()
+        old_shards = list(self.conns)
+        new_shard = self._start_shard()
+        # Every old shard scans its own table in parallel and only the moving keys cross the pipes
+        replies = self._broadcast({shard_id: ("rebalance", self.ring) for shard_id in old_shards})
+        moved = [pair for pairs in replies.values() for pair in pairs]
+        self._broadcast({new_shard: ("set_many", moved)})
+        return len(moved)
+
+    def close(self) -> None:
+        """Flush pending writes and stop all worker processes. O(b + s) time, O(b) space."""
+        if self.closed:
+            return
+        self.flush()
+        self._broadcast({shard_id: ("stop", None) for shard_id in self.conns})
+        for shard_id, process in self.processes.items():
+            process.join()
+            self.conns[shard_id].close()
+        self.closed = True
+
+    def __enter__(self) -> ShardedHashTable:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    with ShardedHashTable(num_shards=3, batch_size=64) as ht:
+        # Basic operations
+        ht["apple"] = 100
+        ht["banana"] = 200
+        ht["orange"] = 300
+
+        assert ht["apple"] == 100, "Should retrieve apple (reads flush buffered writes)"
+        assert ht["banana"] == 200, "Should retrieve banana"
+        assert ht["orange"] == 300, "Should retrieve orange"
+
+        # Test KeyError for missing key
+        try:
+            _ = ht["grape"]
+            assert False, "Should raise KeyError for non-existent key"
+        except KeyError:
+            pass  # Expected
+
+        # Test get() method
+        assert ht.get("grape") is None, "get() should return None for missing key"
+        assert ht.get("grape", "default") == "default", "get() should return default value"
+        assert ht.get("apple") == 100, "get() should return value for existing key"
+
+        # Test update
+        ht["apple"] = 150
+        assert ht["apple"] == 150, "Should update apple"
+        assert len(ht) == 3, "Update should not add an entry"
+
+        # Test delete
+        del ht["banana"]
+        assert "banana" not in ht, "Deleted key should be missing"
+        try:
+            del ht["banana"]
+            assert False, "Should raise KeyError for deleted key"
+        except KeyError:
+            pass  # Expected
+
+        # Test batched bulk operations spread over all shards
+        ht.set_many((f"key{i}", i) for i in range(6000))
+        for i in range(6000, 6300):
+            ht[f"key{i}"] = {"nested": i}
+        assert sum(ht.in_flight.values()) > 0, "Full write batches should be sent without waiting for the reply"
+        assert len(ht) == 6302, "Should count keys from single and bulk writes"
+        assert ht.get_many(["key0", "key5999", "missing", "key6050"], "x") == [0, 5999, "x", {"nested": 6050}], (
+            "get_many() should return values in key order"
+        )
+        sizes = ht.shard_sizes()
+        assert len(sizes) == 3 and min(sizes.values()) > 1000, "Consistent hashing should balance the shards"
+        assert ht.delete_many(["key0", "key1", "nope"]) == ["nope"], "delete_many() should report missing keys"
+        assert len(ht) == 6300, "Should delete bulk keys"
+
+        # Test adding a shard only moves the keys the new shard now owns
+        before = dict(ht.items())
+        moved = ht.add_shard()
+        sizes = ht.shard_sizes()
+        assert len(sizes) == 4 and sizes[3] == moved, "New shard should hold exactly the moved keys"
+        assert 0.1 * len(before) < moved < 0.45 * len(before), "Roughly a quarter of the keys should move"
+        assert dict(ht.items()) == before, "No key should be lost or duplicated by rebalancing"
+        assert all(ht[f"key{i}"] == i for i in range(2, 6000, 97)), "Moved keys should be found on their new shard"
+        ht["after"] = "rebalance"
+        assert ht["after"] == "rebalance" and len(ht) == 6301, "Writes should route with the new ring"
+
+        # Test worker errors come back to the caller and the worker keeps serving
+        try:
+            ht._broadcast({0: ("unknown", None)})
+            assert False, "Should re-raise the worker's error"
+        except ValueError:
+            pass  # Expected
+        assert ht["after"] == "rebalance", "Worker should survive a failed request"
+
+        # Test a value that cannot be pickled: the other buffered writes are kept, and no stale
+        # reply is left behind for the next request
+        ht["kept"] = "value"
+        ht["unpicklable"] = threading.Lock()
+        try:
+            len(ht)
+            assert False, "Should raise when a buffered value cannot be pickled"
+        except TypeError:
+            pass  # Expected: locks cannot be pickled
+        assert len(ht) == 6302, "Table should stay usable after a failed flush"
+        assert ht["kept"] == "value", "Writes buffered next to the bad one should not be lost"
+        assert "unpicklable" not in ht, "The unpicklable write should be dropped"
+
+    # Test the number of unacknowledged write batches per shard stays bounded
+    with ShardedHashTable(num_shards=2, batch_size=1) as ht:
+        for i in range(200):
+            ht[f"k{i}"] = i
+            assert max(ht.in_flight.values()) <= MAX_IN_FLIGHT, "Should collect acknowledgements when too many"
+        assert len(ht) == 200 and ht["k199"] == 199, "Every pipelined write should arrive"
+
+    # Test the ring on its own: adding a node only takes keys over, it never shuffles the rest
+    ring = HashRing(virtual_nodes=32)
+    for node in range(4):
+        ring.add_node(node)
+    owners = {f"k{i}": ring.owner(f"k{i}") for i in range(2000)}
+    ring.add_node(4)
+    assert all(ring.owner(key) in (owner, 4) for key, owner in owners.items()), (
+        "Keys should only move to the new node"
+    )
+
+    # Test invalid configuration
+    for kwargs in ({"num_shards": 0}, {"batch_size": 0}):
+        try:
+            ShardedHashTable(**kwargs)
+            assert False, f"Should raise ValueError for {kwargs}"
+        except ValueError:
+            pass
+    try:
+        HashRing().owner("key")
+        assert False, "Should raise IndexError for an empty ring"
+    except IndexError:
+        pass
+
+    print("All tests passed!")
@@ -1,18 +1,85 @@
 from __future__ import annotations
 
-from typing import Any
+import tracemalloc
+from typing import Any, Iterable
+
+# Memory: Node declares __slots__, so instances store their two fields in fixed slots instead
+# of a per-instance __dict__, which roughly halves the bytes per element (see memory_report()).
+# Node pooling: workloads that constantly insert and remove elements spend much of their time
+# allocating and garbage-collecting nodes. A LinkedList created with a NodePool hands removed
+# nodes to the pool's free list (threaded through their next pointers), and later inserts take
+# nodes from there before allocating new ones. A pool can be shared by several lists.
+# Bulk operations: extend(), insert_iterable_at() and replace_with_list() first build a detached
+# chain of new nodes and then link it in with a couple of pointer updates, after one walk to the
+# insertion point. concat() moves the nodes of another list over without copying them. The list
+# keeps no tail pointer, so reaching the end still takes O(n); DoublyLinkedList (02b) does it in O(1).
+# Cursors: a Cursor holds a position (the node and its predecessor), so edits at that position
+# are O(1) instead of a search from the head for every edit. Every structural change bumps the
+# list's version; a cursor that sees a version it did not produce itself raises RuntimeError,
+# since its node may have been removed in the meantime (like a dict changed during iteration).
 
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any = None, next: Node | None = None) -> None:
         self.data = data
         self.next = next
 
 
+class NodePool:
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        # Free nodes form a singly linked list through their next pointers
+        self.free = None
+        self.size = 0
+        self.max_size = max_size
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, data: Any = None, next: Node | None = None) -> Node:
+        """Return a recycled node if available, else a new one. O(1) time, O(1) space."""
+        node = self.free
+        if node is None:
+            self.allocated += 1
+            return Node(data, next)
+        self.free = node.next
+        self.size -= 1
+        self.reused += 1
+        node.data = data
+        node.next = next
+        return node
+
+    def release(self, node: Node) -> None:
+        """Put a removed node on the free list unless the pool is full. O(1) time, O(1) space."""
+        if self.size >= self.max_size:
+            return
+        # Drop the reference so that the removed element itself can be garbage-collected
+        node.data = None
+        node.next = self.free
+        self.free = node
+        self.size += 1
+
+
 class LinkedList:
-    def __init__(self) -> None:
+    def __init__(self, pool: NodePool | None = None) -> None:
         self.head = None
         self.length = 0
+        # Bumped by every structural change, so cursors can detect outside modifications
+        self.version = 0
+        self.pool = pool
+
+    def _new_node(self, data: Any, next: Node | None = None) -> Node:
+        """Create a node, recycling one from the pool if there is one. O(1) time, O(1) space."""
+        if self.pool is not None:
+            return self.pool.acquire(data, next)
+        return Node(data, next)
+
+    def _free_node(self, node: Node) -> None:
+        """Return a removed node to the pool, if there is one. O(1) time, O(1) space."""
+        if self.pool is not None:
+            self.pool.release(node)
 
     def find(self, data: Any) -> int:
         """Return index of first occurrence, or -1 if not found. O(n) time, O(1) space."""
@@ -34,23 +101,26 @@ class LinkedList:
 
     def insert_at_beginning(self, data: Any) -> None:
         """Insert a node at the head. O(1) time, O(1) space."""
-        node = Node(data, self.head)
+        node = self._new_node(data, self.head)
         self.head = node
         self.length += 1
+        self.version += 1
 
     def insert_at_end(self, data: Any) -> None:
         """Insert a node at the tail. O(n) time, O(1) space."""
         if self.head is None:
-            self.head = Node(data, None)
+            self.head = self._new_node(data, None)
             self.length += 1
+            self.version += 1
             return
 
         itr = self.head
         while itr.next:
             itr = itr.next
 
-        itr.next = Node(data, None)
+        itr.next = self._new_node(data, None)
         self.length += 1
+        self.version += 1
 
     def insert_at(self, index: int, data: Any) -> None:
         """Insert a node at a given index. O(n) time, O(1) space."""
@@ -65,9 +135,10 @@ class LinkedList:
         itr = self.head
         while itr:
             if count == index - 1:
-                node = Node(data, itr.next)
+                node = self._new_node(data, itr.next)
                 itr.next = node
                 self.length += 1
+                self.version += 1
                 return
 
             itr = itr.next
@@ -81,25 +152,98 @@ class LinkedList:
         itr = self.head
         while itr:
             if itr.data == data_after:
-                itr.next = Node(data_to_insert, itr.next)
+                itr.next = self._new_node(data_to_insert, itr.next)
                 self.length += 1
+                self.version += 1
                 return
             itr = itr.next
         raise ValueError(f"Value {data_after} not found in the list")
 
-    def replace_with_list(self, data_list: list[Any]) -> None:
-        """Replace the list with elements from data_list. O(m) time, O(1) space."""
-        self.head = None
-        self.length = 0
+    def _build_chain(self, data: Iterable[Any]) -> tuple[Node | None, Node | None, int]:
+        """Build a detached chain of nodes and return (head, tail, count). O(m) time, O(m) space."""
+        head = None
         tail = None
-        for data in data_list:
-            node = Node(data)
+        count = 0
+        for item in data:
+            node = self._new_node(item)
             if tail is None:
-                self.head = node
+                head = node
             else:
                 tail.next = node
             tail = node
-            self.length += 1
+            count += 1
+        return head, tail, count
+
+    def _link_chain(self, prev: Node | None, head: Node | None, tail: Node | None, count: int) -> None:
+        """Link a detached chain in after prev (at the head if prev is None). O(1) time, O(1) space."""
+        if head is None:
+            return
+        if prev is None:
+            tail.next = self.head
+            self.head = head
+        else:
+            tail.next = prev.next
+            prev.next = head
+        self.length += count
+        self.version += 1
+
+    def _get_last_node(self) -> Node | None:
+        """Return the last node, or None if the list is empty. O(n) time, O(1) space."""
+        itr = self.head
+        while itr and itr.next:
+            itr = itr.next
+        return itr
+
+    def _free_chain(self, head: Node | None) -> None:
+        """Return all nodes of a detached chain to the pool, if there is one. O(n) time with a pool, O(1) space."""
+        if self.pool is None:
+            return
+        while head is not None:
+            # release() reuses the next pointer for the free list, so read it first
+            next_node = head.next
+            self.pool.release(head)
+            head = next_node
+
+    def replace_with_list(self, data_list: list[Any]) -> None:
+        """Replace the contents with data_list, built as one chain. O(m) time (O(n + m) with a pool), O(1) space."""
+        # The old nodes go to the pool first, so that the new chain can reuse them
+        self._free_chain(self.head)
+        self.head, _, self.length = self._build_chain(data_list)
+        self.version += 1
+
+    def extend(self, data: Iterable[Any]) -> None:
+        """Append all elements of an iterable, linking the prebuilt chain at once. O(n + m) time, O(1) space."""
+        self._link_chain(self._get_last_node(), *self._build_chain(data))
+
+    def insert_iterable_at(self, index: int, data: Iterable[Any]) -> None:
+        """Insert all elements of an iterable at an index with one traversal. O(n + m) time, O(1) space."""
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+
+        head, tail, count = self._build_chain(data)
+        prev = None
+        if index > 0:
+            prev = self.head
+            for _ in range(index - 1):
+                prev = prev.next
+        self._link_chain(prev, head, tail, count)
+
+    def concat(self, other: LinkedList) -> None:
+        """Move all nodes of other to the end of this list, emptying other. O(n) time, O(1) space."""
+        if other is self:
+            raise ValueError("Cannot concatenate a list with itself")
+
+        # Without a tail pointer, only the walk to our last node costs time; other's nodes are not touched
+        last = self._get_last_node()
+        if last is None:
+            self.head = other.head
+        else:
+            last.next = other.head
+        self.length += other.length
+        self.version += 1
+        other.head = None
+        other.length = 0
+        other.version += 1
 
     def remove_at(self, index: int) -> None:
         """Remove node at a given index. O(n) time, O(1) space."""
@@ -107,16 +251,22 @@ class LinkedList:
             raise IndexError("Invalid index")
 
         if index == 0:
-            self.head = self.head.next
+            removed = self.head
+            self.head = removed.next
             self.length -= 1
+            self.version += 1
+            self._free_node(removed)
             return
 
         count = 0
         itr = self.head
         while itr:
             if count == index - 1:
-                itr.next = itr.next.next
+                removed = itr.next
+                itr.next = removed.next
                 self.length -= 1
+                self.version += 1
+                self._free_node(removed)
                 return
 
             itr = itr.next
@@ -128,15 +278,21 @@ class LinkedList:
             raise ValueError(f"Value {data} not found in the list")
 
         if self.head.data == data:
-            self.head = self.head.next
+            removed = self.head
+            self.head = removed.next
             self.length -= 1
+            self.version += 1
+            self._free_node(removed)
             return
 
         itr = self.head
         while itr.next:
             if itr.next.data == data:
-                itr.next = itr.next.next
+                removed = itr.next
+                itr.next = removed.next
                 self.length -= 1
+                self.version += 1
+                self._free_node(removed)
                 return
             itr = itr.next
 
@@ -146,6 +302,18 @@ class LinkedList:
         """Return the number of nodes. O(1) time, O(1) space."""
         return self.length
 
+    def cursor(self, index: int = 0) -> Cursor:
+        """Return a cursor at a given index (index == length is the end position). O(n) time, O(1) space."""
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+
+        prev = None
+        itr = self.head
+        for _ in range(index):
+            prev = itr
+            itr = itr.next
+        return Cursor(self, prev, itr, index)
+
     def print(self) -> None:
         """Print all elements as a string. O(n) time, O(n) space."""
         if self.head is None:
@@ -162,6 +330,128 @@ class LinkedList:
         print("-->".join(parts))
 
 
+class Cursor:
+    def __init__(self, lst: LinkedList, prev: Node | None, node: Node | None, index: int) -> None:
+        self.lst = lst
+        # The predecessor is kept so that insert_before() and remove() need no search
+        self.prev = prev
+        self.node = node
+        self.index = index
+        self.version = lst.version
+
+    def _check(self) -> None:
+        """Reject use after the list was changed by anything but this cursor. O(1) time, O(1) space."""
+        if self.version != self.lst.version:
+            raise RuntimeError("List was modified outside this cursor")
+
+    def _check_node(self) -> None:
+        """Reject operations on the current element at the end position. O(1) time, O(1) space."""
+        self._check()
+        if self.node is None:
+            raise IndexError("Cursor is at the end of the list")
+
+    def _changed(self, delta: int) -> None:
+        """Record a structural change made through this cursor. O(1) time, O(1) space."""
+        self.lst.length += delta
+        self.lst.version += 1
+        self.version = self.lst.version
+
+    def at_end(self) -> bool:
+        """Check if the cursor is past the last element. O(1) time, O(1) space."""
+        self._check()
+        return self.node is None
+
+    def get(self) -> Any:
+        """Return the current element. O(1) time, O(1) space."""
+        self._check_node()
+        return self.node.data
+
+    def set(self, data: Any) -> None:
+        """Replace the current element in place. O(1) time, O(1) space."""
+        self._check_node()
+        self.node.data = data
+
+    def move(self, steps: int = 1) -> None:
+        """Move forward by steps (a singly linked list cannot move back). O(steps) time, O(1) space."""
+        self._check()
+        if steps < 0:
+            raise ValueError("A singly linked list cursor can only move forward")
+        if self.index + steps > self.lst.length:
+            raise IndexError("Invalid index")
+
+        for _ in range(steps):
+            self.prev = self.node
+            self.node = self.node.next
+        self.index += steps
+
+    def insert_before(self, data: Any) -> None:
+        """Insert an element before the current one and stay on the current one. O(1) time, O(1) space."""
+        self._check()
+        node = self.lst._new_node(data, self.node)
+        if self.prev is None:
+            self.lst.head = node
+        else:
+            self.prev.next = node
+        self.prev = node
+        self.index += 1
+        self._changed(1)
+
+    def insert_after(self, data: Any) -> None:
+        """Insert an element after the current one and stay on the current one. O(1) time, O(1) space."""
+        self._check_node()
+        self.node.next = self.lst._new_node(data, self.node.next)
+        self._changed(1)
+
+    def remove(self) -> Any:
+        """Remove the current element, move to its successor and return the element. O(1) time, O(1) space."""
+        self._check_node()
+        removed = self.node
+        data = removed.data
+        if self.prev is None:
+            self.lst.head = removed.next
+        else:
+            self.prev.next = removed.next
+        self.node = removed.next
+        self._changed(-1)
+        self.lst._free_node(removed)
+        return data
+
+
+def memory_report(num_elements: int = 10000) -> dict[str, float]:
+    """Measure bytes per element of slotted nodes, __dict__ nodes and a Python list. O(n) time, O(n) space."""
+
+    class DictNode:
+        """Node without __slots__, as it was before, for comparison."""
+
+        def __init__(self, data: Any = None, next: DictNode | None = None) -> None:
+            self.data = data
+            self.next = next
+
+    def measure(build: Any) -> float:
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            structure = build()
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del structure
+        return used / num_elements
+
+    def build_chain(node_class: type) -> Any:
+        # The elements are all None, so only the nodes themselves are measured
+        head = None
+        for _ in range(num_elements):
+            head = node_class(None, head)
+        return head
+
+    return {
+        "slotted_node": measure(lambda: build_chain(Node)),
+        "dict_node": measure(lambda: build_chain(DictNode)),
+        "python_list": measure(lambda: [None] * num_elements),
+    }
+
+
 if __name__ == "__main__":
     ll = LinkedList()
 
@@ -222,4 +512,139 @@ if __name__ == "__main__":
     except ValueError:
         pass
 
+    # Test bulk operations
+    bulk = LinkedList()
+    bulk.extend(range(3))
+    bulk.extend(x * 10 for x in range(3, 5))
+    bulk.extend([])
+    assert bulk.get_length() == 5 and bulk.find(40) == 4, "extend() should append a whole iterable"
+    bulk.insert_iterable_at(0, ["a", "b"])
+    bulk.insert_iterable_at(4, iter(["m"]))
+    bulk.insert_iterable_at(bulk.get_length(), ["z"])
+
+    def to_list(lst: LinkedList) -> list[Any]:
+        items = []
+        itr = lst.head
+        while itr:
+            items.append(itr.data)
+            itr = itr.next
+        assert len(items) == lst.get_length(), "Length should match the chain"
+        return items
+
+    assert to_list(bulk) == ["a", "b", 0, 1, "m", 2, 30, 40, "z"], "Should insert iterables at any index"
+
+    other = LinkedList()
+    other.replace_with_list(["x", "y"])
+    moved_head = other.head
+    bulk.concat(other)
+    assert to_list(bulk)[-3:] == ["z", "x", "y"], "concat() should append the other list"
+    assert bulk._get_last_node().data == "y" and other.is_empty(), "concat() should empty the other list"
+    itr = bulk.head
+    while itr is not moved_head and itr is not None:
+        itr = itr.next
+    assert itr is moved_head, "concat() should move nodes, not copy them"
+    empty = LinkedList()
+    empty.concat(bulk)
+    assert to_list(empty)[:2] == ["a", "b"] and bulk.is_empty(), "Concatenating onto an empty list should work"
+
+    try:
+        empty.insert_iterable_at(100, [1])
+        assert False, "Should raise IndexError for invalid index"
+    except IndexError:
+        pass
+
+    try:
+        empty.concat(empty)
+        assert False, "Should raise ValueError when concatenating a list with itself"
+    except ValueError:
+        pass
+
+    # Test cursors: O(1) edits at a held position
+    buffer = LinkedList()
+    buffer.replace_with_list(list("held"))
+    cur = buffer.cursor()
+    assert cur.get() == "h" and cur.index == 0, "Cursor should start at the head"
+    cur.insert_before("<")
+    cur.move(3)
+    cur.insert_after("!")
+    assert cur.get() == "d" and cur.index == 4, "Cursor should stay on its element after inserts"
+    cur.set("D")
+    assert cur.remove() == "D" and cur.get() == "!", "remove() should move to the successor"
+    cur.move()
+    assert cur.at_end() and cur.index == 5, "Cursor should reach the end position"
+    cur.insert_before(">")
+    assert to_list(buffer) == ["<", "h", "e", "l", "!", ">"], "Edits should link correctly"
+    assert buffer.cursor(buffer.get_length()).at_end(), "cursor(length) should be the end position"
+
+    front = buffer.cursor()
+    assert front.remove() == "<" and buffer.head.data == "h", "Removing at the head should move the head"
+    for bad_call in (cur.move, cur.get):
+        try:
+            bad_call()
+            assert False, "Should raise RuntimeError after a change through another cursor"
+        except RuntimeError:
+            pass
+    front.insert_before("^")
+    assert buffer.head.data == "^" and front.get() == "h", "Cursor should stay valid after its own edits"
+    buffer.insert_at_end("$")
+    try:
+        front.get()
+        assert False, "Should raise RuntimeError after a change through the list"
+    except RuntimeError:
+        pass
+
+    end = buffer.cursor(buffer.get_length())
+    for bad_call in (end.get, end.remove, lambda: end.insert_after(0), end.move):
+        try:
+            bad_call()
+            assert False, "Should raise IndexError at the end position"
+        except IndexError:
+            pass
+
+    try:
+        buffer.cursor().move(-1)
+        assert False, "Should raise ValueError when moving backward"
+    except ValueError:
+        pass
+
+    # Test slotted nodes have no per-instance __dict__
+    assert not hasattr(Node(1), "__dict__"), "Node should use __slots__"
+
+    # Test node pooling recycles removed nodes
+    pool = NodePool(max_size=50)
+    pooled = LinkedList(pool)
+    pooled.replace_with_list(list(range(100)))
+    assert pool.allocated == 100 and pool.reused == 0, "Empty pool should allocate new nodes"
+    for _ in range(60):
+        pooled.remove_at(0)
+    pooled.remove_by_value(99)
+    assert pool.size == 50, "Pool should keep at most max_size free nodes"
+    assert pool.free.data is None, "Pooled nodes should not keep their elements alive"
+    for i in range(30):
+        pooled.insert_at_end(i)
+    pooled.insert_at(1, "x")
+    pooled.insert_after_value("x", "y")
+    assert pool.reused == 32 and pool.allocated == 100, "Inserts should reuse pooled nodes first"
+    assert pooled.get_length() == 71 and pooled.find("y") == 2, "Recycled nodes should link correctly"
+    assert pooled.find(60) == 0 and pooled.find(29) == 70, "Order should be preserved"
+
+    # Test replacing the contents hands the old nodes to the pool for the new chain
+    reload_pool = NodePool(max_size=1000)
+    reloaded = LinkedList(reload_pool)
+    reloaded.replace_with_list(list(range(100)))
+    reloaded.replace_with_list(list(range(40)))
+    assert reload_pool.size == 60 and reload_pool.reused == 40, "Old nodes should be recycled by the reload"
+    assert reload_pool.allocated == 100, "A smaller reload should not allocate new nodes"
+    assert reloaded.find(39) == 39 and reloaded.get_length() == 40, "Reloaded list should hold the new elements"
+
+    # A pool can be shared by several lists
+    other = LinkedList(pool)
+    other.insert_at_beginning("shared")
+    assert pool.reused == 33 and other.find("shared") == 0, "Lists should share the pool"
+
+    # Test the memory report: slots save memory per element, a Python list is smaller still
+    report = memory_report(2000)
+    assert report["slotted_node"] < report["dict_node"], "Slotted nodes should be smaller"
+    assert report["python_list"] < report["slotted_node"], "A Python list should use the least memory"
+
     print("All tests passed!")
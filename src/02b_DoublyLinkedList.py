@@ -1,9 +1,27 @@
 from __future__ import annotations
 
-from typing import Any
+import tracemalloc
+from typing import Any, Iterable
+
+# Memory: Node declares __slots__, so instances store their three fields in fixed slots instead
+# of a per-instance __dict__, which roughly halves the bytes per element (see memory_report()).
+# Node pooling: workloads that constantly insert and remove elements spend much of their time
+# allocating and garbage-collecting nodes. A DoublyLinkedList created with a NodePool hands
+# removed nodes to the pool's free list (threaded through their next pointers), and later
+# inserts take nodes from there before allocating new ones. A pool can be shared by several lists.
+# Bulk operations: extend(), insert_iterable_at() and replace_with_list() first build a detached
+# chain of new nodes and then link it in with a constant number of pointer updates. splice() and
+# concat() move the nodes of another list over without touching them one by one, and
+# extract_slice() cuts a range out into a new list, so only the walk to the range costs O(n).
+# Cursors: a Cursor holds a node, so edits at that position are O(1) instead of a search from
+# the head for every edit, and it can move in both directions. Every structural change bumps the
+# list's version; a cursor that sees a version it did not produce itself raises RuntimeError,
+# since its node may have been removed in the meantime (like a dict changed during iteration).
 
 
 class Node:
+    __slots__ = ("data", "next", "prev")
+
     def __init__(
         self,
         data: Any = None,
@@ -15,11 +33,62 @@ class Node:
         self.prev = prev
 
 
+class NodePool:
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must not be negative")
+        # Free nodes form a singly linked list through their next pointers
+        self.free = None
+        self.size = 0
+        self.max_size = max_size
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, data: Any = None, next: Node | None = None, prev: Node | None = None) -> Node:
+        """Return a recycled node if available, else a new one. O(1) time, O(1) space."""
+        node = self.free
+        if node is None:
+            self.allocated += 1
+            return Node(data, next, prev)
+        self.free = node.next
+        self.size -= 1
+        self.reused += 1
+        node.data = data
+        node.next = next
+        node.prev = prev
+        return node
+
+    def release(self, node: Node) -> None:
+        """Put a removed node on the free list unless the pool is full. O(1) time, O(1) space."""
+        if self.size >= self.max_size:
+            return
+        # Drop the references so that the element and the neighbours can be garbage-collected
+        node.data = None
+        node.prev = None
+        node.next = self.free
+        self.free = node
+        self.size += 1
+
+
 class DoublyLinkedList:
-    def __init__(self) -> None:
+    def __init__(self, pool: NodePool | None = None) -> None:
         self.head = None
         self.tail = None
         self.length = 0
+        # Bumped by every structural change, so cursors can detect outside modifications
+        self.version = 0
+        self.pool = pool
+
+    def _new_node(self, data: Any, next: Node | None = None, prev: Node | None = None) -> Node:
+        """Create a node, recycling one from the pool if there is one. O(1) time, O(1) space."""
+        if self.pool is not None:
+            return self.pool.acquire(data, next, prev)
+        return Node(data, next, prev)
+
+    def _free_node(self, node: Node) -> None:
+        """Return a removed node to the pool, if there is one. O(1) time, O(1) space."""
+        if self.pool is not None:
+            self.pool.release(node)
 
     def find(self, data: Any) -> int:
         """Return index of first occurrence, or -1 if not found. O(n) time, O(1) space."""
@@ -41,7 +110,7 @@ class DoublyLinkedList:
 
     def insert_at_beginning(self, data: Any) -> None:
         """Insert a node at the head. O(1) time, O(1) space."""
-        node = Node(data, self.head, None)
+        node = self._new_node(data, self.head, None)
         if self.head is None:
             self.head = node
             self.tail = node
@@ -49,6 +118,7 @@ class DoublyLinkedList:
             self.head.prev = node
             self.head = node
         self.length += 1
+        self.version += 1
 
     def insert_at_end(self, data: Any) -> None:
         """Insert a node at the tail. O(1) time, O(1) space."""
@@ -56,10 +126,11 @@ class DoublyLinkedList:
             self.insert_at_beginning(data)
             return
 
-        node = Node(data, None, self.tail)
+        node = self._new_node(data, None, self.tail)
         self.tail.next = node
         self.tail = node
         self.length += 1
+        self.version += 1
 
     def _get_node_at(self, index: int) -> Node:
         """Return the node at a given index, traversing from the nearest end. O(n) time, O(1) space."""
@@ -87,11 +158,12 @@ class DoublyLinkedList:
             return
 
         itr = self._get_node_at(index - 1)
-        node = Node(data, itr.next, itr)
+        node = self._new_node(data, itr.next, itr)
         if itr.next:
             itr.next.prev = node
         itr.next = node
         self.length += 1
+        self.version += 1
 
     def insert_after_value(self, data_after: Any, data_to_insert: Any) -> None:
         """Insert a node after the first occurrence of a value. O(n) time, O(1) space."""
@@ -101,24 +173,133 @@ class DoublyLinkedList:
         itr = self.head
         while itr:
             if itr.data == data_after:
-                node = Node(data_to_insert, itr.next, itr)
+                node = self._new_node(data_to_insert, itr.next, itr)
                 itr.next = node
                 if node.next:
                     node.next.prev = node
                 else:
                     self.tail = node
                 self.length += 1
+                self.version += 1
                 return
             itr = itr.next
         raise ValueError(f"Value {data_after} not found in the list")
 
+    def _build_chain(self, data: Iterable[Any]) -> tuple[Node | None, Node | None, int]:
+        """Build a detached chain of nodes and return (head, tail, count). O(m) time, O(m) space."""
+        head = None
+        tail = None
+        count = 0
+        for item in data:
+            node = self._new_node(item, None, tail)
+            if tail is None:
+                head = node
+            else:
+                tail.next = node
+            tail = node
+            count += 1
+        return head, tail, count
+
+    def _link_chain(self, prev: Node | None, head: Node | None, tail: Node | None, count: int) -> None:
+        """Link a detached chain in after prev (at the head if prev is None). O(1) time, O(1) space."""
+        if head is None:
+            return
+        after = self.head if prev is None else prev.next
+        head.prev = prev
+        tail.next = after
+        if prev is None:
+            self.head = head
+        else:
+            prev.next = head
+        if after is None:
+            self.tail = tail
+        else:
+            after.prev = tail
+        self.length += count
+        self.version += 1
+
+    def _unlink_chain(self, head: Node, tail: Node, count: int) -> None:
+        """Unlink the nodes from head to tail, leaving them a detached chain. O(1) time, O(1) space."""
+        if head.prev is None:
+            self.head = tail.next
+        else:
+            head.prev.next = tail.next
+        if tail.next is None:
+            self.tail = head.prev
+        else:
+            tail.next.prev = head.prev
+        head.prev = None
+        tail.next = None
+        self.length -= count
+        self.version += 1
+
+    def _free_chain(self, head: Node | None) -> None:
+        """Return all nodes of a detached chain to the pool, if there is one. O(n) time with a pool, O(1) space."""
+        if self.pool is None:
+            return
+        while head is not None:
+            # release() reuses the next pointer for the free list, so read it first
+            next_node = head.next
+            self.pool.release(head)
+            head = next_node
+
     def replace_with_list(self, data_list: list[Any]) -> None:
-        """Replace the list with elements from data_list. O(m) time, O(1) space."""
-        self.head = None
-        self.tail = None
-        self.length = 0
-        for data in data_list:
-            self.insert_at_end(data)
+        """Replace the contents with data_list, built as one chain. O(m) time (O(n + m) with a pool), O(1) space."""
+        # The old nodes go to the pool first, so that the new chain can reuse them
+        self._free_chain(self.head)
+        self.head, self.tail, self.length = self._build_chain(data_list)
+        self.version += 1
+
+    def extend(self, data: Iterable[Any]) -> None:
+        """Append all elements of an iterable, linking the prebuilt chain at once. O(m) time, O(1) space."""
+        self._link_chain(self.tail, *self._build_chain(data))
+
+    def insert_iterable_at(self, index: int, data: Iterable[Any]) -> None:
+        """Insert all elements of an iterable at an index with one traversal. O(n + m) time, O(1) space."""
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+
+        head, tail, count = self._build_chain(data)
+        prev = None if index == 0 else self._get_node_at(index - 1)
+        self._link_chain(prev, head, tail, count)
+
+    def splice(self, index: int, other: DoublyLinkedList) -> None:
+        """Move all nodes of other in at an index, emptying it. O(1) at either end, else O(n) time, O(1) space."""
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+
+        prev = None if index == 0 else self._get_node_at(index - 1)
+        self._link_chain(prev, other.head, other.tail, other.length)
+        other.head = None
+        other.tail = None
+        other.length = 0
+        other.version += 1
+
+    def concat(self, other: DoublyLinkedList) -> None:
+        """Move all nodes of other to the end of this list, emptying other. O(1) time, O(1) space."""
+        self.splice(self.length, other)
+
+    def extract_slice(self, start: int, stop: int) -> DoublyLinkedList:
+        """Cut the nodes in [start, stop) out into a new list without copying. O(n + k) time, O(1) space."""
+        if start < 0 or stop > self.length or start > stop:
+            raise IndexError("Invalid index")
+
+        result = DoublyLinkedList(self.pool)
+        count = stop - start
+        if count == 0:
+            return result
+
+        head = self._get_node_at(start)
+        tail = head
+        for _ in range(count - 1):
+            tail = tail.next
+        self._unlink_chain(head, tail, count)
+        result.head = head
+        result.tail = tail
+        result.length = count
+        return result
 
     def remove_at(self, index: int) -> None:
         """Remove node at a given index, traversing from the nearest end. O(n) time, O(1) space."""
@@ -126,12 +307,15 @@ class DoublyLinkedList:
             raise IndexError("Invalid index")
 
         if index == 0:
-            self.head = self.head.next
+            removed = self.head
+            self.head = removed.next
             if self.head:
                 self.head.prev = None
             else:
                 self.tail = None
             self.length -= 1
+            self.version += 1
+            self._free_node(removed)
             return
 
         itr = self._get_node_at(index)
@@ -141,6 +325,8 @@ class DoublyLinkedList:
         else:
             self.tail = itr.prev
         self.length -= 1
+        self.version += 1
+        self._free_node(itr)
 
     def remove_by_value(self, data: Any) -> None:
         """Remove first node with the given value. O(n) time, O(1) space."""
@@ -148,12 +334,15 @@ class DoublyLinkedList:
             raise ValueError(f"Value {data} not found in the list")
 
         if self.head.data == data:
-            self.head = self.head.next
+            removed = self.head
+            self.head = removed.next
             if self.head:
                 self.head.prev = None
             else:
                 self.tail = None
             self.length -= 1
+            self.version += 1
+            self._free_node(removed)
             return
 
         itr = self.head
@@ -165,6 +354,8 @@ class DoublyLinkedList:
                 else:
                     self.tail = itr.prev
                 self.length -= 1
+                self.version += 1
+                self._free_node(itr)
                 return
             itr = itr.next
         raise ValueError(f"Value {data} not found in the list")
@@ -173,6 +364,14 @@ class DoublyLinkedList:
         """Return the number of nodes. O(1) time, O(1) space."""
         return self.length
 
+    def cursor(self, index: int = 0) -> Cursor:
+        """Return a cursor at a given index (index == length is the end position). O(n) time, O(1) space."""
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+
+        node = None if index == self.length else self._get_node_at(index)
+        return Cursor(self, node, index)
+
     def print_forward(self) -> None:
         """Print all elements head to tail. O(n) time, O(n) space."""
         if self.head is None:
@@ -204,6 +403,143 @@ class DoublyLinkedList:
         print("-->".join(parts))
 
 
+class Cursor:
+    def __init__(self, lst: DoublyLinkedList, node: Node | None, index: int) -> None:
+        self.lst = lst
+        # None is the end position, one past the tail
+        self.node = node
+        self.index = index
+        self.version = lst.version
+
+    def _check(self) -> None:
+        """Reject use after the list was changed by anything but this cursor. O(1) time, O(1) space."""
+        if self.version != self.lst.version:
+            raise RuntimeError("List was modified outside this cursor")
+
+    def _check_node(self) -> None:
+        """Reject operations on the current element at the end position. O(1) time, O(1) space."""
+        self._check()
+        if self.node is None:
+            raise IndexError("Cursor is at the end of the list")
+
+    def _changed(self, delta: int) -> None:
+        """Record a structural change made through this cursor. O(1) time, O(1) space."""
+        self.lst.length += delta
+        self.lst.version += 1
+        self.version = self.lst.version
+
+    def at_end(self) -> bool:
+        """Check if the cursor is past the last element. O(1) time, O(1) space."""
+        self._check()
+        return self.node is None
+
+    def get(self) -> Any:
+        """Return the current element. O(1) time, O(1) space."""
+        self._check_node()
+        return self.node.data
+
+    def set(self, data: Any) -> None:
+        """Replace the current element in place. O(1) time, O(1) space."""
+        self._check_node()
+        self.node.data = data
+
+    def move(self, steps: int = 1) -> None:
+        """Move forward (or backward for negative steps). O(|steps|) time, O(1) space."""
+        self._check()
+        if self.index + steps < 0 or self.index + steps > self.lst.length:
+            raise IndexError("Invalid index")
+
+        for _ in range(steps):
+            self.node = self.node.next
+        for _ in range(-steps):
+            self.node = self.lst.tail if self.node is None else self.node.prev
+        self.index += steps
+
+    def insert_before(self, data: Any) -> None:
+        """Insert an element before the current one and stay on the current one. O(1) time, O(1) space."""
+        self._check()
+        prev = self.lst.tail if self.node is None else self.node.prev
+        node = self.lst._new_node(data, self.node, prev)
+        if prev is None:
+            self.lst.head = node
+        else:
+            prev.next = node
+        if self.node is None:
+            self.lst.tail = node
+        else:
+            self.node.prev = node
+        self.index += 1
+        self._changed(1)
+
+    def insert_after(self, data: Any) -> None:
+        """Insert an element after the current one and stay on the current one. O(1) time, O(1) space."""
+        self._check_node()
+        node = self.lst._new_node(data, self.node.next, self.node)
+        if node.next is None:
+            self.lst.tail = node
+        else:
+            node.next.prev = node
+        self.node.next = node
+        self._changed(1)
+
+    def remove(self) -> Any:
+        """Remove the current element, move to its successor and return the element. O(1) time, O(1) space."""
+        self._check_node()
+        removed = self.node
+        data = removed.data
+        if removed.prev is None:
+            self.lst.head = removed.next
+        else:
+            removed.prev.next = removed.next
+        if removed.next is None:
+            self.lst.tail = removed.prev
+        else:
+            removed.next.prev = removed.prev
+        self.node = removed.next
+        self._changed(-1)
+        self.lst._free_node(removed)
+        return data
+
+
+def memory_report(num_elements: int = 10000) -> dict[str, float]:
+    """Measure bytes per element of slotted nodes, __dict__ nodes and a Python list. O(n) time, O(n) space."""
+
+    class DictNode:
+        """Node without __slots__, as it was before, for comparison."""
+
+        def __init__(self, data: Any = None, next: DictNode | None = None, prev: DictNode | None = None) -> None:
+            self.data = data
+            self.next = next
+            self.prev = prev
+
+    def measure(build: Any) -> float:
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            structure = build()
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del structure
+        return used / num_elements
+
+    def build_chain(node_class: type) -> Any:
+        # The elements are all None, so only the nodes themselves are measured
+        head = None
+        for _ in range(num_elements):
+            node = node_class(None, head, None)
+            if head is not None:
+                head.prev = node
+            head = node
+        return head
+
+    return {
+        "slotted_node": measure(lambda: build_chain(Node)),
+        "dict_node": measure(lambda: build_chain(DictNode)),
+        "python_list": measure(lambda: [None] * num_elements),
+    }
+
+
 if __name__ == "__main__":
     ll = DoublyLinkedList()
 
@@ -278,4 +614,164 @@ if __name__ == "__main__":
     except ValueError:
         pass
 
+    # Test bulk operations: every node must be linked both ways and head, tail and length must agree
+    def check_links(lst: DoublyLinkedList) -> list[Any]:
+        forward = []
+        prev = None
+        itr = lst.head
+        while itr:
+            assert itr.prev is prev, "prev pointers should mirror next pointers"
+            forward.append(itr.data)
+            prev = itr
+            itr = itr.next
+        assert lst.tail is prev and lst.length == len(forward), "Tail and length should match the chain"
+        return forward
+
+    bulk = DoublyLinkedList()
+    bulk.extend(range(3))
+    bulk.extend(x * 10 for x in range(3, 5))
+    bulk.extend([])
+    assert check_links(bulk) == [0, 1, 2, 30, 40], "extend() should append a whole iterable"
+    bulk.insert_iterable_at(0, ["a", "b"])
+    bulk.insert_iterable_at(4, iter(["m"]))
+    bulk.insert_iterable_at(bulk.get_length(), ["z"])
+    assert check_links(bulk) == ["a", "b", 0, 1, "m", 2, 30, 40, "z"], "Should insert iterables at any index"
+
+    # Splicing moves the nodes over in O(1) and empties the other list
+    other = DoublyLinkedList()
+    other.replace_with_list(["x", "y"])
+    moved_head = other.head
+    bulk.splice(2, other)
+    assert check_links(bulk) == ["a", "b", "x", "y", 0, 1, "m", 2, 30, 40, "z"], "splice() should link in place"
+    assert bulk._get_node_at(2) is moved_head, "splice() should move nodes, not copy them"
+    assert other.is_empty() and other.tail is None and other.get_length() == 0, "Spliced list should be empty"
+    other.replace_with_list([98, 99])
+    bulk.concat(other)
+    assert check_links(bulk)[-3:] == ["z", 98, 99] and bulk.tail.data == 99, "concat() should append in O(1)"
+    other.concat(DoublyLinkedList())
+    assert other.is_empty(), "Concatenating two empty lists should stay empty"
+
+    # Slices are cut out without copying; the rest of the list closes the gap
+    middle = bulk.extract_slice(2, 4)
+    assert check_links(middle) == ["x", "y"] and middle.head is moved_head, "Slice should reuse the nodes"
+    assert check_links(bulk) == ["a", "b", 0, 1, "m", 2, 30, 40, "z", 98, 99], "Slice should be removed"
+    front = bulk.extract_slice(0, 2)
+    back = bulk.extract_slice(bulk.get_length() - 2, bulk.get_length())
+    assert check_links(front) == ["a", "b"] and check_links(back) == [98, 99], "Should slice at both ends"
+    assert check_links(bulk.extract_slice(3, 3)) == [], "Empty slice should give an empty list"
+    whole = bulk.extract_slice(0, bulk.get_length())
+    assert check_links(whole) == [0, 1, "m", 2, 30, 40, "z"] and check_links(bulk) == [], "Should cut everything"
+
+    for bad_call in (
+        lambda: bulk.insert_iterable_at(1, [1]),
+        lambda: bulk.splice(-1, DoublyLinkedList()),
+        lambda: whole.extract_slice(2, 1),
+        lambda: whole.extract_slice(0, 100),
+    ):
+        try:
+            bad_call()
+            assert False, "Should raise IndexError for invalid index"
+        except IndexError:
+            pass
+
+    try:
+        whole.splice(0, whole)
+        assert False, "Should raise ValueError when splicing a list into itself"
+    except ValueError:
+        pass
+
+    # Test cursors: O(1) edits at a held position, moving both ways
+    buffer = DoublyLinkedList()
+    buffer.replace_with_list(list("held"))
+    cur = buffer.cursor(3)
+    cur.insert_after("!")
+    cur.insert_before("l")
+    assert cur.get() == "d" and cur.index == 4, "Cursor should stay on its element after inserts"
+    assert check_links(buffer) == ["h", "e", "l", "l", "d", "!"], "Inserts should link both ways"
+    cur.move(-4)
+    cur.insert_before("<")
+    assert buffer.head.data == "<" and cur.get() == "h", "Inserting before the head should move the head"
+    cur.move(5)
+    assert cur.remove() == "!" and cur.at_end(), "Removing the tail should move to the end position"
+    assert buffer.tail.data == "d", "Removing the tail should move the tail"
+    cur.insert_before(">")
+    cur.move(-1)
+    cur.set("]")
+    assert check_links(buffer) == ["<", "h", "e", "l", "l", "d", "]"], "Edits at the end should link correctly"
+    cur.move(-6)
+    assert cur.remove() == "<" and cur.get() == "h" and cur.index == 0, "Should remove the head"
+    assert check_links(buffer) == ["h", "e", "l", "l", "d", "]"], "Head removal should link correctly"
+
+    other_cur = buffer.cursor(2)
+    other_cur.remove()
+    for bad_call in (cur.get, lambda: cur.move(1), lambda: cur.insert_before(0)):
+        try:
+            bad_call()
+            assert False, "Should raise RuntimeError after a change through another cursor"
+        except RuntimeError:
+            pass
+    buffer.concat(DoublyLinkedList())
+    other_cur = buffer.cursor(1)
+    buffer.extend(["x"])
+    try:
+        other_cur.get()
+        assert False, "Should raise RuntimeError after a change through the list"
+    except RuntimeError:
+        pass
+
+    end = buffer.cursor(buffer.get_length())
+    start = buffer.cursor()
+    for bad_call in (end.get, end.remove, lambda: end.insert_after(0), end.move, lambda: start.move(-1)):
+        try:
+            bad_call()
+            assert False, "Should raise IndexError outside the list"
+        except IndexError:
+            pass
+
+    # Test slotted nodes have no per-instance __dict__
+    assert not hasattr(Node(1), "__dict__"), "Node should use __slots__"
+
+    # Test node pooling recycles removed nodes
+    pool = NodePool(max_size=50)
+    pooled = DoublyLinkedList(pool)
+    pooled.replace_with_list(list(range(100)))
+    assert pool.allocated == 100 and pool.reused == 0, "Empty pool should allocate new nodes"
+    for _ in range(30):
+        pooled.remove_at(0)
+    for _ in range(30):
+        pooled.remove_at(pooled.get_length() - 1)
+    pooled.remove_by_value(50)
+    assert pool.size == 50, "Pool should keep at most max_size free nodes"
+    assert pool.free.data is None and pool.free.prev is None, "Pooled nodes should drop their references"
+    for i in range(30):
+        pooled.insert_at_end(i)
+    pooled.insert_at_beginning("first")
+    pooled.insert_at(1, "x")
+    pooled.insert_after_value("x", "y")
+    assert pool.reused == 33 and pool.allocated == 100, "Inserts should reuse pooled nodes first"
+    assert pooled.get_length() == 72 and pooled.find("y") == 2, "Recycled nodes should link correctly"
+    assert pooled.head.data == "first" and pooled.tail.data == 29, "Head and tail should be correct"
+    itr = pooled.tail
+    backward = []
+    while itr:
+        backward.append(itr.data)
+        itr = itr.prev
+    assert backward[::-1] == ["first", "x", "y"] + [v for v in range(30, 70) if v != 50] + list(range(30)), (
+        "prev pointers of recycled nodes should be consistent"
+    )
+
+    # Test replacing the contents hands the old nodes to the pool for the new chain
+    reload_pool = NodePool(max_size=1000)
+    reloaded = DoublyLinkedList(reload_pool)
+    reloaded.replace_with_list(list(range(100)))
+    reloaded.replace_with_list(list(range(40)))
+    assert reload_pool.size == 60 and reload_pool.reused == 40, "Old nodes should be recycled by the reload"
+    assert reload_pool.allocated == 100, "A smaller reload should not allocate new nodes"
+    assert reloaded.find(39) == 39 and reloaded.tail.data == 39, "Reloaded list should hold the new elements"
+
+    # Test the memory report: slots save memory per element, a Python list is smaller still
+    report = memory_report(2000)
+    assert report["slotted_node"] < report["dict_node"], "Slotted nodes should be smaller"
+    assert report["python_list"] < report["slotted_node"], "A Python list should use the least memory"
+
     print("All tests passed!")
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+# An unrolled linked list stores up to chunk_size elements per node in a small array (a Python
+# list here) instead of one element per node. Compared to LinkedList (02a) this means:
+# * ~chunk_size times fewer node objects (and next pointers) for the same elements
+# * walking to an index skips a whole chunk per step: O(n/B) instead of O(n) for B = chunk_size
+# * searching scans each chunk with list.index(), i.e. in C over contiguous memory
+# Inserting into a full chunk splits it into two half-full chunks, and removing from a chunk
+# that drops below half full merges it with (or borrows from) its successor. Apart from the
+# last chunk, chunks therefore stay at least half full, so the list needs at most ~2n/B nodes.
+
+
+class Node:
+    __slots__ = ("items", "next")
+
+    def __init__(self, items: list[Any] | None = None, next: Node | None = None) -> None:
+        self.items = items if items is not None else []
+        self.next = next
+
+
+class UnrolledLinkedList:
+    def __init__(self, chunk_size: int = 64) -> None:
+        if chunk_size < 2:
+            raise ValueError("chunk_size must be at least 2")
+        self.chunk_size = chunk_size
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def _locate(self, index: int) -> tuple[Node | None, Node, int]:
+        """Return (previous node, node, offset) of an element index. O(n/B) time, O(1) space."""
+        prev = None
+        itr = self.head
+        while index >= len(itr.items):
+            index -= len(itr.items)
+            prev = itr
+            itr = itr.next
+        return prev, itr, index
+
+    def find(self, data: Any) -> int:
+        """Return index of first occurrence, or -1 if not found. O(n) time, O(1) space."""
+        itr = self.head
+
+        index = 0
+        while itr:
+            try:
+                return index + itr.items.index(data)
+            except ValueError:
+                pass
+
+            index += len(itr.items)
+            itr = itr.next
+
+        return -1
+
+    def get_at(self, index: int) -> Any:
+        """Return the element at a given index. O(n/B) time, O(1) space."""
+        if index < 0 or index >= self.length:
+            raise IndexError("Invalid index")
+        _, node, offset = self._locate(index)
+        return node.items[offset]
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty. O(1) time, O(1) space."""
+        return self.head is None
+
+    def _insert_into(self, node: Node, offset: int, data: Any) -> None:
+        """Insert into a chunk, splitting it in half if it overflows. O(B) time, O(B) space."""
+        node.items.insert(offset, data)
+        if len(node.items) > self.chunk_size:
+            half = len(node.items) // 2
+            node.next = Node(node.items[half:], node.next)
+            del node.items[half:]
+            if self.tail is node:
+                self.tail = node.next
+        self.length += 1
+
+    def insert_at_beginning(self, data: Any) -> None:
+        """Insert an element at the head. O(B) time, O(1) space."""
+        if self.head is None:
+            self.head = self.tail = Node([data])
+            self.length += 1
+            return
+        self._insert_into(self.head, 0, data)
+
+    def insert_at_end(self, data: Any) -> None:
+        """Insert an element at the tail. O(1) amortized time, O(1) space."""
+        if self.tail is None:
+            self.head = self.tail = Node([data])
+        elif len(self.tail.items) < self.chunk_size:
+            self.tail.items.append(data)
+        else:
+            # Start a new chunk instead of splitting, so sequential appends fill chunks completely
+            self.tail.next = Node([data])
+            self.tail = self.tail.next
+        self.length += 1
+
+    def insert_at(self, index: int, data: Any) -> None:
+        """Insert an element at a given index. O(n/B + B) time, O(1) space."""
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+
+        if index == self.length:
+            self.insert_at_end(data)
+            return
+
+        _, node, offset = self._locate(index)
+        self._insert_into(node, offset, data)
+
+    def insert_after_value(self, data_after: Any, data_to_insert: Any) -> None:
+        """Insert an element after the first occurrence of a value. O(n) time, O(1) space."""
+        itr = self.head
+        while itr:
+            try:
+                offset = itr.items.index(data_after)
+            except ValueError:
+                itr = itr.next
+                continue
+            self._insert_into(itr, offset + 1, data_to_insert)
+            return
+        raise ValueError(f"Value {data_after} not found in the list")
+
+    def replace_with_list(self, data_list: list[Any]) -> None:
+        """Replace the list with elements from data_list, in full chunks. O(m) time, O(1) space."""
+        self.head = None
+        self.tail = None
+        self.length = 0
+        for start in range(0, len(data_list), self.chunk_size):
+            node = Node(list(data_list[start : start + self.chunk_size]))
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+            self.length += len(node.items)
+
+    def _remove_from(self, prev: Node | None, node: Node, offset: int) -> None:
+        """Remove from a chunk, then merge or rebalance it if it is less than half full. O(B) time, O(1) space."""
+        del node.items[offset]
+        self.length -= 1
+
+        if not node.items:
+            # Only possible for a lone or last chunk (others merge before they run empty)
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if self.tail is node:
+                self.tail = prev
+            return
+
+        half = self.chunk_size // 2
+        successor = node.next
+        if len(node.items) < half and successor is not None:
+            if len(node.items) + len(successor.items) <= self.chunk_size:
+                node.items.extend(successor.items)
+                node.next = successor.next
+                if self.tail is successor:
+                    self.tail = node
+            else:
+                # Borrow from the successor, which stays at least half full
+                needed = half - len(node.items)
+                node.items.extend(successor.items[:needed])
+                del successor.items[:needed]
+
+    def remove_at(self, index: int) -> None:
+        """Remove the element at a given index. O(n/B + B) time, O(1) space."""
+        if index < 0 or index >= self.length:
+            raise IndexError("Invalid index")
+
+        prev, node, offset = self._locate(index)
+        self._remove_from(prev, node, offset)
+
+    def remove_by_value(self, data: Any) -> None:
+        """Remove first element with the given value. O(n) time, O(1) space."""
+        prev = None
+        itr = self.head
+        while itr:
+            try:
+                offset = itr.items.index(data)
+            except ValueError:
+                prev = itr
+                itr = itr.next
+                continue
+            self._remove_from(prev, itr, offset)
+            return
+
+        raise ValueError(f"Value {data} not found in the list")
+
+    def get_length(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        return self.length
+
+    def node_count(self) -> int:
+        """Return the number of chunk nodes. O(n/B) time, O(1) space."""
+        count = 0
+        itr = self.head
+        while itr:
+            count += 1
+            itr = itr.next
+        return count
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the elements chunk by chunk. O(n) time, O(1) space."""
+        itr = self.head
+        while itr:
+            yield from itr.items
+            itr = itr.next
+
+    def print(self) -> None:
+        """Print all elements as a string. O(n) time, O(n) space."""
+        if self.head is None:
+            print("Linked list is empty")
+            return
+
+        print("-->".join(str(data) for data in self))
+
+
+if __name__ == "__main__":
+    ll = UnrolledLinkedList(chunk_size=4)
+
+    # Test empty list
+    assert ll.is_empty(), "New list should be empty"
+    assert ll.get_length() == 0, "New list should have length 0"
+
+    # Test insert_at_beginning
+    ll.insert_at_beginning(1)
+    assert ll.get_length() == 1, "Length should be 1"
+    assert ll.find(1) == 0, "Should find 1 at index 0"
+
+    # Test insert_at_end
+    ll.insert_at_end(3)
+    assert ll.get_length() == 2, "Length should be 2"
+    assert ll.find(3) == 1, "Should find 3 at index 1"
+
+    # Test insert_at
+    ll.insert_at(1, 2)
+    assert ll.get_length() == 3, "Length should be 3"
+    assert ll.find(2) == 1, "Should find 2 at index 1"
+
+    # Test insert_after_value
+    ll.insert_after_value(2, 2.5)
+    assert ll.find(2.5) == 2, "Should find 2.5 at index 2"
+
+    # Test splitting a full chunk
+    ll.insert_at(1, 1.5)
+    assert list(ll) == [1, 1.5, 2, 2.5, 3], "Should keep the order across a split"
+    assert ll.node_count() == 2, "Overflowing chunk should split in two"
+    assert ll.get_at(4) == 3 and ll.tail.items[-1] == 3, "Tail should follow the split"
+
+    # Test replace_with_list
+    ll.replace_with_list([10, 20, 30])
+    assert ll.get_length() == 3, "Length should be 3 after replace_with_list"
+    assert ll.find(20) == 1, "Should find 20 at index 1"
+
+    # Test remove_at
+    ll.remove_at(1)
+    assert ll.find(20) == -1, "20 should be removed"
+    assert ll.get_length() == 2, "Length should be 2"
+
+    # Test remove_by_value
+    ll.insert_at_end(40)
+    ll.remove_by_value(30)
+    assert ll.find(30) == -1, "30 should be removed"
+    assert list(ll) == [10, 40], "Remaining elements should keep their order"
+
+    # Test error handling
+    try:
+        ll.insert_at(100, 999)
+        assert False, "Should raise IndexError for invalid index"
+    except IndexError:
+        pass
+
+    try:
+        ll.remove_at(-1)
+        assert False, "Should raise IndexError for negative index"
+    except IndexError:
+        pass
+
+    try:
+        ll.remove_by_value(999)
+        assert False, "Should raise ValueError for non-existent value"
+    except ValueError:
+        pass
+
+    try:
+        ll.get_at(2)
+        assert False, "Should raise IndexError for index past the end"
+    except IndexError:
+        pass
+
+    try:
+        UnrolledLinkedList(chunk_size=1)
+        assert False, "Should raise ValueError for chunks of one element"
+    except ValueError:
+        pass
+
+    # Test merge and borrow keep chunks at least half full
+    def check_chunks(lst: UnrolledLinkedList) -> None:
+        nodes = []
+        itr = lst.head
+        while itr:
+            nodes.append(itr)
+            itr = itr.next
+        assert sum(len(node.items) for node in nodes) == lst.length, "Chunks should hold all elements"
+        assert all(0 < len(node.items) <= lst.chunk_size for node in nodes), "Chunks should be non-empty"
+        assert all(len(node.items) >= lst.chunk_size // 2 for node in nodes[:-1]), "Chunks should be half full"
+        assert lst.tail is (nodes[-1] if nodes else None), "Tail should be the last chunk"
+
+    chunked = UnrolledLinkedList(chunk_size=8)
+    reference = []
+    for i in range(500):
+        # Mix of inserts at the front, middle and end
+        index = (i * 7) % (len(reference) + 1)
+        chunked.insert_at(index, i)
+        reference.insert(index, i)
+    check_chunks(chunked)
+    for i in range(400):
+        index = (i * 13) % len(reference)
+        chunked.remove_at(index)
+        del reference[index]
+        if i % 50 == 0:
+            check_chunks(chunked)
+    for value in reference[::3]:
+        chunked.remove_by_value(value)
+        reference.remove(value)
+    check_chunks(chunked)
+    assert list(chunked) == reference, "Should match a Python list after mixed operations"
+    assert all(chunked.get_at(i) == value for i, value in enumerate(reference)), "get_at() should index chunks"
+    while chunked.length:
+        chunked.remove_at(0)
+    assert chunked.is_empty() and chunked.tail is None, "Removing everything should empty the list"
+
+    # Test far fewer node objects than one per element
+    big = UnrolledLinkedList()
+    for i in range(10000):
+        big.insert_at_end(i)
+    assert big.node_count() == 157, "Sequential appends should fill 64-element chunks"
+    big.insert_at(5000, "x")
+    assert big.get_at(5000) == "x" and big.find("x") == 5000, "Should index across many chunks"
+    assert big.node_count() <= 2 * big.length // big.chunk_size + 1, "Should use O(n/B) nodes"
+
+    print("All tests passed!")
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Iterator
+
+# A skip list is a linked list with extra "express lanes": every node is on level 0 (the plain
+# list), about half of them are also on level 1, a quarter on level 2, and so on (each node's
+# height is drawn at random). A search starts on the highest level and drops down a level
+# whenever the next step would go too far, so it passes O(log n) nodes in expectation instead
+# of the O(n) nodes of DoublyLinkedList._get_node_at (02b).
+#
+# Indexable skip list: every forward pointer also stores its span, the number of positions it
+# skips. Summing spans while searching gives each node's position, so get_at, insert_at and
+# remove_at find their place by index in O(log n) expected time, and updating the spans on
+# insert and remove costs only O(log n) as well (the "rank" technique of Redis sorted sets).
+# Positions are counted with the head sentinel at 0, so the element at index i sits at i + 1.
+#
+# SortedSkipList keeps the elements in sorted order instead: add() searches by value rather than
+# by index, which makes value lookups, ordered inserts and range iteration O(log n) expected
+# (plus O(k) for the k elements a range yields), while indexing stays O(log n) as well.
+
+
+class Node:
+    __slots__ = ("data", "next", "span")
+
+    def __init__(self, data: Any = None, level: int = 1) -> None:
+        self.data = data
+        # Forward pointer and span per level; a span to None counts the remaining elements
+        self.next = [None] * level
+        self.span = [0] * level
+
+
+class IndexableSkipList:
+    MAX_LEVEL = 32
+
+    def __init__(self, p: float = 0.5, seed: int | None = None) -> None:
+        if not 0 < p < 1:
+            raise ValueError("p must be in (0, 1)")
+        self.p = p
+        self.rng = random.Random(seed)
+        self.head = Node(None, self.MAX_LEVEL)
+        self.level = 1
+        self.length = 0
+
+    def _random_level(self) -> int:
+        """Draw a node height from a geometric distribution. O(1) expected, O(MAX_LEVEL) worst time, O(1) space."""
+        level = 1
+        while level < self.MAX_LEVEL and self.rng.random() < self.p:
+            level += 1
+        return level
+
+    def _node_at(self, index: int) -> Node:
+        """Return the node at an index by summing spans from the top level. O(log n) expected time, O(1) space."""
+        target = index + 1
+        itr = self.head
+        pos = 0
+        for lvl in reversed(range(self.level)):
+            while itr.next[lvl] is not None and pos + itr.span[lvl] <= target:
+                pos += itr.span[lvl]
+                itr = itr.next[lvl]
+            if pos == target:
+                return itr
+        return itr
+
+    def _insert(self, index: int, data: Any) -> None:
+        """Link a new node in at an index and update the spans. O(log n) expected time, O(log n) space."""
+        update = [self.head] * self.MAX_LEVEL
+        rank = [0] * self.MAX_LEVEL
+        itr = self.head
+        pos = 0
+        # Find the last node before the new position on every level
+        for lvl in reversed(range(self.level)):
+            while itr.next[lvl] is not None and pos + itr.span[lvl] <= index:
+                pos += itr.span[lvl]
+                itr = itr.next[lvl]
+            update[lvl] = itr
+            rank[lvl] = pos
+
+        level = self._random_level()
+        if level > self.level:
+            for lvl in range(self.level, level):
+                # The head's new lanes skip over all existing elements
+                self.head.span[lvl] = self.length
+            self.level = level
+
+        node = Node(data, level)
+        for lvl in range(level):
+            prev = update[lvl]
+            node.next[lvl] = prev.next[lvl]
+            prev.next[lvl] = node
+            # prev's old span is split between prev -> node and node -> its successor
+            node.span[lvl] = prev.span[lvl] - (index - rank[lvl])
+            prev.span[lvl] = index - rank[lvl] + 1
+        # Higher lanes now jump over one more element
+        for lvl in range(level, self.level):
+            update[lvl].span[lvl] += 1
+        self.length += 1
+
+    def _remove(self, index: int) -> Any:
+        """Unlink the node at an index and return its data. O(log n) expected time, O(log n) space."""
+        update = [self.head] * self.MAX_LEVEL
+        itr = self.head
+        pos = 0
+        for lvl in reversed(range(self.level)):
+            while itr.next[lvl] is not None and pos + itr.span[lvl] <= index:
+                pos += itr.span[lvl]
+                itr = itr.next[lvl]
+            update[lvl] = itr
+
+        node = update[0].next[0]
+        for lvl in range(self.level):
+            prev = update[lvl]
+            if prev.next[lvl] is node:
+                prev.span[lvl] += node.span[lvl] - 1
+                prev.next[lvl] = node.next[lvl]
+            else:
+                prev.span[lvl] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.head.span[self.level - 1] = 0
+            self.level -= 1
+        self.length -= 1
+        return node.data
+
+    def find(self, data: Any) -> int:
+        """Return index of first occurrence, or -1 if not found. O(n) time, O(1) space."""
+        itr = self.head.next[0]
+
+        index = 0
+        while itr:
+            if itr.data == data:
+                return index
+
+            itr = itr.next[0]
+            index += 1
+
+        return -1
+
+    def get_at(self, index: int) -> Any:
+        """Return the element at a given index. O(log n) expected time, O(1) space."""
+        if index < 0 or index >= self.length:
+            raise IndexError("Invalid index")
+        return self._node_at(index).data
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty. O(1) time, O(1) space."""
+        return self.length == 0
+
+    def insert_at_beginning(self, data: Any) -> None:
+        """Insert an element at the head. O(log n) expected time, O(1) space."""
+        self.insert_at(0, data)
+
+    def insert_at_end(self, data: Any) -> None:
+        """Insert an element at the tail. O(log n) expected time, O(1) space."""
+        self.insert_at(self.length, data)
+
+    def insert_at(self, index: int, data: Any) -> None:
+        """Insert an element at a given index. O(log n) expected time, O(1) space."""
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+        self._insert(index, data)
+
+    def insert_after_value(self, data_after: Any, data_to_insert: Any) -> None:
+        """Insert an element after the first occurrence of a value. O(n) time, O(1) space."""
+        index = self.find(data_after)
+        if index == -1:
+            raise ValueError(f"Value {data_after} not found in the list")
+        self.insert_at(index + 1, data_to_insert)
+
+    def remove_at(self, index: int) -> None:
+        """Remove the element at a given index. O(log n) expected time, O(1) space."""
+        if index < 0 or index >= self.length:
+            raise IndexError("Invalid index")
+        self._remove(index)
+
+    def remove_by_value(self, data: Any) -> None:
+        """Remove first element with the given value. O(n) time, O(1) space."""
+        index = self.find(data)
+        if index == -1:
+            raise ValueError(f"Value {data} not found in the list")
+        self._remove(index)
+
+    def get_length(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        return self.length
+
+    def __len__(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        return self.length
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the elements along level 0. O(n) time, O(1) space."""
+        itr = self.head.next[0]
+        while itr:
+            yield itr.data
+            itr = itr.next[0]
+
+    def print(self) -> None:
+        """Print all elements as a string. O(n) time, O(n) space."""
+        if self.length == 0:
+            print("Skip list is empty")
+            return
+
+        print("-->".join(str(data) for data in self))
+
+
+class SortedSkipList(IndexableSkipList):
+    def bisect_left(self, value: Any) -> int:
+        """Return the index of the first element >= value. O(log n) expected time, O(1) space."""
+        itr = self.head
+        pos = 0
+        for lvl in reversed(range(self.level)):
+            while itr.next[lvl] is not None and itr.next[lvl].data < value:
+                pos += itr.span[lvl]
+                itr = itr.next[lvl]
+        return pos
+
+    def bisect_right(self, value: Any) -> int:
+        """Return the index after the last element <= value. O(log n) expected time, O(1) space."""
+        itr = self.head
+        pos = 0
+        for lvl in reversed(range(self.level)):
+            while itr.next[lvl] is not None and not value < itr.next[lvl].data:
+                pos += itr.span[lvl]
+                itr = itr.next[lvl]
+        return pos
+
+    def add(self, value: Any) -> None:
+        """Insert a value at its sorted position (after equal values). O(log n) expected time, O(1) space."""
+        self._insert(self.bisect_right(value), value)
+
+    def find(self, value: Any) -> int:
+        """Return index of first occurrence, or -1 if not found. O(log n) expected time, O(1) space."""
+        index = self.bisect_left(value)
+        if index < self.length and self._node_at(index).data == value:
+            return index
+        return -1
+
+    def __contains__(self, value: Any) -> bool:
+        """Check whether a value is present. O(log n) expected time, O(1) space."""
+        return self.find(value) != -1
+
+    def remove_by_value(self, value: Any) -> None:
+        """Remove first element with the given value. O(log n) expected time, O(1) space."""
+        index = self.find(value)
+        if index == -1:
+            raise ValueError(f"Value {value} not found in the list")
+        self._remove(index)
+
+    def range(self, low: Any, high: Any) -> Iterator[Any]:
+        """Yield the elements in [low, high) in order. O(log n + k) expected time, O(1) space."""
+        start = self.bisect_left(low)
+        if start == self.length:
+            return
+        itr = self._node_at(start)
+        while itr is not None and itr.data < high:
+            yield itr.data
+            itr = itr.next[0]
+
+    def insert_at(self, index: int, data: Any) -> None:
+        """Reject positional inserts, which could break the order; use add(). O(1) time, O(1) space."""
+        raise TypeError("SortedSkipList keeps its elements sorted; use add()")
+
+    def insert_after_value(self, data_after: Any, data_to_insert: Any) -> None:
+        """Reject positional inserts, which could break the order; use add(). O(1) time, O(1) space."""
+        raise TypeError("SortedSkipList keeps its elements sorted; use add()")
+
+
+if __name__ == "__main__":
+    ll = IndexableSkipList(seed=1)
+
+    # Test empty list
+    assert ll.is_empty(), "New list should be empty"
+    assert ll.get_length() == 0, "New list should have length 0"
+
+    # Test insert_at_beginning
+    ll.insert_at_beginning(1)
+    assert ll.get_length() == 1, "Length should be 1"
+    assert ll.find(1) == 0, "Should find 1 at index 0"
+
+    # Test insert_at_end
+    ll.insert_at_end(3)
+    assert ll.get_length() == 2, "Length should be 2"
+    assert ll.find(3) == 1, "Should find 3 at index 1"
+
+    # Test insert_at
+    ll.insert_at(1, 2)
+    assert ll.get_length() == 3, "Length should be 3"
+    assert ll.find(2) == 1, "Should find 2 at index 1"
+
+    # Test insert_after_value
+    ll.insert_after_value(2, 2.5)
+    assert ll.find(2.5) == 2, "Should find 2.5 at index 2"
+    assert [ll.get_at(i) for i in range(4)] == [1, 2, 2.5, 3], "get_at() should index every element"
+
+    # Test remove_at and remove_by_value
+    ll.remove_at(1)
+    assert ll.find(2) == -1, "2 should be removed"
+    ll.remove_by_value(3)
+    assert list(ll) == [1, 2.5], "Remaining elements should keep their order"
+
+    # Test error handling
+    for bad_call in (lambda: ll.insert_at(100, 999), lambda: ll.remove_at(-1), lambda: ll.get_at(2)):
+        try:
+            bad_call()
+            assert False, "Should raise IndexError for invalid index"
+        except IndexError:
+            pass
+
+    try:
+        ll.remove_by_value(999)
+        assert False, "Should raise ValueError for non-existent value"
+    except ValueError:
+        pass
+
+    try:
+        IndexableSkipList(p=1.0)
+        assert False, "Should raise ValueError for p outside (0, 1)"
+    except ValueError:
+        pass
+
+    # Verify the spans: on every level they must add up to the true distance between nodes
+    def check_spans(lst: IndexableSkipList) -> None:
+        positions = {id(lst.head): 0}
+        itr = lst.head.next[0]
+        pos = 1
+        while itr:
+            positions[id(itr)] = pos
+            itr = itr.next[0]
+            pos += 1
+        for lvl in range(lst.level):
+            itr = lst.head
+            while itr is not None:
+                nxt = itr.next[lvl]
+                expected = (positions[id(nxt)] if nxt is not None else lst.length) - positions[id(itr)]
+                assert itr.span[lvl] == expected, "Span should match the distance to the next node"
+                itr = nxt
+
+    # Test positional operations against a Python list
+    rng = random.Random(7)
+    indexed = IndexableSkipList(seed=3)
+    reference = []
+    for i in range(3000):
+        if reference and rng.random() < 0.3:
+            index = rng.randrange(len(reference))
+            indexed.remove_at(index)
+            del reference[index]
+        else:
+            index = rng.randrange(len(reference) + 1)
+            indexed.insert_at(index, i)
+            reference.insert(index, i)
+    check_spans(indexed)
+    assert list(indexed) == reference, "Should match a Python list after mixed operations"
+    assert all(indexed.get_at(i) == value for i, value in enumerate(reference)), "get_at() should use spans"
+    assert indexed.level <= 2 * len(reference).bit_length() + 2, "Height should stay logarithmic"
+    while indexed.length:
+        indexed.remove_at(indexed.length // 2)
+    assert indexed.is_empty() and indexed.level == 1, "Removing everything should shrink the levels"
+
+    # Test sorted mode: ordered inserts, value search and range iteration
+    events = SortedSkipList(seed=5)
+    values = [rng.randrange(1000) for _ in range(2000)]
+    for value in values:
+        events.add(value)
+    check_spans(events)
+    expected = sorted(values)
+    assert list(events) == expected, "Elements should stay sorted"
+    assert all(events.get_at(i) == expected[i] for i in range(0, 2000, 37)), "Indexing should work in sorted mode"
+    for probe in (0, 17, 500, 999, 1000, -5):
+        first = expected.index(probe) if probe in expected else -1
+        assert events.find(probe) == first, "find() should return the first occurrence"
+        assert (probe in events) == (probe in expected), "Membership should use value search"
+    assert list(events.range(100, 200)) == [v for v in expected if 100 <= v < 200], "range() should be half-open"
+    assert list(events.range(5000, 6000)) == [], "Empty range should yield nothing"
+    assert events.bisect_right(expected[0]) == expected.count(expected[0]), "bisect_right() should skip equals"
+
+    for value in values[:1000]:
+        events.remove_by_value(value)
+        expected.remove(value)
+    check_spans(events)
+    assert list(events) == expected, "Removing by value should keep the order"
+
+    try:
+        events.insert_at(0, 10**6)
+        assert False, "Should raise TypeError for a positional insert in sorted mode"
+    except TypeError:
+        pass
+
+    print("All tests passed!")
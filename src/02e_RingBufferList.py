@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Iterator
+
+# A ring buffer (circular array) stores the elements in one Python list and remembers where the
+# first element starts. Index i lives in slot (start + i) mod capacity, so the sequence may wrap
+# around the end of the array. Compared to DoublyLinkedList (02b) this gives:
+# * O(1) access by index instead of a walk from the nearest end
+# * O(1) amortized inserts and removes at both ends: moving start left or right needs no shifting
+# * one 8-byte pointer per element (plus free slots) instead of a 56-byte slotted node object
+# Inserting or removing in the middle shifts the elements of the shorter side by one slot, which
+# is O(min(i, n - i)) like the linked list's walk to the position. The shift copies at most two
+# slices of the array (split where it wraps around), so it runs in C rather than element by
+# element. The capacity is a power of two (so "mod capacity" is a bit mask), doubles when full
+# and halves when a quarter full, so the free slots stay within 4x the elements.
+#
+# benchmark() times both lists on end operations, indexing and middle inserts for growing sizes
+# and reports the memory per element. Run "python 02e_RingBufferList.py --benchmark" to print it.
+
+
+class RingBufferList:
+    MIN_CAPACITY = 8
+
+    def __init__(self, capacity: int = MIN_CAPACITY) -> None:
+        self.MAX = self._round_capacity(capacity)
+        self.arr = [None] * self.MAX
+        self.start = 0
+        self.length = 0
+
+    def _round_capacity(self, capacity: int) -> int:
+        """Round a capacity up to a power of two, at least MIN_CAPACITY. O(1) time, O(1) space."""
+        return max(self.MIN_CAPACITY, 1 << (capacity - 1).bit_length())
+
+    def _slot(self, index: int) -> int:
+        """Map a list index to its slot in the circular array. O(1) time, O(1) space."""
+        return (self.start + index) & (self.MAX - 1)
+
+    def _resize(self, capacity: int) -> None:
+        """Copy the elements in order into a new array starting at slot 0. O(n) time, O(n) space."""
+        end = self.start + self.length
+        if end <= self.MAX:
+            items = self.arr[self.start : end]
+        else:
+            items = self.arr[self.start :] + self.arr[: end - self.MAX]
+        self.arr = items + [None] * (capacity - self.length)
+        self.MAX = capacity
+        self.start = 0
+
+    def _grow_if_full(self) -> None:
+        """Double the capacity before an insert into a full array. O(1) amortized time."""
+        if self.length == self.MAX:
+            self._resize(self.MAX * 2)
+
+    def _shrink_if_sparse(self) -> None:
+        """Halve the capacity once at most a quarter of it is used. O(1) amortized time."""
+        if self.MAX > self.MIN_CAPACITY and self.length * 4 <= self.MAX:
+            self._resize(self.MAX // 2)
+
+    def find(self, data: Any) -> int:
+        """Return index of first occurrence, or -1 if not found. O(n) time, O(1) space."""
+        for index, item in enumerate(self):
+            if item == data:
+                return index
+        return -1
+
+    def get_at(self, index: int) -> Any:
+        """Return the element at a given index. O(1) time, O(1) space."""
+        if index < 0 or index >= self.length:
+            raise IndexError("Invalid index")
+        return self.arr[self._slot(index)]
+
+    def set_at(self, index: int, data: Any) -> None:
+        """Replace the element at a given index. O(1) time, O(1) space."""
+        if index < 0 or index >= self.length:
+            raise IndexError("Invalid index")
+        self.arr[self._slot(index)] = data
+
+    def is_empty(self) -> bool:
+        """Check if the list is empty. O(1) time, O(1) space."""
+        return self.length == 0
+
+    def insert_at_beginning(self, data: Any) -> None:
+        """Insert an element at the front by moving start one slot left. O(1) amortized time, O(1) space."""
+        self._grow_if_full()
+        self.start = (self.start - 1) & (self.MAX - 1)
+        self.arr[self.start] = data
+        self.length += 1
+
+    def insert_at_end(self, data: Any) -> None:
+        """Insert an element at the back. O(1) amortized time, O(1) space."""
+        self._grow_if_full()
+        self.arr[self._slot(self.length)] = data
+        self.length += 1
+
+    def _read_range(self, lo: int, hi: int) -> list[Any]:
+        """Copy the elements at indices [lo, hi) with at most two slices. O(hi - lo) time, O(hi - lo) space."""
+        first = self._slot(lo)
+        end = first + hi - lo
+        if end <= self.MAX:
+            return self.arr[first:end]
+        return self.arr[first:] + self.arr[: end - self.MAX]
+
+    def _write_range(self, lo: int, items: list[Any]) -> None:
+        """Overwrite the elements from index lo on with at most two slices. O(k) time, O(k) space."""
+        first = self._slot(lo)
+        split = min(len(items), self.MAX - first)
+        self.arr[first : first + split] = items[:split]
+        self.arr[: len(items) - split] = items[split:]
+
+    def insert_at(self, index: int, data: Any) -> None:
+        """Insert an element at an index, shifting the shorter side. O(min(i, n - i)) time and space."""
+        if index < 0 or index > self.length:
+            raise IndexError("Invalid index")
+
+        self._grow_if_full()
+        if index < self.length // 2:
+            # Shift the front part one slot left into the free slot before start
+            self.start = (self.start - 1) & (self.MAX - 1)
+            if index:
+                self._write_range(0, self._read_range(1, index + 1))
+        else:
+            # Shift the back part one slot right into the free slot after the end
+            if index < self.length:
+                self._write_range(index + 1, self._read_range(index, self.length))
+        self.arr[self._slot(index)] = data
+        self.length += 1
+
+    def insert_after_value(self, data_after: Any, data_to_insert: Any) -> None:
+        """Insert an element after the first occurrence of a value. O(n) time, O(1) space."""
+        index = self.find(data_after)
+        if index == -1:
+            raise ValueError(f"Value {data_after} not found in the list")
+        self.insert_at(index + 1, data_to_insert)
+
+    def replace_with_list(self, data_list: list[Any]) -> None:
+        """Replace the list with elements from data_list. O(m) time, O(m) space."""
+        self.MAX = self._round_capacity(len(data_list))
+        self.arr = list(data_list) + [None] * (self.MAX - len(data_list))
+        self.start = 0
+        self.length = len(data_list)
+
+    def remove_at(self, index: int) -> None:
+        """Remove the element at an index, shifting the shorter side. O(min(i, n - i)) time and space."""
+        if index < 0 or index >= self.length:
+            raise IndexError("Invalid index")
+
+        if index < self.length // 2:
+            if index:
+                self._write_range(1, self._read_range(0, index))
+            # Clear the freed slot so the removed element can be garbage-collected
+            self.arr[self.start] = None
+            self.start = (self.start + 1) & (self.MAX - 1)
+        else:
+            if index < self.length - 1:
+                self._write_range(index, self._read_range(index + 1, self.length))
+            self.arr[self._slot(self.length - 1)] = None
+        self.length -= 1
+        self._shrink_if_sparse()
+
+    def remove_by_value(self, data: Any) -> None:
+        """Remove first element with the given value. O(n) time, O(1) space."""
+        index = self.find(data)
+        if index == -1:
+            raise ValueError(f"Value {data} not found in the list")
+        self.remove_at(index)
+
+    def get_length(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        return self.length
+
+    def __len__(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        return self.length
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the elements front to back. O(n) time, O(1) space."""
+        for i in range(self.length):
+            yield self.arr[self._slot(i)]
+
+    def print_forward(self) -> None:
+        """Print all elements front to back. O(n) time, O(n) space."""
+        if self.length == 0:
+            print("Ring buffer list is empty")
+            return
+
+        print("-->".join(str(data) for data in self))
+
+    def print_backward(self) -> None:
+        """Print all elements back to front. O(n) time, O(n) space."""
+        if self.length == 0:
+            print("Ring buffer list is empty")
+            return
+
+        print("-->".join(str(self.arr[self._slot(i)]) for i in reversed(range(self.length))))
+
+
+def load_doubly_linked_list() -> type:
+    """Load DoublyLinkedList from 02b (file names starting with digits cannot be imported). O(1) time."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "02b_DoublyLinkedList.py")
+    spec = importlib.util.spec_from_file_location("doubly_linked_list", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.DoublyLinkedList
+
+
+def benchmark(sizes: tuple[int, ...] = (10, 100, 1000, 10000, 100000), ops: int = 2000) -> dict[str, Any]:
+    """Time both lists per operation for each size and measure bytes per element. O(sizes * ops * n) time."""
+    DoublyLinkedList = load_doubly_linked_list()
+
+    def build(list_class: type, n: int) -> Any:
+        lst = list_class()
+        lst.replace_with_list(list(range(n)))
+        return lst
+
+    def end_ops(lst: Any, n: int) -> None:
+        # Queue-like traffic: push at the back, pop at the front
+        for i in range(ops):
+            lst.insert_at_end(i)
+            lst.remove_at(0)
+
+    def indexing(lst: Any, n: int) -> None:
+        get = lst.get_at if isinstance(lst, RingBufferList) else lambda i: lst._get_node_at(i).data
+        for i in range(ops):
+            get((i * 7919) % n)
+
+    def middle_insert(lst: Any, n: int) -> None:
+        for i in range(ops // 10):
+            lst.insert_at(n // 2, i)
+            lst.remove_at(n // 2)
+
+    timings = []
+    for n in sizes:
+        for name, operation in (("end_ops", end_ops), ("indexing", indexing), ("middle_insert", middle_insert)):
+            row = {"size": n, "operation": name}
+            for label, list_class in (("ring", RingBufferList), ("linked", DoublyLinkedList)):
+                lst = build(list_class, n)
+                started = time.perf_counter()
+                operation(lst, n)
+                row[label] = time.perf_counter() - started
+            timings.append(row)
+
+    # Crossover: the smallest size from which the ring buffer is faster at every larger size too
+    crossover = {}
+    for row in timings:
+        if row["ring"] >= row["linked"]:
+            crossover[row["operation"]] = None
+        elif crossover.get(row["operation"]) is None:
+            crossover[row["operation"]] = row["size"]
+
+    def bytes_per_element(list_class: type) -> float:
+        n = sizes[-1]
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            lst = list_class()
+            for _ in range(n):
+                # The elements are all None, so only the structure itself is measured
+                lst.insert_at_end(None)
+            used = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        del lst
+        return used / n
+
+    memory = {"ring": bytes_per_element(RingBufferList), "linked": bytes_per_element(DoublyLinkedList)}
+    return {"timings": timings, "crossover": crossover, "memory": memory}
+
+
+def print_benchmark(results: dict[str, Any]) -> None:
+    """Print the benchmark results as a table. O(rows) time, O(1) space."""
+    print(f"{'size':>8} {'operation':<14} {'ring (s)':>10} {'linked (s)':>11}")
+    for row in results["timings"]:
+        print(f"{row['size']:>8} {row['operation']:<14} {row['ring']:>10.5f} {row['linked']:>11.5f}")
+    for name in ("end_ops", "indexing", "middle_insert"):
+        size = results["crossover"].get(name)
+        if size is None:
+            print(f"{name}: linked list faster at the largest size")
+        else:
+            print(f"{name}: ring buffer faster from size {size}")
+    memory = results["memory"]
+    print(f"bytes per element: ring {memory['ring']:.1f}, linked {memory['linked']:.1f}")
+
+
+if __name__ == "__main__":
+    ll = RingBufferList()
+
+    # Test empty list
+    assert ll.is_empty(), "New list should be empty"
+    assert ll.get_length() == 0, "New list should have length 0"
+
+    # Test insert_at_beginning
+    ll.insert_at_beginning(1)
+    assert ll.get_length() == 1, "Length should be 1"
+    assert ll.find(1) == 0, "Should find 1 at index 0"
+    assert ll.start == ll.MAX - 1, "Inserting at the front should wrap start around"
+
+    # Test insert_at_end
+    ll.insert_at_end(3)
+    assert ll.get_length() == 2, "Length should be 2"
+    assert ll.find(3) == 1, "Should find 3 at index 1"
+
+    # Test insert_at
+    ll.insert_at(1, 2)
+    assert ll.get_length() == 3, "Length should be 3"
+    assert ll.find(2) == 1, "Should find 2 at index 1"
+
+    # Test insert_after_value
+    ll.insert_after_value(2, 2.5)
+    assert ll.find(2.5) == 2, "Should find 2.5 at index 2"
+    assert list(ll) == [1, 2, 2.5, 3], "Elements should keep their order across the wrap"
+
+    # Test O(1) indexing
+    assert ll.get_at(3) == 3, "get_at() should return the element at the index"
+    ll.set_at(0, 0)
+    assert ll.get_at(0) == 0, "set_at() should replace the element"
+
+    # Test replace_with_list
+    ll.replace_with_list([10, 20, 30])
+    assert ll.get_length() == 3, "Length should be 3 after replace_with_list"
+    assert ll.find(20) == 1, "Should find 20 at index 1"
+
+    # Test remove_at
+    ll.remove_at(1)
+    assert ll.find(20) == -1, "20 should be removed"
+    assert ll.get_length() == 2, "Length should be 2"
+
+    # Test remove_by_value
+    ll.insert_at_end(40)
+    ll.remove_by_value(30)
+    assert ll.find(30) == -1, "30 should be removed"
+    assert list(ll) == [10, 40], "Remaining elements should keep their order"
+
+    # Test error handling
+    for bad_call in (lambda: ll.insert_at(100, 999), lambda: ll.remove_at(-1), lambda: ll.get_at(2)):
+        try:
+            bad_call()
+            assert False, "Should raise IndexError for invalid index"
+        except IndexError:
+            pass
+
+    try:
+        ll.remove_by_value(999)
+        assert False, "Should raise ValueError for non-existent value"
+    except ValueError:
+        pass
+
+    # Test mixed operations against a Python list, including wrap-around, growing and shrinking
+    ring = RingBufferList()
+    reference = []
+    for i in range(3000):
+        op = (i * 7) % 10
+        if reference and op < 3:
+            index = (i * 31) % len(reference)
+            ring.remove_at(index)
+            del reference[index]
+        elif op < 5:
+            ring.insert_at_beginning(i)
+            reference.insert(0, i)
+        elif op < 8:
+            ring.insert_at_end(i)
+            reference.append(i)
+        else:
+            index = (i * 13) % (len(reference) + 1)
+            ring.insert_at(index, i)
+            reference.insert(index, i)
+    assert list(ring) == reference, "Should match a Python list after mixed operations"
+    assert all(ring.get_at(i) == value for i, value in enumerate(reference)), "Indexing should follow the wrap"
+    assert ring.MAX & (ring.MAX - 1) == 0 and ring.MAX < 4 * len(reference) + 8, "Capacity should stay tight"
+    while ring.length:
+        ring.remove_at(ring.length - 1 if ring.length % 2 else 0)
+    assert ring.MAX == RingBufferList.MIN_CAPACITY, "Removing everything should shrink the capacity"
+    assert all(slot is None for slot in ring.arr), "Removed elements should not stay referenced"
+
+    # Test the benchmark on a tiny size (the full run is only done with --benchmark)
+    results = benchmark(sizes=(64,), ops=50)
+    assert len(results["timings"]) == 3, "Benchmark should time three operations per size"
+    assert results["memory"]["ring"] < results["memory"]["linked"], "Ring buffer should use less memory"
+
+    print("All tests passed!")
+
+    if "--benchmark" in sys.argv:
+        print_benchmark(benchmark())
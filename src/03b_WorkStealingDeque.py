@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+# Work stealing: instead of one shared queue that every worker takes tasks from, each worker
+# owns a deque of tasks. The owner treats its deque as a Stack (03): it pushes new subtasks
+# and pops them again at the same end (LIFO), so it keeps working on the most recently split,
+# smallest and cache-warm pieces. An idle worker becomes a thief and takes a task from the
+# other end of someone else's deque, like Queue.get (04). The oldest task in a deque is
+# usually the biggest unsplit piece of a divide-and-conquer job, so a single steal gives the
+# thief plenty of work, and owner and thief rarely touch the same end.
+#
+# NOTE: collections.deque's append(), pop() and popleft() are atomic in CPython, so the deque
+# needs no lock. It does not use the is_empty()-then-pop() pattern of Stack and Queue, though:
+# another thread could take the last element in between, so it pops and catches IndexError.
+#
+# The scheduler runs its workers as threads, because a task spawns subtasks into the deques
+# of the same scheduler, which processes could only share through shared memory. Pure-Python
+# tasks are still serialized by the GIL, so the speedup comes from tasks that release it
+# (I/O, NumPy, hashlib, ...); the load balancing itself works the same either way.
+# join() makes a waiting worker run other tasks until the awaited task is done, instead of
+# blocking. Otherwise recursive jobs would deadlock once every worker waits for a subtask.
+
+
+class WorkStealingDeque:
+    def __init__(self) -> None:
+        self.container = deque()
+
+    def push(self, val: Any) -> None:
+        """Push a task at the owner's end. O(1) time, O(1) space."""
+        self.container.append(val)
+
+    def pop(self) -> Any:
+        """Remove and return the newest task from the owner's end (LIFO). O(1) time, O(1) space."""
+        try:
+            return self.container.pop()
+        except IndexError:
+            raise IndexError("Deque is empty") from None
+
+    def steal(self) -> Any:
+        """Remove and return the oldest task from the thieves' end (FIFO). O(1) time, O(1) space."""
+        try:
+            return self.container.popleft()
+        except IndexError:
+            raise IndexError("Deque is empty") from None
+
+    def is_empty(self) -> bool:
+        """Check if the deque is empty (a snapshot under concurrency). O(1) time, O(1) space."""
+        return not self.container
+
+    def size(self) -> int:
+        """Return the number of tasks (a snapshot under concurrency). O(1) time, O(1) space."""
+        return len(self.container)
+
+
+class Task:
+    def __init__(self, fn: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        self.fn = fn
+        self.args = args
+        self.value = None
+        self.error = None
+        self.done = threading.Event()
+
+    def run(self) -> None:
+        """Run the function once and record its result or exception. O(1) time plus the function."""
+        try:
+            self.value = self.fn(*self.args)
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self.done.set()
+
+    def cancel(self, error: Exception) -> None:
+        """Finish the task with an error without running it. O(1) time, O(1) space."""
+        self.error = error
+        self.done.set()
+
+
+class WorkStealingScheduler:
+    def __init__(self, num_workers: int = 4, seed: int | None = None) -> None:
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.deques = [WorkStealingDeque() for _ in range(num_workers)]
+        # Per-worker counters, each written only by its own worker
+        self.executed = [0] * num_workers
+        self.stolen = [0] * num_workers
+        seeds = random.Random(seed)
+        self.rngs = [random.Random(seeds.random()) for _ in range(num_workers)]
+        self.round_robin = itertools.count()
+        self.local = threading.local()
+        self.running = True
+        self.threads = [
+            threading.Thread(target=self._worker_loop, args=(worker_id,), daemon=True)
+            for worker_id in range(num_workers)
+        ]
+        for thread in self.threads:
+            thread.start()
+
+    def _current_worker(self) -> int | None:
+        """Return the id of the calling worker thread, or None outside the workers. O(1) time, O(1) space."""
+        return getattr(self.local, "worker_id", None)
+
+    def _find_task(self, worker_id: int) -> Task | None:
+        """Pop an own task, else steal from the other deques in random order. O(w) time, O(1) space."""
+        try:
+            return self.deques[worker_id].pop()
+        except IndexError:
+            pass
+
+        # Starting at a random victim spreads the thieves over the deques
+        start = self.rngs[worker_id].randrange(len(self.deques))
+        for offset in range(len(self.deques)):
+            victim = (start + offset) % len(self.deques)
+            if victim == worker_id:
+                continue
+            try:
+                task = self.deques[victim].steal()
+            except IndexError:
+                continue
+            self.stolen[worker_id] += 1
+            return task
+        return None
+
+    def _run(self, worker_id: int, task: Task) -> None:
+        """Run a task on a worker and count it. O(1) time plus the task."""
+        task.run()
+        self.executed[worker_id] += 1
+
+    def _worker_loop(self, worker_id: int) -> None:
+        """Run own and stolen tasks until shutdown, backing off while idle. O(1) space."""
+        self.local.worker_id = worker_id
+        delay = 0.0
+        while self.running:
+            task = self._find_task(worker_id)
+            if task is None:
+                # Yield first, then sleep up to 1 ms, so that idle workers do not spin hot
+                time.sleep(delay)
+                delay = min(delay * 2 or 1e-6, 1e-3)
+                continue
+            delay = 0.0
+            self._run(worker_id, task)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Task:
+        """Schedule fn(*args): on the own deque inside a worker, else round-robin. O(1) time, O(1) space."""
+        if not self.running:
+            raise RuntimeError("Scheduler is shut down")
+        task = Task(fn, args)
+        worker_id = self._current_worker()
+        if worker_id is None:
+            worker_id = next(self.round_robin) % len(self.deques)
+        self.deques[worker_id].push(task)
+        if not self.running:
+            # shutdown() may have drained the deques between the check above and the push
+            self._cancel_pending()
+        return task
+
+    def join(self, task: Task, timeout: float | None = None) -> Any:
+        """Wait for a task and return its result; a waiting worker runs other tasks meanwhile. O(1) space."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        worker_id = self._current_worker()
+        delay = 0.0
+        while not task.done.is_set():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError("Timed out waiting for the task")
+            if worker_id is None:
+                task.done.wait(None if deadline is None else deadline - time.monotonic())
+                continue
+            other = self._find_task(worker_id)
+            if other is None:
+                # The task is running on another worker: wait for it with the same backoff as
+                # an idle worker, waking up early if it finishes
+                task.done.wait(delay)
+                delay = min(delay * 2 or 1e-6, 1e-3)
+            else:
+                delay = 0.0
+                self._run(worker_id, other)
+
+        if task.error is not None:
+            raise task.error
+        return task.value
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Submit fn(*args) and wait for its result. O(1) space plus the task."""
+        return self.join(self.submit(fn, *args))
+
+    def _cancel_pending(self) -> None:
+        """Fail every task left in the deques, so that join() raises instead of hanging. O(t) time, O(1) space."""
+        for work in self.deques:
+            while True:
+                try:
+                    task = work.steal()
+                except IndexError:
+                    break
+                task.cancel(RuntimeError("Scheduler was shut down before the task ran"))
+
+    def shutdown(self) -> None:
+        """Stop the workers after their current task, then fail the tasks never run. O(w + t) time, O(1) space."""
+        self.running = False
+        for thread in self.threads:
+            thread.join()
+        self._cancel_pending()
+
+    def __enter__(self) -> WorkStealingScheduler:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+
+if __name__ == "__main__":
+    work = WorkStealingDeque()
+
+    # Test empty deque
+    assert work.is_empty(), "New deque should be empty"
+    assert work.size() == 0, "New deque should have size 0"
+
+    # Test owner LIFO and thief FIFO ends
+    for task_id in range(1, 5):
+        work.push(task_id)
+    assert work.size() == 4, "Deque should have size 4"
+    assert work.pop() == 4, "Owner should pop the newest task"
+    assert work.steal() == 1, "Thief should steal the oldest task"
+    assert work.pop() == 3 and work.steal() == 2, "Both ends should keep their order"
+    assert work.is_empty(), "Deque should be empty after taking all tasks"
+
+    # Test error on empty pop/steal
+    for empty_call in (work.pop, work.steal):
+        try:
+            empty_call()
+            assert False, "Should raise IndexError on an empty deque"
+        except IndexError:
+            pass
+
+    # Test concurrent owner and thieves: every task is taken exactly once
+    shared = WorkStealingDeque()
+    taken = [[] for _ in range(4)]
+
+    def thief(index: int) -> None:
+        misses = 0
+        while misses < 1000:
+            try:
+                taken[index].append(shared.steal())
+                misses = 0
+            except IndexError:
+                misses += 1
+                time.sleep(0)
+
+    thieves = [threading.Thread(target=thief, args=(i,)) for i in range(1, 4)]
+    for thread in thieves:
+        thread.start()
+    for task_id in range(20000):
+        shared.push(task_id)
+        if task_id % 3 == 0:
+            try:
+                taken[0].append(shared.pop())
+            except IndexError:
+                pass
+    while not shared.is_empty():
+        try:
+            taken[0].append(shared.pop())
+        except IndexError:
+            pass
+    for thread in thieves:
+        thread.join()
+    assert sorted(itertools.chain(*taken)) == list(range(20000)), "Every task should be taken exactly once"
+
+    # Test the scheduler on a recursive divide-and-conquer job that starts as a single task
+    with WorkStealingScheduler(num_workers=4, seed=1) as scheduler:
+
+        def parallel_sum(lo: int, hi: int) -> int:
+            if hi - lo <= 64:
+                return sum(range(lo, hi))
+            mid = (lo + hi) // 2
+            left = scheduler.submit(parallel_sum, lo, mid)
+            right = parallel_sum(mid, hi)
+            return scheduler.join(left) + right
+
+        assert scheduler.run(parallel_sum, 0, 200000) == sum(range(200000)), "Should compute the sum"
+        assert sum(scheduler.stolen) > 0, "Idle workers should steal subtasks"
+        assert sum(1 for count in scheduler.executed if count) > 1, "Work should spread over several workers"
+
+        # A parallel merge sort: join() lets waiting workers help instead of deadlocking
+        def parallel_sort(items: list[int]) -> list[int]:
+            if len(items) <= 32:
+                return sorted(items)
+            mid = len(items) // 2
+            left_task = scheduler.submit(parallel_sort, items[:mid])
+            right = parallel_sort(items[mid:])
+            left = scheduler.join(left_task)
+            merged = []
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if left[i] <= right[j]:
+                    merged.append(left[i])
+                    i += 1
+                else:
+                    merged.append(right[j])
+                    j += 1
+            return merged + left[i:] + right[j:]
+
+        rng = random.Random(3)
+        data = [rng.randrange(10000) for _ in range(5000)]
+        assert scheduler.run(parallel_sort, data) == sorted(data), "Should sort in parallel"
+
+        # Tasks submitted from outside are spread round-robin; exceptions reach the caller
+        tasks = [scheduler.submit(pow, i, 2) for i in range(100)]
+        assert [scheduler.join(task) for task in tasks] == [i * i for i in range(100)], "Should run every task"
+        try:
+            scheduler.run(lambda: 1 // 0)
+            assert False, "Should re-raise the task's exception in join()"
+        except ZeroDivisionError:
+            pass
+
+        blocker = threading.Event()
+        slow = scheduler.submit(blocker.wait)
+        try:
+            scheduler.join(slow, timeout=0.01)
+            assert False, "Should raise TimeoutError when the task does not finish in time"
+        except TimeoutError:
+            pass
+        blocker.set()
+        assert scheduler.join(slow) is True, "Task should finish once unblocked"
+
+    try:
+        scheduler.submit(pow, 2, 2)
+        assert False, "Should raise RuntimeError after shutdown"
+    except RuntimeError:
+        pass
+
+    # Test tasks still queued at shutdown are failed, so that waiting for them does not hang
+    single = WorkStealingScheduler(num_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    busy = single.submit(lambda: started.set() or release.wait())
+    started.wait()
+    queued = single.submit(pow, 2, 2)
+    threading.Timer(0.05, release.set).start()
+    single.shutdown()
+    assert single.join(busy) is True, "The running task should finish"
+    try:
+        single.join(queued, timeout=1)
+        assert False, "Should raise RuntimeError for a task that never ran"
+    except RuntimeError:
+        pass
+
+    try:
+        WorkStealingScheduler(num_workers=0)
+        assert False, "Should raise ValueError for a scheduler without workers"
+    except ValueError:
+        pass
+
+    print("All tests passed!")
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import os
+import threading
+import time
 from collections import deque
-from typing import Any
+from typing import Any, Callable
 
 
 # # Option 1: Using a list
@@ -72,6 +77,277 @@ class Queue:
         return len(self.container)
 
 
+# Bounded, blocking queue for producer/consumer threads
+# A full queue makes put() wait until a consumer has made room (backpressure: a fast producer
+# is slowed down instead of filling the memory), and an empty queue makes get() wait until a
+# producer has added an element, so neither side has to poll in a loop. Both conditions share
+# one lock, so waiting releases the lock and waking up re-acquires it (like queue.Queue).
+# Non-blocking calls raise OverflowError (full) or IndexError (empty) right away, and blocking
+# calls that run out of time raise TimeoutError.
+class BoundedQueue:
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.container = deque()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def put(self, val: Any, block: bool = True, timeout: float | None = None) -> None:
+        """Add an element to the back, waiting while the queue is full. O(1) time, O(1) space."""
+        with self.lock:
+            if len(self.container) >= self.maxsize:
+                if not block:
+                    raise OverflowError("Queue is full")
+                if not self.not_full.wait_for(lambda: len(self.container) < self.maxsize, timeout):
+                    raise TimeoutError("Timed out waiting for room in the queue")
+            self.container.append(val)
+            self.not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """Remove and return the front element, waiting while the queue is empty. O(1) time, O(1) space."""
+        with self.lock:
+            if not self.container:
+                if not block:
+                    raise IndexError("Queue is empty")
+                if not self.not_empty.wait_for(lambda: len(self.container) > 0, timeout):
+                    raise TimeoutError("Timed out waiting for an element")
+            val = self.container.popleft()
+            self.not_full.notify()
+            return val
+
+    def get_many(self, n: int, timeout: float | None = None) -> list[Any]:
+        """Wait for a first element, then remove up to n available ones ([] on timeout). O(n) time, O(n) space."""
+        with self.lock:
+            if not self.not_empty.wait_for(lambda: len(self.container) > 0, timeout):
+                return []
+            batch = [self.container.popleft() for _ in range(min(n, len(self.container)))]
+            # Several producers may be waiting for the room that was just made
+            self.not_full.notify(len(batch))
+            return batch
+
+    def peek(self) -> Any:
+        """Return the front element without removing it. O(1) time, O(1) space."""
+        with self.lock:
+            if self.container:
+                return self.container[0]
+            raise IndexError("Queue is empty")
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty. O(1) time, O(1) space."""
+        with self.lock:
+            return not self.container
+
+    def is_full(self) -> bool:
+        """Check if the queue has reached maxsize. O(1) time, O(1) space."""
+        with self.lock:
+            return len(self.container) >= self.maxsize
+
+    def size(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        with self.lock:
+            return len(self.container)
+
+
+# Bounded queue for asyncio tasks
+# The same producer/consumer protocol for coroutines in one event loop: put() and get() are
+# awaitable and suspend only the waiting task, so the other tasks keep running. Each side keeps
+# a FIFO of futures of its waiting tasks, and every put or get wakes the longest-waiting task
+# of the other side (like asyncio.Queue). No lock is needed, since tasks only switch at an await.
+class AsyncQueue:
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.container = deque()
+        self.getters = deque()
+        self.putters = deque()
+
+    def _wake_next(self, waiters: deque[asyncio.Future]) -> None:
+        """Wake the longest-waiting task that has not given up. O(1) amortized time, O(1) space."""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters: deque[asyncio.Future], ready: Any, timeout: float | None) -> None:
+        """Suspend until ready() is true, or raise TimeoutError. O(1) time per wake-up, O(1) space."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not ready():
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, None if deadline is None else deadline - loop.time())
+            except BaseException as exc:
+                waiter.cancel()
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                # Pass the wake-up on if this task was woken but gives up (timeout or cancellation)
+                if ready():
+                    self._wake_next(waiters)
+                # Before Python 3.11, asyncio.TimeoutError is not the built-in TimeoutError
+                if isinstance(exc, asyncio.TimeoutError):
+                    raise TimeoutError("Timed out waiting for the queue") from None
+                raise
+
+    async def put(self, val: Any, timeout: float | None = None) -> None:
+        """Add an element to the back, suspending while the queue is full. O(1) time, O(1) space."""
+        await self._wait(self.putters, lambda: len(self.container) < self.maxsize, timeout)
+        self.put_nowait(val)
+
+    async def get(self, timeout: float | None = None) -> Any:
+        """Remove and return the front element, suspending while the queue is empty. O(1) time, O(1) space."""
+        await self._wait(self.getters, lambda: len(self.container) > 0, timeout)
+        return self.get_nowait()
+
+    async def get_many(self, n: int, timeout: float | None = None) -> list[Any]:
+        """Wait for a first element, then remove up to n available ones ([] on timeout). O(n) time, O(n) space."""
+        try:
+            await self._wait(self.getters, lambda: len(self.container) > 0, timeout)
+        except TimeoutError:
+            return []
+        batch = [self.container.popleft() for _ in range(min(n, len(self.container)))]
+        for _ in batch:
+            self._wake_next(self.putters)
+        return batch
+
+    def put_nowait(self, val: Any) -> None:
+        """Add an element to the back, or raise OverflowError if full. O(1) time, O(1) space."""
+        if len(self.container) >= self.maxsize:
+            raise OverflowError("Queue is full")
+        self.container.append(val)
+        self._wake_next(self.getters)
+
+    def get_nowait(self) -> Any:
+        """Remove and return the front element, or raise IndexError if empty. O(1) time, O(1) space."""
+        if not self.container:
+            raise IndexError("Queue is empty")
+        val = self.container.popleft()
+        self._wake_next(self.putters)
+        return val
+
+    def peek(self) -> Any:
+        """Return the front element without removing it. O(1) time, O(1) space."""
+        if self.container:
+            return self.container[0]
+        raise IndexError("Queue is empty")
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty. O(1) time, O(1) space."""
+        return not self.container
+
+    def is_full(self) -> bool:
+        """Check if the queue has reached maxsize. O(1) time, O(1) space."""
+        return len(self.container) >= self.maxsize
+
+    def size(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        return len(self.container)
+
+
+def load_min_heap() -> type:
+    """Load MinHeap from 05c (file names starting with digits cannot be imported). O(1) time."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "05c_MinHeap.py")
+    spec = importlib.util.spec_from_file_location("min_heap", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MinHeap
+
+
+# The priority and delay queues below keep their entries in the array heap of 05c. It is
+# created growable, so the queues are unbounded instead of raising OverflowError when full.
+MinHeap = load_min_heap()
+
+
+# Priority queue
+# get() returns the element with the smallest priority number first. Each entry is stored as
+# (priority, seq, val), where seq counts the puts: among equal priorities the earlier put has
+# the smaller seq and comes out first (stable FIFO order), and since seq is unique the elements
+# themselves are never compared, so they need not be orderable. Keeping the entries in a heap
+# makes put() and get() O(log n), instead of sorting a list on every put (O(n log n)).
+class PriorityQueue:
+    def __init__(self) -> None:
+        self.heap = MinHeap(16, growable=True)
+        self.seq = 0
+
+    def put(self, val: Any, priority: float = 0) -> None:
+        """Add an element with a priority (smaller comes out first). O(log n) amortized time, O(1) space."""
+        self.heap.add((priority, self.seq, val))
+        self.seq += 1
+
+    def get(self) -> Any:
+        """Remove and return the element with the smallest priority. O(log n) time, O(1) space."""
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        return self.heap.pop()[2]
+
+    def peek(self) -> Any:
+        """Return the element with the smallest priority without removing it. O(1) time, O(1) space."""
+        if self.is_empty():
+            raise IndexError("Queue is empty")
+        return self.heap.peek()[2]
+
+    def is_empty(self) -> bool:
+        """Check if the queue is empty. O(1) time, O(1) space."""
+        return self.heap.size() == 0
+
+    def size(self) -> int:
+        """Return the number of elements. O(1) time, O(1) space."""
+        return self.heap.size()
+
+
+# Delay queue
+# put(val, delay) makes an element visible only once its deadline (now + delay) has passed.
+# The entries are (deadline, seq, val) in a heap, so the element that becomes due first is
+# always at the root: get() and peek() only look at the root, and elements that are due at the
+# same time come out in put order. The clock is injectable (time.monotonic by default), so that
+# tests and simulations can advance time by hand.
+class DelayQueue:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self.clock = clock
+        self.heap = MinHeap(16, growable=True)
+        self.seq = 0
+
+    def put(self, val: Any, delay: float = 0.0) -> None:
+        """Add an element that becomes visible after delay seconds. O(log n) amortized time, O(1) space."""
+        self.heap.add((self.clock() + delay, self.seq, val))
+        self.seq += 1
+
+    def _check_due(self) -> None:
+        """Raise IndexError unless the earliest element is due. O(1) time, O(1) space."""
+        if self.heap.size() == 0:
+            raise IndexError("Queue is empty")
+        if self.heap.peek()[0] > self.clock():
+            raise IndexError("No element is due yet")
+
+    def get(self) -> Any:
+        """Remove and return the earliest element whose deadline has passed. O(log n) time, O(1) space."""
+        self._check_due()
+        return self.heap.pop()[2]
+
+    def peek(self) -> Any:
+        """Return the earliest due element without removing it. O(1) time, O(1) space."""
+        self._check_due()
+        return self.heap.peek()[2]
+
+    def next_delay(self) -> float | None:
+        """Return the seconds until the next element is due (0 if due), None if empty. O(1) time, O(1) space."""
+        if self.heap.size() == 0:
+            return None
+        return max(0.0, self.heap.peek()[0] - self.clock())
+
+    def is_empty(self) -> bool:
+        """Check if the queue holds no elements, due or not. O(1) time, O(1) space."""
+        return self.heap.size() == 0
+
+    def size(self) -> int:
+        """Return the number of elements, due or not. O(1) time, O(1) space."""
+        return self.heap.size()
+
+
 if __name__ == "__main__":
     queue = Queue()
 
@@ -106,4 +382,182 @@ if __name__ == "__main__":
     except IndexError:
         pass
 
+    # Test the bounded queue: non-blocking errors, timeouts and FIFO order
+    bounded = BoundedQueue(maxsize=2)
+    bounded.put(1)
+    bounded.put(2, block=False)
+    assert bounded.is_full() and bounded.peek() == 1, "Queue should be full with 1 in front"
+    try:
+        bounded.put(3, block=False)
+        assert False, "Should raise OverflowError on non-blocking put to a full queue"
+    except OverflowError:
+        pass
+
+    started = time.monotonic()
+    try:
+        bounded.put(3, timeout=0.05)
+        assert False, "Should raise TimeoutError when no room is made in time"
+    except TimeoutError:
+        pass
+    assert time.monotonic() - started >= 0.05, "put() should wait for the timeout"
+    assert bounded.get() == 1 and bounded.get(block=False) == 2, "Should keep FIFO order"
+    try:
+        bounded.get(block=False)
+        assert False, "Should raise IndexError on non-blocking get from an empty queue"
+    except IndexError:
+        pass
+    try:
+        bounded.get(timeout=0.01)
+        assert False, "Should raise TimeoutError when nothing arrives in time"
+    except TimeoutError:
+        pass
+
+    try:
+        BoundedQueue(maxsize=0)
+        assert False, "Should raise ValueError for a queue without room"
+    except ValueError:
+        pass
+
+    # Producers block on the full queue instead of spinning; every element arrives exactly once
+    pipeline = BoundedQueue(maxsize=4)
+    received = []
+
+    def produce(offset: int) -> None:
+        for i in range(200):
+            pipeline.put(offset + i)
+
+    def consume() -> None:
+        while len(received) < 400:
+            batch = pipeline.get_many(16, timeout=1)
+            assert len(batch) <= 16, "get_many() should return at most n elements"
+            received.extend(batch)
+
+    threads = [threading.Thread(target=produce, args=(offset,)) for offset in (0, 1000)]
+    threads.append(threading.Thread(target=consume))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(received) == list(range(200)) + list(range(1000, 1200)), "Every element should arrive once"
+    assert [v for v in received if v < 1000] == list(range(200)), "Each producer's order should be kept"
+    assert pipeline.get_many(8, timeout=0.01) == [], "get_many() should return [] on timeout"
+
+    # A blocked get() wakes up as soon as an element arrives
+    waiting = BoundedQueue(maxsize=1)
+    result = []
+    consumer = threading.Thread(target=lambda: result.append(waiting.get(timeout=5)))
+    consumer.start()
+    waiting.put("late")
+    consumer.join()
+    assert result == ["late"], "Blocked get() should receive the element"
+
+    # Test the asyncio queue
+    async def run_async_tests() -> None:
+        aqueue = AsyncQueue(maxsize=2)
+        await aqueue.put("a")
+        aqueue.put_nowait("b")
+        assert aqueue.is_full() and aqueue.peek() == "a", "Async queue should be full with a in front"
+        try:
+            aqueue.put_nowait("c")
+            assert False, "Should raise OverflowError on put_nowait to a full queue"
+        except OverflowError:
+            pass
+        try:
+            await aqueue.put("c", timeout=0.01)
+            assert False, "Should raise TimeoutError when no room is made in time"
+        except TimeoutError:
+            pass
+        assert await aqueue.get() == "a" and aqueue.get_nowait() == "b", "Should keep FIFO order"
+        try:
+            aqueue.get_nowait()
+            assert False, "Should raise IndexError on get_nowait from an empty queue"
+        except IndexError:
+            pass
+        try:
+            await aqueue.get(timeout=0.01)
+            assert False, "Should raise TimeoutError when nothing arrives in time"
+        except TimeoutError:
+            pass
+        assert not aqueue.getters and not aqueue.putters, "Timed-out waiters should be removed"
+
+        # Producers suspend on the full queue while the consumer drains it in batches
+        stage = AsyncQueue(maxsize=3)
+        drained = []
+
+        async def aproduce(offset: int) -> None:
+            for i in range(100):
+                await stage.put(offset + i)
+
+        async def aconsume() -> None:
+            while len(drained) < 200:
+                drained.extend(await stage.get_many(10, timeout=1))
+
+        await asyncio.gather(aproduce(0), aproduce(1000), aconsume())
+        assert sorted(drained) == list(range(100)) + list(range(1000, 1100)), "Every element should arrive once"
+        assert await stage.get_many(5, timeout=0.01) == [], "get_many() should return [] on timeout"
+
+        # A suspended get() is woken by put_nowait()
+        getter = asyncio.ensure_future(stage.get(timeout=5))
+        await asyncio.sleep(0)
+        stage.put_nowait("wake")
+        assert await getter == "wake", "put_nowait() should wake a waiting getter"
+
+    asyncio.run(run_async_tests())
+
+    # Test the priority queue: smallest priority first, FIFO among equal priorities
+    pq = PriorityQueue()
+    assert pq.is_empty() and pq.size() == 0, "New priority queue should be empty"
+    pq.put("low", priority=5)
+    pq.put("urgent", priority=-1)
+    pq.put("first normal", priority=1)
+    pq.put("second normal", priority=1)
+    pq.put({"unorderable": True}, priority=1)
+    assert pq.size() == 5 and pq.peek() == "urgent", "Peek should return the smallest priority"
+    expected = ["urgent", "first normal", "second normal", {"unorderable": True}, "low"]
+    assert [pq.get() for _ in range(5)] == expected, "Equal priorities should keep their put order"
+    for empty_call in (pq.get, pq.peek):
+        try:
+            empty_call()
+            assert False, "Should raise IndexError on an empty priority queue"
+        except IndexError:
+            pass
+
+    # Many jobs: the heap grows past its initial size and still returns them in order
+    jobs = PriorityQueue()
+    for i in range(1000):
+        jobs.put(i, priority=(i * 37) % 10)
+    drained = [jobs.get() for _ in range(1000)]
+    expected = sorted(range(1000), key=lambda i: ((i * 37) % 10, i))
+    assert drained == expected, "Should order by priority, then by put order"
+
+    # Test the delay queue with a hand-driven clock
+    now = [100.0]
+    dq = DelayQueue(clock=lambda: now[0])
+    dq.put("later", delay=5)
+    dq.put("sooner", delay=2)
+    dq.put("also sooner", delay=2)
+    assert dq.size() == 3 and dq.next_delay() == 2, "next_delay() should report the earliest deadline"
+    try:
+        dq.get()
+        assert False, "Should raise IndexError while no element is due"
+    except IndexError:
+        pass
+    now[0] = 102.0
+    assert dq.peek() == "sooner" and dq.next_delay() == 0, "Element should be visible at its deadline"
+    assert dq.get() == "sooner" and dq.get() == "also sooner", "Equal deadlines should keep their put order"
+    try:
+        dq.peek()
+        assert False, "Should raise IndexError while no element is due"
+    except IndexError:
+        pass
+    now[0] = 110.0
+    dq.put("now")
+    assert dq.get() == "later" and dq.get() == "now", "Overdue elements should come out by deadline"
+    assert dq.is_empty() and dq.next_delay() is None, "Delay queue should be empty"
+    try:
+        dq.get()
+        assert False, "Should raise IndexError on an empty delay queue"
+    except IndexError:
+        pass
+
     print("All tests passed!")
@@ -4,21 +4,27 @@ from typing import Any
 
 
 class MinHeap:
-    def __init__(self, heap_size: int) -> None:
+    def __init__(self, heap_size: int, growable: bool = False) -> None:
         # Create a complete binary tree using an array
         # Then, use the binary tree to construct a Heap
         self.heap_size = heap_size
+        # With growable=True a full array doubles instead of raising OverflowError
+        self.growable = growable
         self.minheap = [0] * (heap_size + 1)
         # real_size records the number of elements in the heap
         self.real_size = 0
 
     def add(self, element: Any) -> None:
-        """Insert an element and heapify up. O(log n) time, O(1) space."""
+        """Insert an element and heapify up. O(log n) (amortized if growable) time, O(1) space."""
         self.real_size += 1
 
         if self.real_size > self.heap_size:
-            self.real_size -= 1
-            raise OverflowError("Heap is full")
+            if not self.growable:
+                self.real_size -= 1
+                raise OverflowError("Heap is full")
+            # Doubling copies O(n) elements over n adds, so add stays O(log n) amortized
+            self.minheap.extend([0] * max(1, self.heap_size))
+            self.heap_size = len(self.minheap) - 1
 
         # Add the element into the array
         self.minheap[self.real_size] = element
@@ -36,7 +42,9 @@ class MinHeap:
         # If the newly added element is smaller than its parent node,
         # its value will be exchanged with that of the parent node
         # This is called "heapify up"
-        while self.minheap[index] < self.minheap[parent] and index > 1:
+        # The index is checked first: the root has no parent, and the unused slot 0 cannot be
+        # compared with elements that are not numbers (e.g. the tuples of a priority queue)
+        while index > 1 and self.minheap[index] < self.minheap[parent]:
             self.minheap[parent], self.minheap[index] = (
                 self.minheap[index],
                 self.minheap[parent],
@@ -60,7 +68,9 @@ class MinHeap:
         # Put the last element in the Heap to the top of Heap
         self.minheap[1] = self.minheap[self.real_size]
 
-        # Remove element implicitly by decreasing real_size
+        # Remove element by decreasing real_size, clearing the vacated slot so the
+        # removed element can be garbage-collected
+        self.minheap[self.real_size] = 0
         self.real_size -= 1
 
         # Heapify down
@@ -169,4 +179,17 @@ if __name__ == "__main__":
     except OverflowError:
         pass
 
+    # Test a growable heap doubles its array instead of overflowing
+    grow_heap = MinHeap(1, growable=True)
+    for val in (5, 3, 8, 1, 9, 2):
+        grow_heap.add(val)
+    assert grow_heap.size() == 6 and grow_heap.heap_size == 8, "Heap should double when full"
+    assert [grow_heap.pop() for _ in range(6)] == [1, 2, 3, 5, 8, 9], "Growing should keep the heap order"
+
+    # Test elements that are not numbers, like (priority, value) tuples
+    tuple_heap = MinHeap(3)
+    tuple_heap.add((2, "b"))
+    tuple_heap.add((1, "a"))
+    assert tuple_heap.pop() == (1, "a"), "Should order tuples"
+
     print("All tests passed!")